@@ -0,0 +1,65 @@
+import re
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+
+from .cases import make_cases
+from .runner import (
+    DEFAULT_MIN_ITERATIONS,
+    DEFAULT_MIN_TIME,
+    DEFAULT_THRESHOLD,
+    OPERATIONS,
+    compare,
+    dump_results,
+    load_results,
+    run,
+)
+
+parser = ArgumentParser(prog='python -m benchmarks', description='Measure sfn_messages throughput')
+parser.add_argument('-k', '--filter', default='', help='Only run cases whose name matches this regex')
+parser.add_argument('--operation', action='append', choices=sorted(OPERATIONS), help='Operations to measure')
+parser.add_argument('--min-time', type=float, default=DEFAULT_MIN_TIME, help='Seconds to measure each benchmark')
+parser.add_argument('--min-iterations', type=int, default=DEFAULT_MIN_ITERATIONS)
+parser.add_argument('-o', '--output', type=Path, help='Write results to this JSON file')
+parser.add_argument('--baseline', type=Path, help='Compare results against this JSON file')
+parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help='Allowed slowdown ratio')
+
+
+def main() -> None:
+    args = parser.parse_args()
+    pattern = re.compile(args.filter)
+    cases = [case for case in make_cases() if pattern.search(case.name)]
+    operations = args.operation or list(OPERATIONS)
+
+    out = sys.stdout
+    out.write(f'{"case":<20} {"operation":<11} {"ops/sec":>10} {"p50 us":>10} {"p90 us":>10} {"p99 us":>10}\n')
+    results = []
+    for case in cases:
+        for result in run([case], operations, min_time=args.min_time, min_iterations=args.min_iterations):
+            results.append(result)
+            out.write(
+                f'{result.case:<20} {result.operation:<11} {result.ops_per_sec:>10.0f} '
+                f'{result.p50_us:>10.1f} {result.p90_us:>10.1f} {result.p99_us:>10.1f}\n'
+            )
+            out.flush()
+
+    if args.output is not None:
+        dump_results(results, args.output)
+
+    if args.baseline is None:
+        return
+    if not args.baseline.exists():
+        out.write(f'Baseline {args.baseline} not found, skipping comparison\n')
+        return
+    regressions = compare(results, load_results(args.baseline), threshold=args.threshold)
+    for regression in regressions:
+        out.write(
+            f'REGRESSION {regression.case} {regression.operation}: {regression.ops_per_sec:.0f} ops/sec '
+            f'vs {regression.baseline_ops_per_sec:.0f} baseline ({regression.slowdown:.1%} slower)\n'
+        )
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+import json
+from copy import deepcopy
+from dataclasses import dataclass
+from itertools import cycle, islice
+from pathlib import Path
+from typing import Any
+
+from sfn_messages.core import load_message_class
+from sfn_messages.core.models import BaseMessage
+
+SMALL = 'small'
+LARGE = 'large'
+REPEATING = 'repeating'
+REPEATING_GROUP_SIZES = (10, 100)
+PAYLOADS_DIR = Path(__file__).parent / 'payloads'
+
+CASE_MESSAGES = (
+    ('STR0001', SMALL),
+    ('STR0008', LARGE),
+    ('STR0034', LARGE),
+    ('STR0014R1', REPEATING),
+    ('LDL0001', REPEATING),
+    ('LDL0006', REPEATING),
+    ('LTR0001', LARGE),
+    ('LPI0001', SMALL),
+    ('SLB0001', LARGE),
+    ('SME0001', SMALL),
+    ('SME0003R1', REPEATING),
+    ('GEN0001', SMALL),
+    ('GEN0021', REPEATING),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkCase:
+    name: str
+    family: str
+    size: str
+    message_class: type[BaseMessage]
+    params: dict[str, Any]
+    xml: str
+
+
+def load_params(message_code: str, /) -> dict[str, Any]:
+    params: dict[str, Any] = json.loads((PAYLOADS_DIR / f'{message_code}.json').read_text(encoding='utf-8'))
+    return params
+
+
+def repeat_groups(params: dict[str, Any], size: int, /) -> dict[str, Any]:
+    return {
+        key: [deepcopy(item) for item in islice(cycle(value), size)] if isinstance(value, list) and value else value
+        for key, value in params.items()
+    }
+
+
+def make_case(message_code: str, size: str, params: dict[str, Any], /, *, name: str | None = None) -> BenchmarkCase:
+    message_class = load_message_class(message_code)
+    return BenchmarkCase(
+        name=name or message_code,
+        family=message_code[:3],
+        size=size,
+        message_class=message_class,
+        params=params,
+        xml=message_class.model_validate(params).to_xml(),
+    )
+
+
+def make_cases() -> list[BenchmarkCase]:
+    cases: list[BenchmarkCase] = []
+    for message_code, size in CASE_MESSAGES:
+        params = load_params(message_code)
+        if size != REPEATING:
+            cases.append(make_case(message_code, size, params))
+            continue
+        for group_size in REPEATING_GROUP_SIZES:
+            name = f'{message_code}[x{group_size}]'
+            cases.append(make_case(message_code, size, repeat_groups(params, group_size), name=name))
+    return cases
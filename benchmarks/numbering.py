@@ -0,0 +1,71 @@
+import sys
+import time
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from sfn_messages.core.numbering import DEFAULT_LEASE_SIZE, InstitutionControlNumberAllocator
+
+DEFAULT_WORKERS = (1, 2, 4, 8)
+DEFAULT_NUMBERS_PER_WORKER = 50_000
+SYSTEM = 'STR'
+
+
+@dataclass(frozen=True, slots=True)
+class WorkersResult:
+    workers: int
+    numbers: int
+    seconds: float
+
+    @property
+    def ops_per_sec(self) -> float:
+        return self.numbers / self.seconds
+
+
+def allocate_all(directory: Path, lease_size: int, count: int, /) -> tuple[int, float]:
+    allocator = InstitutionControlNumberAllocator(directory, lease_size=lease_size)
+    allocate = allocator.allocate
+    start = time.perf_counter()
+    for _ in range(count):
+        allocate(SYSTEM)
+    return count, time.perf_counter() - start
+
+
+def run_workers(workers: int, /, *, lease_size: int, numbers_per_worker: int) -> WorkersResult:
+    with TemporaryDirectory() as directory, ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(
+            executor.map(
+                allocate_all, repeat(Path(directory), workers), repeat(lease_size), repeat(numbers_per_worker, workers)
+            )
+        )
+    return WorkersResult(
+        workers=workers,
+        numbers=sum(count for count, _ in results),
+        seconds=max(seconds for _, seconds in results),
+    )
+
+
+parser = ArgumentParser(
+    prog='python -m benchmarks.numbering', description='Measure control number allocation across worker processes'
+)
+parser.add_argument('--workers', type=int, nargs='+', default=list(DEFAULT_WORKERS))
+parser.add_argument('--numbers-per-worker', type=int, default=DEFAULT_NUMBERS_PER_WORKER)
+parser.add_argument('--lease-size', type=int, default=DEFAULT_LEASE_SIZE)
+
+
+def main() -> None:
+    args = parser.parse_args()
+    sys.stdout.write(f'Lease size: {args.lease_size}\n')
+    sys.stdout.write(f'{"workers":>7} {"numbers":>9} {"seconds":>8} {"ops/sec":>10}\n')
+    for workers in args.workers:
+        result = run_workers(workers, lease_size=args.lease_size, numbers_per_worker=args.numbers_per_worker)
+        sys.stdout.write(
+            f'{result.workers:>7} {result.numbers:>9} {result.seconds:>8.3f} {result.ops_per_sec:>10.0f}\n'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,176 @@
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from .cases import BenchmarkCase
+
+DEFAULT_MIN_TIME = 0.5
+DEFAULT_MIN_ITERATIONS = 20
+DEFAULT_WARMUP_ITERATIONS = 5
+DEFAULT_THRESHOLD = 0.1
+NANOSECONDS_PER_MICROSECOND = 1_000
+NANOSECONDS_PER_SECOND = 1_000_000_000
+
+type Operation = Callable[[BenchmarkCase], Callable[[], object]]
+
+
+def parse(case: BenchmarkCase) -> Callable[[], object]:
+    return lambda: case.message_class.from_xml(case.xml)
+
+
+def serialize(case: BenchmarkCase) -> Callable[[], object]:
+    message = case.message_class.model_validate(case.params)
+    return message.to_xml
+
+
+def validate(case: BenchmarkCase) -> Callable[[], object]:
+    return lambda: case.message_class.model_validate(case.params)
+
+
+def round_trip(case: BenchmarkCase) -> Callable[[], object]:
+    return lambda: case.message_class.from_xml(case.message_class.model_validate(case.params).to_xml())
+
+
+OPERATIONS: dict[str, Operation] = {
+    'parse': parse,
+    'serialize': serialize,
+    'validate': validate,
+    'round_trip': round_trip,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkResult:
+    case: str
+    family: str
+    size: str
+    operation: str
+    iterations: int
+    ops_per_sec: float
+    mean_us: float
+    p50_us: float
+    p90_us: float
+    p99_us: float
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return self.case, self.operation
+
+
+@dataclass(frozen=True, slots=True)
+class Regression:
+    case: str
+    operation: str
+    baseline_ops_per_sec: float
+    ops_per_sec: float
+
+    @property
+    def slowdown(self) -> float:
+        return self.baseline_ops_per_sec / self.ops_per_sec - 1
+
+
+def measure(
+    function: Callable[[], object],
+    /,
+    *,
+    min_time: float = DEFAULT_MIN_TIME,
+    min_iterations: int = DEFAULT_MIN_ITERATIONS,
+    warmup_iterations: int = DEFAULT_WARMUP_ITERATIONS,
+) -> list[int]:
+    for _ in range(warmup_iterations):
+        function()
+    gc.collect()
+
+    timings: list[int] = []
+    clock = time.perf_counter_ns
+    deadline = clock() + int(min_time * NANOSECONDS_PER_SECOND)
+    while len(timings) < min_iterations or clock() < deadline:
+        start = clock()
+        function()
+        timings.append(clock() - start)
+    return timings
+
+
+def summarize(case: BenchmarkCase, operation: str, timings: list[int], /) -> BenchmarkResult:
+    percentiles = statistics.quantiles(timings, n=100, method='inclusive')
+    return BenchmarkResult(
+        case=case.name,
+        family=case.family,
+        size=case.size,
+        operation=operation,
+        iterations=len(timings),
+        ops_per_sec=len(timings) * NANOSECONDS_PER_SECOND / sum(timings),
+        mean_us=statistics.fmean(timings) / NANOSECONDS_PER_MICROSECOND,
+        p50_us=percentiles[49] / NANOSECONDS_PER_MICROSECOND,
+        p90_us=percentiles[89] / NANOSECONDS_PER_MICROSECOND,
+        p99_us=percentiles[98] / NANOSECONDS_PER_MICROSECOND,
+    )
+
+
+def run(
+    cases: Iterable[BenchmarkCase],
+    operations: Iterable[str],
+    /,
+    *,
+    min_time: float = DEFAULT_MIN_TIME,
+    min_iterations: int = DEFAULT_MIN_ITERATIONS,
+    warmup_iterations: int = DEFAULT_WARMUP_ITERATIONS,
+) -> list[BenchmarkResult]:
+    results: list[BenchmarkResult] = []
+    for case in cases:
+        for operation in operations:
+            timings = measure(
+                OPERATIONS[operation](case),
+                min_time=min_time,
+                min_iterations=min_iterations,
+                warmup_iterations=warmup_iterations,
+            )
+            results.append(summarize(case, operation, timings))
+    return results
+
+
+def compare(
+    results: Iterable[BenchmarkResult],
+    baseline: Iterable[BenchmarkResult],
+    /,
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[Regression]:
+    baseline_by_key = {result.key: result for result in baseline}
+    regressions: list[Regression] = []
+    for result in results:
+        previous = baseline_by_key.get(result.key)
+        if previous is None:
+            continue
+        regression = Regression(
+            case=result.case,
+            operation=result.operation,
+            baseline_ops_per_sec=previous.ops_per_sec,
+            ops_per_sec=result.ops_per_sec,
+        )
+        if regression.slowdown > threshold:
+            regressions.append(regression)
+    return regressions
+
+
+def dump_results(results: Iterable[BenchmarkResult], path: Path, /) -> None:
+    document = {
+        'python': sys.version,
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'results': [asdict(result) for result in results],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, indent=2) + '\n')
+
+
+def load_results(path: Path, /) -> list[BenchmarkResult]:
+    document: dict[str, Any] = json.loads(path.read_text())
+    return [BenchmarkResult(**result) for result in document['results']]
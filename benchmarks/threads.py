@@ -0,0 +1,65 @@
+import sys
+import time
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from sfn_messages.core.models import BaseMessage
+
+from .cases import REPEATING, make_cases
+
+DEFAULT_THREADS = (1, 2, 4, 8)
+DEFAULT_MESSAGES_PER_THREAD = 2_000
+
+
+@dataclass(frozen=True, slots=True)
+class ThreadsResult:
+    threads: int
+    messages: int
+    seconds: float
+
+    @property
+    def ops_per_sec(self) -> float:
+        return self.messages / self.seconds
+
+
+def serialize_all(messages: list[BaseMessage], /) -> int:
+    for message in messages:
+        message.to_xml()
+    return len(messages)
+
+
+def run_threads(messages: list[BaseMessage], threads: int, /, *, messages_per_thread: int) -> ThreadsResult:
+    batches = [
+        [messages[(thread + index) % len(messages)] for index in range(messages_per_thread)]
+        for thread in range(threads)
+    ]
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        start = time.perf_counter()
+        total = sum(executor.map(serialize_all, batches))
+        seconds = time.perf_counter() - start
+    return ThreadsResult(threads=threads, messages=total, seconds=seconds)
+
+
+parser = ArgumentParser(prog='python -m benchmarks.threads', description='Measure to_xml throughput on threads')
+parser.add_argument('--threads', type=int, nargs='+', default=list(DEFAULT_THREADS))
+parser.add_argument('--messages-per-thread', type=int, default=DEFAULT_MESSAGES_PER_THREAD)
+
+
+def main() -> None:
+    args = parser.parse_args()
+    messages = [case.message_class.model_validate(case.params) for case in make_cases() if case.size != REPEATING]
+    serialize_all(messages)
+
+    gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    sys.stdout.write(f'GIL enabled: {gil_enabled}\n')
+    sys.stdout.write(f'{"threads":>7} {"messages":>9} {"seconds":>8} {"ops/sec":>10}\n')
+    for threads in args.threads:
+        result = run_threads(messages, threads, messages_per_thread=args.messages_per_thread)
+        sys.stdout.write(
+            f'{result.threads:>7} {result.messages:>9} {result.seconds:>8.3f} {result.ops_per_sec:>10.0f}\n'
+        )
+
+
+if __name__ == '__main__':
+    main()
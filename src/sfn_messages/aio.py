@@ -0,0 +1,228 @@
+import asyncio
+import os
+import weakref
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Buffer, Callable, Iterable, Mapping
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from multiprocessing.context import BaseContext
+from types import TracebackType
+from typing import Any, Self
+
+from .core import from_xml, from_xml_bytes, to_xml
+from .core.batch import BatchError, BatchResult, ToXmlItem, initialize_worker
+from .core.models import BaseMessage
+
+DEFAULT_MAX_CONCURRENCY = min(32, (os.cpu_count() or 1) + 4)
+INLINE_THRESHOLD = 4 * 1024
+ESTIMATED_FIELD_SIZE = 32
+
+
+def estimate_xml_size(msg: object, /) -> int:
+    if isinstance(msg, Mapping):
+        return sum(estimate_xml_size(value) for value in msg.values())
+    if isinstance(msg, list | tuple):
+        return sum(estimate_xml_size(value) for value in msg)
+    if isinstance(msg, str):
+        return ESTIMATED_FIELD_SIZE + len(msg)
+    return ESTIMATED_FIELD_SIZE
+
+
+class AsyncConverter:
+    def __init__(
+        self,
+        *,
+        executor: Executor | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        inline_threshold: int = INLINE_THRESHOLD,
+        shutdown_executor: bool = False,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self.inline_threshold = inline_threshold
+        self.shutdown_executor = shutdown_executor
+        self._semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @classmethod
+    def with_process_pool(
+        cls,
+        *,
+        max_workers: int | None = None,
+        message_codes: Iterable[str] | None = None,
+        mp_context: BaseContext | None = None,
+        max_concurrency: int | None = None,
+        inline_threshold: int = INLINE_THRESHOLD,
+    ) -> Self:
+        workers = max_workers or os.cpu_count() or 1
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=mp_context,
+            initializer=initialize_worker,
+            initargs=(None if message_codes is None else tuple(message_codes),),
+        )
+        return cls(
+            executor=executor,
+            max_concurrency=max_concurrency or workers,
+            inline_threshold=inline_threshold,
+            shutdown_executor=True,
+        )
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        if self.shutdown_executor and self.executor is not None:
+            await asyncio.to_thread(self.executor.shutdown)
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def run[T](self, function: Callable[[], T], /, *, size: int) -> T:
+        if size < self.inline_threshold:
+            return function()
+        async with self._semaphore():
+            return await asyncio.get_running_loop().run_in_executor(self.executor, function)
+
+    async def from_xml(self, xml: str, /, *, backend: str | None = None, trusted: bool = False) -> BaseMessage:
+        return await self.run(partial(from_xml, xml, backend=backend, trusted=trusted), size=len(xml))
+
+    async def from_xml_bytes(
+        self,
+        data: Buffer,
+        /,
+        *,
+        encoding: str | None = None,
+        backend: str | None = None,
+        trusted: bool = False,
+    ) -> BaseMessage:
+        data = bytes(data)
+        function = partial(from_xml_bytes, data, encoding=encoding, backend=backend, trusted=trusted)
+        return await self.run(function, size=len(data))
+
+    async def to_xml(self, message_code: str, msg: dict[Any, Any], /, *, trusted: bool = False) -> str:
+        return await self.run(partial(to_xml, message_code, msg, trusted=trusted), size=estimate_xml_size(msg))
+
+    def from_xml_many(
+        self,
+        xmls: Iterable[str] | AsyncIterable[str],
+        /,
+        *,
+        backend: str | None = None,
+        trusted: bool = False,
+    ) -> AsyncIterator[BatchResult[BaseMessage]]:
+        return self._map_many(partial(self.from_xml, backend=backend, trusted=trusted), xmls)
+
+    def to_xml_many(
+        self,
+        items: Iterable[ToXmlItem] | AsyncIterable[ToXmlItem],
+        /,
+        *,
+        trusted: bool = False,
+    ) -> AsyncIterator[BatchResult[str]]:
+        async def convert(item: ToXmlItem) -> str:
+            message_code, msg = item
+            return await self.to_xml(message_code, dict(msg), trusted=trusted)
+
+        return self._map_many(convert, items)
+
+    async def _map_many[I, R](
+        self,
+        function: Callable[[I], Awaitable[R]],
+        items: Iterable[I] | AsyncIterable[I],
+    ) -> AsyncIterator[BatchResult[R]]:
+        async def convert(index: int, item: I) -> BatchResult[R]:
+            try:
+                return BatchResult(index=index, value=await function(item))
+            except Exception as exc:  # noqa: BLE001
+                return BatchResult(index=index, error=BatchError.from_exception(exc))
+
+        pending: deque[asyncio.Task[BatchResult[R]]] = deque()
+        try:
+            index = 0
+            async for item in _aiter(items):
+                if len(pending) >= self.max_concurrency:
+                    yield await pending.popleft()
+                pending.append(asyncio.ensure_future(convert(index, item)))
+                index += 1
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+async def _aiter[T](items: Iterable[T] | AsyncIterable[T], /) -> AsyncIterator[T]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+_default_converter = AsyncConverter()
+
+
+def get_default_converter() -> AsyncConverter:
+    return _default_converter
+
+
+def set_default_converter(converter: AsyncConverter, /) -> AsyncConverter:
+    global _default_converter  # noqa: PLW0603
+    previous = _default_converter
+    _default_converter = converter
+    return previous
+
+
+async def from_xml_async(xml: str, /, *, backend: str | None = None, trusted: bool = False) -> BaseMessage:
+    return await _default_converter.from_xml(xml, backend=backend, trusted=trusted)
+
+
+async def from_xml_bytes_async(
+    data: Buffer,
+    /,
+    *,
+    encoding: str | None = None,
+    backend: str | None = None,
+    trusted: bool = False,
+) -> BaseMessage:
+    return await _default_converter.from_xml_bytes(data, encoding=encoding, backend=backend, trusted=trusted)
+
+
+async def to_xml_async(message_code: str, msg: dict[Any, Any], /, *, trusted: bool = False) -> str:
+    return await _default_converter.to_xml(message_code, msg, trusted=trusted)
+
+
+def from_xml_many_async(
+    xmls: Iterable[str] | AsyncIterable[str],
+    /,
+    *,
+    backend: str | None = None,
+    trusted: bool = False,
+) -> AsyncIterator[BatchResult[BaseMessage]]:
+    return _default_converter.from_xml_many(xmls, backend=backend, trusted=trusted)
+
+
+def to_xml_many_async(
+    items: Iterable[ToXmlItem] | AsyncIterable[ToXmlItem],
+    /,
+    *,
+    trusted: bool = False,
+) -> AsyncIterator[BatchResult[str]]:
+    return _default_converter.to_xml_many(items, trusted=trusted)
@@ -1,8 +1,23 @@
 import json
+import os
+import re
 import sys
-from argparse import ArgumentParser
+from argparse import ArgumentParser, Namespace
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from functools import partial
+from glob import glob, has_magic
+from itertools import batched, chain
+from pathlib import Path
+from typing import TextIO
 
 from sfn_messages.core import get_message_code, load_message_class
+from sfn_messages.core.batch import DEFAULT_CHUNK_SIZE, BatchError, BatchResult, map_many
+from sfn_messages.core.numbering import InstitutionControlNumberAllocator
+
+XML_ROOT_TAG_RE = re.compile(r'<(?P<tag>[A-Za-z_][\w.:-]*)[^>]*?(?P<empty>/)?>')
+
+type ChunkConverter = Callable[[tuple[tuple[int, str], ...]], list[BatchResult[str]]]
 
 parser = ArgumentParser()
 subparsers = parser.add_subparsers(dest='action', metavar='action')
@@ -11,17 +26,237 @@ to_xml = subparsers.add_parser('toxml', help='Convert JSON to XML')
 to_xml.add_argument('-m', '--message-code')
 to_xml.add_argument('-i', '--input', default=0, required=False)
 to_xml.add_argument('-o', '--output', default=1, required=False)
+to_xml.add_argument('--ndjson', action='store_true', help='Read one JSON message per line')
 
 to_json = subparsers.add_parser('tojson', help='Convert XML to JSON')
 to_json.add_argument('-m', '--message-code')
 to_json.add_argument('--indent', type=int, default=None)
 to_json.add_argument('-i', '--input', default=0, required=False)
 to_json.add_argument('-o', '--output', default=1, required=False)
+to_json.add_argument('--stream', action='store_true', help='Read concatenated XML documents')
+
+for subparser in (to_xml, to_json):
+    subparser.add_argument('-j', '--jobs', type=int, default=1, help='Number of worker processes')
+    subparser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    subparser.add_argument('--output-dir', type=Path, help='Write one file per input message')
+
+control_numbers = subparsers.add_parser('controlnumbers', help='Show institution control number allocator state')
+control_numbers.add_argument('directory', type=Path)
+control_numbers.add_argument('-p', '--prefix', action='append', default=[], metavar='SYSTEM=PREFIX')
+
+
+def convert_json_to_xml_chunk(
+    chunk: tuple[tuple[int, str], ...],
+    *,
+    message_code: str | None,
+) -> list[BatchResult[str]]:
+    results: list[BatchResult[str]] = []
+    for index, text in chunk:
+        try:
+            input_message = json.loads(text)
+            message_class = load_message_class(message_code or input_message['message_code'])
+            value = message_class.model_validate(input_message).to_xml()
+            results.append(BatchResult(index=index, value=value))
+        except Exception as exc:  # noqa: BLE001
+            results.append(BatchResult(index=index, error=BatchError.from_exception(exc)))
+    return results
+
+
+def convert_xml_to_json_chunk(
+    chunk: tuple[tuple[int, str], ...],
+    *,
+    message_code: str | None,
+    indent: int | None,
+) -> list[BatchResult[str]]:
+    results: list[BatchResult[str]] = []
+    for index, text in chunk:
+        try:
+            message_class = load_message_class(message_code or get_message_code(text))
+            value = message_class.from_xml(text).model_dump_json(indent=indent)
+            results.append(BatchResult(index=index, value=value))
+        except Exception as exc:  # noqa: BLE001
+            results.append(BatchResult(index=index, error=BatchError.from_exception(exc)))
+    return results
+
+
+def iter_xml_documents(lines: Iterable[str], /) -> Iterator[str]:
+    pending = ''
+    document: list[str] = []
+    end_tag_re: re.Pattern[str] | None = None
+    for line in lines:
+        text = pending + line
+        position = 0
+        while True:
+            if end_tag_re is None:
+                start = XML_ROOT_TAG_RE.search(text, position)
+                if start is None:
+                    pending = text[position:]
+                    break
+                if start.group('empty'):
+                    yield text[position : start.end()].strip()
+                    position = start.end()
+                    continue
+                end_tag_re = re.compile(rf'</{re.escape(start.group("tag"))}\s*>')
+                document = [text[position : start.end()]]
+                position = start.end()
+            end = end_tag_re.search(text, position)
+            if end is None:
+                keep_from = max(position, len(text) - len(end_tag_re.pattern))
+                document.append(text[position:keep_from])
+                pending = text[keep_from:]
+                break
+            document.append(text[position : end.end()])
+            yield ''.join(document).strip()
+            document = []
+            position = end.end()
+            end_tag_re = None
+    remainder = ''.join(document) + pending
+    if remainder.strip():
+        yield remainder.strip()
+
+
+def iter_ndjson_lines(lines: Iterable[str], /) -> Iterator[str]:
+    for line in lines:
+        if line.strip():
+            yield line
+
+
+def resolve_input_paths(value: str | int, /) -> list[Path] | None:
+    if isinstance(value, int):
+        return None
+    path = Path(value)
+    if path.is_dir():
+        return sorted(child for child in path.iterdir() if child.is_file())
+    if has_magic(value):
+        return [Path(name) for name in sorted(glob(value, recursive=True)) if Path(name).is_file()]  # noqa: PTH207
+    return None
+
+
+def iter_input_files(paths: list[Path], /) -> Iterator[tuple[str, str]]:
+    base = Path(os.path.commonpath([path.parent for path in paths])) if paths else Path()
+    for path in paths:
+        yield path.relative_to(base).with_suffix('').as_posix(), path.read_text()
+
+
+def iter_input_stream(
+    file: TextIO,
+    split: Callable[[Iterable[str]], Iterator[str]],
+    /,
+) -> Iterator[tuple[str, str]]:
+    for index, document in enumerate(split(file)):
+        yield f'{index:06d}', document
+
+
+def convert_many(
+    function: ChunkConverter,
+    sources: Iterable[tuple[str, str]],
+    /,
+    *,
+    jobs: int,
+    chunk_size: int,
+    message_code: str | None,
+) -> Iterator[tuple[str, BatchResult[str]]]:
+    names: deque[str] = deque()
+
+    def payloads() -> Iterator[str]:
+        for name, payload in sources:
+            names.append(name)
+            yield payload
+
+    if jobs > 1:
+        results: Iterator[BatchResult[str]] = map_many(
+            function,
+            payloads(),
+            max_workers=jobs,
+            chunk_size=chunk_size,
+            message_codes=() if message_code is None else (message_code,),
+            mp_context=None,
+        )
+    else:
+        results = chain.from_iterable(map(function, batched(enumerate(payloads()), chunk_size)))
+    for result in results:
+        yield names.popleft(), result
+
+
+def write_results(
+    results: Iterable[tuple[str, BatchResult[str]]],
+    /,
+    *,
+    output: str | int,
+    output_dir: Path | None,
+    suffix: str,
+) -> int:
+    failures = 0
+    if output_dir is not None:
+        output_dir.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', closefd=not isinstance(output, int)) as f_output:
+        for name, result in results:
+            if result.error is not None:
+                failures += 1
+                sys.stderr.write(f'{name}: {result.error.type}: {result.error.message}\n')
+            elif output_dir is not None:
+                target = output_dir / f'{name}{suffix}'
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_text(f'{result.value}\n')
+            else:
+                print(result.value, file=f_output)
+    return failures
+
+
+def run_batch(args: Namespace, input_paths: list[Path] | None, /) -> int:
+    if input_paths == []:
+        subparsers.choices[args.action].error(f'no input files found in {args.input}')
+    if args.action == 'toxml':
+        function: ChunkConverter = partial(convert_json_to_xml_chunk, message_code=args.message_code)
+        split, suffix = iter_ndjson_lines, '.xml'
+    else:
+        if args.indent is not None and args.output_dir is None:
+            to_json.error('--indent requires --output-dir when converting several messages')
+        function = partial(convert_xml_to_json_chunk, message_code=args.message_code, indent=args.indent)
+        split, suffix = iter_xml_documents, '.json'
+
+    convert = partial(
+        convert_many,
+        function,
+        jobs=args.jobs,
+        chunk_size=args.chunk_size,
+        message_code=args.message_code,
+    )
+    write = partial(write_results, output=args.output, output_dir=args.output_dir, suffix=suffix)
+    if input_paths is not None:
+        return write(convert(iter_input_files(input_paths)))
+    with open(args.input, closefd=not isinstance(args.input, int)) as f_input:
+        return write(convert(iter_input_stream(f_input, split)))
+
+
+def is_batch(args: Namespace, input_paths: list[Path] | None, /) -> bool:
+    return (
+        getattr(args, 'ndjson', False)
+        or getattr(args, 'stream', False)
+        or args.output_dir is not None
+        or args.jobs > 1
+        or input_paths is not None
+    )
+
+
+def show_control_numbers(args: Namespace, /) -> None:
+    prefixes = dict(item.partition('=')[::2] for item in args.prefix)
+    allocator = InstitutionControlNumberAllocator(args.directory, prefixes=prefixes)
+    sys.stdout.write(f'{"system":<6} {"prefix":<16} {"next":>20} {"remaining":>20} {"next number":<20}\n')
+    for state in allocator.state():
+        sys.stdout.write(
+            f'{state.system:<6} {state.prefix:<16} {state.next_sequence:>20} {state.remaining:>20} '
+            f'{state.next_number or "-":<20}\n'
+        )
 
 
 def main() -> None:
     args = parser.parse_args()
+    input_paths = resolve_input_paths(args.input) if args.action in {'toxml', 'tojson'} else None
     match args.action:
+        case 'toxml' | 'tojson' if is_batch(args, input_paths):
+            if run_batch(args, input_paths):
+                sys.exit(1)
         case 'toxml':
             with open(args.input) as f_input, open(args.output, 'w') as f_output:  # noqa: PTH123
                 input_message = json.loads(f_input.read())
@@ -36,6 +271,8 @@ def main() -> None:
                 message_class = load_message_class(message_code)
                 message = message_class.from_xml(input_message)
                 print(message.model_dump_json(indent=args.indent), file=f_output)
+        case 'controlnumbers':
+            show_control_numbers(args)
         case _:
             parser.print_usage()
             sys.exit(2)
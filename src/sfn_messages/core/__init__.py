@@ -1,12 +1,19 @@
 import re
-from importlib import import_module
-from typing import Any, cast
+from collections.abc import Buffer, Iterable
+from time import perf_counter_ns
+from typing import Any
+from xml.etree import ElementTree as ET
 
-from .errors import MessageCodeNotFoundError, MessageNotImplementedError
+from . import instrumentation
+from .backends import XmlBackend, get_xml_backend
+from .encoding import RSFN_ENCODING
+from .errors import MessageCodeNotFoundError
+from .instrumentation import Phase
 from .models import BaseMessage
+from .registry import MESSAGE_CODE_RE as MESSAGE_CODE_RE
+from .registry import MESSAGE_REGISTRY
 
 MESSAGE_CODE_TAG_RE = re.compile(r'<CodMsg>(?P<message_code>.*?)</CodMsg>')
-MESSAGE_CODE_RE = re.compile(r'^(?P<event>(?P<service>[A-Za-z]{3})[0-9]{4}).*$')
 
 
 def get_message_code(xml: str, /) -> str:
@@ -16,27 +23,92 @@ def get_message_code(xml: str, /) -> str:
     return result.group('message_code')
 
 
+def get_message_code_from_element(xml: ET.Element, /) -> str:
+    for element in xml.iter():
+        if element.tag == 'CodMsg' or element.tag.endswith('}CodMsg'):
+            return element.text or ''
+    raise MessageCodeNotFoundError
+
+
 def load_message_class(message_code: str, /) -> type[BaseMessage]:
-    parts = MESSAGE_CODE_RE.match(message_code)
-    if parts is None:
-        raise ValueError
-    service = parts.group('service').lower()
-    event = parts.group('event').lower()
-    package_name = f'sfn_messages.{service}.{event}'
-    try:
-        klass = cast('type[BaseMessage]', getattr(import_module(package_name), message_code))
-    except (ModuleNotFoundError, AttributeError):
-        raise MessageNotImplementedError(message_code=message_code) from None
-    return klass
+    return MESSAGE_REGISTRY.get(message_code)
+
 
+def warm_up() -> None:
+    MESSAGE_REGISTRY.warm_up()
 
-def to_xml(message_code: str, msg: dict[Any, Any], /) -> str:
+
+def registered_codes() -> list[str]:
+    return MESSAGE_REGISTRY.registered_codes()
+
+
+def to_xml(message_code: str, msg: dict[Any, Any], /, *, trusted: bool = False) -> str:
     klass = load_message_class(message_code)
-    module = klass.model_validate(msg)
+    module = klass.model_validate(msg, trusted=trusted)
     return module.to_xml()
 
 
-def from_xml(xml: str, /) -> BaseMessage:
+def from_xml(xml: str, /, *, backend: str | XmlBackend | None = None, trusted: bool = False) -> BaseMessage:
     message_code = get_message_code(xml)
     klass = load_message_class(message_code)
-    return klass.from_xml(xml)
+    return klass.from_xml(xml, backend=backend, trusted=trusted)
+
+
+def to_xml_bytes(
+    message_code: str,
+    msg: dict[Any, Any],
+    /,
+    *,
+    encoding: str = RSFN_ENCODING,
+    bom: bool = False,
+    trusted: bool = False,
+) -> bytes:
+    klass = load_message_class(message_code)
+    module = klass.model_validate(msg, trusted=trusted)
+    return module.to_xml_bytes(encoding=encoding, bom=bom)
+
+
+def from_xml_bytes(
+    data: Buffer,
+    /,
+    *,
+    encoding: str | None = None,
+    backend: str | XmlBackend | None = None,
+    trusted: bool = False,
+) -> BaseMessage:
+    if not instrumentation.active_hooks:
+        xml = get_xml_backend(backend).parse_bytes(data, encoding=encoding)
+        return load_message_class(get_message_code_from_element(xml)).from_xml_value(xml, trusted=trusted)
+
+    payload_size = memoryview(data).nbytes
+    start = perf_counter_ns()
+    try:
+        xml = get_xml_backend(backend).parse_bytes(data, encoding=encoding)
+        duration_ns = perf_counter_ns() - start
+        klass = load_message_class(get_message_code_from_element(xml))
+    except Exception:
+        instrumentation.emit(
+            Phase.PARSE,
+            instrumentation.UNKNOWN_MESSAGE_CODE,
+            perf_counter_ns() - start,
+            payload_size=payload_size,
+            failed=True,
+        )
+        raise
+    instrumentation.emit(Phase.PARSE, klass.__name__, duration_ns, payload_size=payload_size)
+    return klass.from_parsed_xml(xml, trusted=trusted, payload_size=payload_size)
+
+
+def extract(  # noqa: PLR0913
+    xml: str | Buffer,
+    message_code: str,
+    /,
+    *,
+    fields: Iterable[str],
+    encoding: str | None = None,
+    backend: str | XmlBackend | None = None,
+    trusted: bool = False,
+) -> dict[str, Any]:
+    return load_message_class(message_code).extract_xml(
+        xml, fields, encoding=encoding, backend=backend, trusted=trusted
+    )
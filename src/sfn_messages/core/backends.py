@@ -0,0 +1,170 @@
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Buffer, Callable, Iterator
+from os import PathLike
+from typing import IO, TYPE_CHECKING, ClassVar, Literal, cast
+from xml.etree import ElementTree as ET
+
+from defusedxml import DTDForbidden
+from defusedxml.ElementTree import DefusedXMLParser, fromstring, iterparse
+
+from .encoding import detect_utf16, expat_encoding, strip_bom
+from .errors import XmlBackendNotAvailableError
+
+if TYPE_CHECKING:
+    from lxml import etree
+
+type XmlEventName = Literal['start', 'end']
+type XmlSource = str | PathLike[str] | IO[bytes]
+type XmlEvent = tuple[str, ET.Element]
+
+
+class XmlBackend(ABC):
+    name: ClassVar[str]
+
+    @abstractmethod
+    def parse_string(self, text: str, /) -> ET.Element: ...
+
+    @abstractmethod
+    def parse_bytes(self, data: Buffer, /, *, encoding: str | None = None) -> ET.Element: ...
+
+    @abstractmethod
+    def iterparse(self, source: XmlSource, /, *, events: tuple[XmlEventName, ...]) -> Iterator[XmlEvent]: ...
+
+    @abstractmethod
+    def make_element(self, tag: str, attrib: dict[str, str], /) -> ET.Element: ...
+
+
+class StdlibXmlBackend(XmlBackend):
+    name = 'stdlib'
+
+    def parse_string(self, text: str, /) -> ET.Element:
+        return fromstring(text, forbid_dtd=True)
+
+    def parse_bytes(self, data: Buffer, /, *, encoding: str | None = None) -> ET.Element:
+        view, encoding = strip_bom(data, encoding)
+        parser = DefusedXMLParser(
+            encoding=None if encoding is None else expat_encoding(encoding),
+            forbid_dtd=True,
+        )
+        parser.feed(view)
+        return parser.close()
+
+    def iterparse(self, source: XmlSource, /, *, events: tuple[XmlEventName, ...]) -> Iterator[XmlEvent]:
+        return iterparse(source, events=events, forbid_dtd=True)
+
+    def make_element(self, tag: str, attrib: dict[str, str], /) -> ET.Element:
+        return ET.Element(tag, attrib)
+
+
+class LxmlXmlBackend(XmlBackend):
+    name = 'lxml'
+
+    def __init__(self) -> None:
+        from lxml import etree  # noqa: PLC0415
+
+        self._etree = etree
+        self._local = threading.local()
+
+    def _parser(self, encoding: str | None) -> 'etree.XMLParser':
+        parsers: dict[str | None, etree.XMLParser] | None = getattr(self._local, 'parsers', None)
+        if parsers is None:
+            parsers = self._local.parsers = {}
+        parser = parsers.get(encoding)
+        if parser is None:
+            parser = parsers[encoding] = self._etree.XMLParser(
+                encoding=encoding,
+                resolve_entities=False,
+                no_network=True,
+                load_dtd=False,
+                remove_comments=True,
+                remove_pis=True,
+                huge_tree=False,
+            )
+        return parser
+
+    def _check(self, element: 'etree._Element') -> ET.Element:
+        docinfo = element.getroottree().docinfo
+        if docinfo.doctype:
+            raise DTDForbidden(docinfo.root_name, docinfo.system_url, docinfo.public_id)
+        return cast('ET.Element', element)
+
+    def _parse(self, data: Buffer, encoding: str | None) -> ET.Element:
+        try:
+            element = self._etree.fromstring(cast('bytes', data), self._parser(encoding))
+        except self._etree.XMLSyntaxError as exc:
+            raise self._parse_error(exc) from exc
+        return self._check(element)
+
+    @staticmethod
+    def _parse_error(exc: 'etree.XMLSyntaxError') -> ET.ParseError:
+        error = ET.ParseError(exc.msg)
+        error.code = exc.code
+        error.position = exc.position
+        return error
+
+    def parse_string(self, text: str, /) -> ET.Element:
+        return self._parse(text.encode(), 'UTF-8')
+
+    def parse_bytes(self, data: Buffer, /, *, encoding: str | None = None) -> ET.Element:
+        view, encoding = strip_bom(data, encoding)
+        if encoding is None:
+            encoding = detect_utf16(view)
+        return self._parse(view, None if encoding is None else expat_encoding(encoding))
+
+    def iterparse(self, source: XmlSource, /, *, events: tuple[XmlEventName, ...]) -> Iterator[XmlEvent]:
+        context = self._etree.iterparse(
+            cast('IO[bytes]', source),
+            events=events,
+            resolve_entities=False,
+            no_network=True,
+            load_dtd=False,
+            remove_comments=True,
+            remove_pis=True,
+            huge_tree=False,
+        )
+        checked = False
+        try:
+            for event, element in context:
+                if not checked:
+                    self._check(element)
+                    checked = True
+                yield event, cast('ET.Element', element)
+        except self._etree.XMLSyntaxError as exc:
+            raise self._parse_error(exc) from exc
+
+    def make_element(self, tag: str, attrib: dict[str, str], /) -> ET.Element:
+        return cast('ET.Element', self._etree.Element(tag, attrib))
+
+
+XML_BACKENDS: dict[str, Callable[[], XmlBackend]] = {
+    StdlibXmlBackend.name: StdlibXmlBackend,
+    LxmlXmlBackend.name: LxmlXmlBackend,
+}
+
+_default_backend: XmlBackend = StdlibXmlBackend()
+_instances: dict[str, XmlBackend] = {_default_backend.name: _default_backend}
+
+
+def get_xml_backend(backend: str | XmlBackend | None = None, /) -> XmlBackend:
+    if backend is None:
+        return _default_backend
+    if isinstance(backend, XmlBackend):
+        return backend
+    instance = _instances.get(backend)
+    if instance is None:
+        factory = XML_BACKENDS.get(backend)
+        if factory is None:
+            raise XmlBackendNotAvailableError(name=backend)
+        try:
+            instance = _instances[backend] = factory()
+        except ImportError:
+            raise XmlBackendNotAvailableError(name=backend) from None
+    return instance
+
+
+def set_xml_backend(backend: str | XmlBackend, /) -> XmlBackend:
+    global _default_backend  # noqa: PLW0603
+    previous = _default_backend
+    _default_backend = get_xml_backend(backend)
+    return previous
@@ -0,0 +1,152 @@
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from itertools import batched
+from multiprocessing.context import BaseContext
+from typing import Any
+
+from . import from_xml, load_message_class, to_xml, warm_up
+from .models import BaseMessage
+
+DEFAULT_CHUNK_SIZE = 64
+CHUNKS_IN_FLIGHT_PER_WORKER = 2
+
+
+@dataclass(frozen=True, slots=True)
+class BatchError:
+    type: str
+    message: str
+
+    @classmethod
+    def from_exception(cls, exc: Exception) -> 'BatchError':
+        return cls(type=f'{type(exc).__module__}.{type(exc).__qualname__}', message=str(exc))
+
+
+@dataclass(frozen=True, slots=True)
+class BatchResult[T]:
+    index: int
+    value: T | None = None
+    error: BatchError | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+type ToXmlItem = tuple[str, Mapping[Any, Any]]
+
+
+def initialize_worker(message_codes: tuple[str, ...] | None) -> None:
+    if message_codes is None:
+        warm_up()
+        return
+    for message_code in message_codes:
+        load_message_class(message_code)
+
+
+def convert_from_xml_chunk(
+    chunk: tuple[tuple[int, str], ...],
+    *,
+    trusted: bool,
+) -> list[BatchResult[BaseMessage]]:
+    results: list[BatchResult[BaseMessage]] = []
+    for index, xml in chunk:
+        try:
+            results.append(BatchResult(index=index, value=from_xml(xml, trusted=trusted)))
+        except Exception as exc:  # noqa: BLE001
+            results.append(BatchResult(index=index, error=BatchError.from_exception(exc)))
+    return results
+
+
+def convert_to_xml_chunk(
+    chunk: tuple[tuple[int, ToXmlItem], ...],
+    *,
+    trusted: bool,
+) -> list[BatchResult[str]]:
+    results: list[BatchResult[str]] = []
+    for index, (message_code, msg) in chunk:
+        try:
+            results.append(BatchResult(index=index, value=to_xml(message_code, dict(msg), trusted=trusted)))
+        except Exception as exc:  # noqa: BLE001
+            results.append(BatchResult(index=index, error=BatchError.from_exception(exc)))
+    return results
+
+
+def iter_ordered_results[I, R](
+    executor: Executor,
+    function: Callable[[tuple[tuple[int, I], ...]], list[R]],
+    items: Iterable[I],
+    *,
+    chunk_size: int,
+    window: int,
+) -> Iterator[R]:
+    pending: deque[Future[list[R]]] = deque()
+    for chunk in batched(enumerate(items), chunk_size):
+        if len(pending) >= window:
+            yield from pending.popleft().result()
+        pending.append(executor.submit(function, chunk))
+    while pending:
+        yield from pending.popleft().result()
+
+
+def map_many[I, R](  # noqa: PLR0913
+    function: Callable[[tuple[tuple[int, I], ...]], list[R]],
+    items: Iterable[I],
+    *,
+    max_workers: int | None,
+    chunk_size: int,
+    message_codes: Iterable[str] | None,
+    mp_context: BaseContext | None,
+) -> Iterator[R]:
+    workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp_context,
+        initializer=initialize_worker,
+        initargs=(None if message_codes is None else tuple(message_codes),),
+    ) as executor:
+        window = workers * CHUNKS_IN_FLIGHT_PER_WORKER
+        yield from iter_ordered_results(executor, function, items, chunk_size=chunk_size, window=window)
+
+
+def from_xml_many(  # noqa: PLR0913
+    xmls: Iterable[str],
+    /,
+    *,
+    max_workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    message_codes: Iterable[str] | None = None,
+    trusted: bool = False,
+    mp_context: BaseContext | None = None,
+) -> Iterator[BatchResult[BaseMessage]]:
+    return map_many(
+        partial(convert_from_xml_chunk, trusted=trusted),
+        xmls,
+        max_workers=max_workers,
+        chunk_size=chunk_size,
+        message_codes=message_codes,
+        mp_context=mp_context,
+    )
+
+
+def to_xml_many(  # noqa: PLR0913
+    items: Iterable[ToXmlItem],
+    /,
+    *,
+    max_workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    message_codes: Iterable[str] | None = None,
+    trusted: bool = False,
+    mp_context: BaseContext | None = None,
+) -> Iterator[BatchResult[str]]:
+    return map_many(
+        partial(convert_to_xml_chunk, trusted=trusted),
+        items,
+        max_workers=max_workers,
+        chunk_size=chunk_size,
+        message_codes=message_codes,
+        mp_context=mp_context,
+    )
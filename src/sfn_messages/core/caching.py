@@ -0,0 +1,17 @@
+import threading
+from collections.abc import Callable
+from functools import cache, wraps
+
+
+def class_cache[C: type, R](function: Callable[[C], R], /) -> Callable[[C], R]:
+    results: dict[C, R] = {}
+    lock = threading.RLock()
+
+    @wraps(function)
+    def compute_once(cls: C, /) -> R:
+        with lock:
+            if cls not in results:
+                results[cls] = function(cls)
+            return results[cls]
+
+    return cache(compute_once)
@@ -0,0 +1,142 @@
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib.util import find_spec
+from operator import mul
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+DEFAULT_CACHE_SIZE = 4096
+VECTORIZE_THRESHOLD = 256
+NUMPY_AVAILABLE = find_spec('numpy') is not None
+
+MODULUS = 11
+MIN_REMAINDER = 2
+ZERO_CODE = ord('0')
+DIGIT_CODES = range(10)
+LETTER_CODES = range(ord('A') - ZERO_CODE, ord('Z') - ZERO_CODE + 1)
+
+
+def mod11_check_digit(total: int, /) -> int:
+    remainder = total % MODULUS
+    return 0 if remainder < MIN_REMAINDER else MODULUS - remainder
+
+
+@dataclass(frozen=True, slots=True)
+class DocumentKind:
+    name: str
+    base_pattern: re.Pattern[str]
+    pattern: re.Pattern[str]
+    first_weights: tuple[int, ...]
+    second_weights: tuple[int, ...]
+    alphanumeric: bool
+
+    @property
+    def base_length(self) -> int:
+        return len(self.first_weights)
+
+    @property
+    def length(self) -> int:
+        return len(self.second_weights) + 1
+
+    def compute_check_digits(self, base: str, /) -> str:
+        values = [ord(char) - ZERO_CODE for char in base]
+        first = mod11_check_digit(sum(map(mul, values, self.first_weights)))
+        values.append(first)
+        second = mod11_check_digit(sum(map(mul, values, self.second_weights)))
+        return f'{first}{second}'
+
+    def check_digits(self, base: str, /) -> str:
+        if self.base_pattern.fullmatch(base) is None:
+            msg = f'Invalid {self.name} base: {base!r}'
+            raise ValueError(msg)
+        return self.compute_check_digits(base)
+
+    def is_valid(self, document: str, /) -> bool:
+        return (
+            self.pattern.fullmatch(document) is not None
+            and document.count(document[0]) != len(document)
+            and self.compute_check_digits(document[: self.base_length]) == document[self.base_length :]
+        )
+
+    def validate_many(self, documents: Sequence[str], /) -> list[bool]:
+        if NUMPY_AVAILABLE and len(documents) >= VECTORIZE_THRESHOLD:
+            valid: list[bool] = self.validate_many_vectorized(documents).tolist()
+            return valid
+        return [self.is_valid(document) for document in documents]
+
+    def validate_many_vectorized(self, documents: Sequence[str], /) -> 'NDArray[np.bool_]':
+        import numpy as np  # noqa: PLC0415
+
+        count, length, base_length = len(documents), self.length, self.base_length
+        lengths = np.fromiter(map(len, documents), dtype=np.intp, count=count)
+        codes = np.array(documents, dtype=f'<U{length}').view(np.uint32).reshape(count, length).astype(np.int64)
+        codes -= ZERO_CODE
+
+        is_digit = (codes >= DIGIT_CODES.start) & (codes < DIGIT_CODES.stop)
+        base = codes[:, :base_length]
+        base_chars = is_digit[:, :base_length]
+        if self.alphanumeric:
+            base_chars = base_chars | ((base >= LETTER_CODES.start) & (base < LETTER_CODES.stop))
+        well_formed = (lengths == length) & base_chars.all(axis=1) & is_digit[:, base_length:].all(axis=1)
+        repeated = (codes == codes[:, :1]).all(axis=1)
+
+        first_remainders = (base @ np.array(self.first_weights, dtype=np.int64)) % MODULUS
+        first = np.where(first_remainders < MIN_REMAINDER, 0, MODULUS - first_remainders)
+        second_totals = base @ np.array(self.second_weights[:-1], dtype=np.int64) + first * self.second_weights[-1]
+        second_remainders = second_totals % MODULUS
+        second = np.where(second_remainders < MIN_REMAINDER, 0, MODULUS - second_remainders)
+
+        valid: NDArray[np.bool_] = (
+            well_formed & ~repeated & (codes[:, base_length] == first) & (codes[:, base_length + 1] == second)
+        )
+        return valid
+
+
+CNPJ = DocumentKind(
+    name='CNPJ',
+    base_pattern=re.compile(r'[0-9A-Z]{12}'),
+    pattern=re.compile(r'[0-9A-Z]{12}[0-9]{2}'),
+    first_weights=(5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2),
+    second_weights=(6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2),
+    alphanumeric=True,
+)
+
+CPF = DocumentKind(
+    name='CPF',
+    base_pattern=re.compile(r'[0-9]{9}'),
+    pattern=re.compile(r'[0-9]{11}'),
+    first_weights=(10, 9, 8, 7, 6, 5, 4, 3, 2),
+    second_weights=(11, 10, 9, 8, 7, 6, 5, 4, 3, 2),
+    alphanumeric=False,
+)
+
+
+@lru_cache(maxsize=DEFAULT_CACHE_SIZE)
+def is_valid_cnpj(document: str, /) -> bool:
+    return CNPJ.is_valid(document)
+
+
+@lru_cache(maxsize=DEFAULT_CACHE_SIZE)
+def is_valid_cpf(document: str, /) -> bool:
+    return CPF.is_valid(document)
+
+
+def cnpj_check_digits(base: str, /) -> str:
+    return CNPJ.check_digits(base)
+
+
+def cpf_check_digits(base: str, /) -> str:
+    return CPF.check_digits(base)
+
+
+def validate_cnpjs(documents: Sequence[str], /) -> list[bool]:
+    return CNPJ.validate_many(documents)
+
+
+def validate_cpfs(documents: Sequence[str], /) -> list[bool]:
+    return CPF.validate_many(documents)
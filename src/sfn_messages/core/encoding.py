@@ -0,0 +1,60 @@
+import codecs
+from collections.abc import Buffer
+
+RSFN_ENCODING = 'utf-16-be'
+
+BYTE_ORDER_MARKS = {
+    'utf-8': codecs.BOM_UTF8,
+    'utf-16-be': codecs.BOM_UTF16_BE,
+    'utf-16-le': codecs.BOM_UTF16_LE,
+}
+
+EXPAT_ENCODINGS = {
+    'utf-8': 'UTF-8',
+    'utf-16': 'UTF-16',
+    'utf-16-be': 'UTF-16BE',
+    'utf-16-le': 'UTF-16LE',
+    'iso8859-1': 'ISO-8859-1',
+    'ascii': 'US-ASCII',
+}
+
+
+def detect_bom(data: Buffer, /) -> tuple[str | None, int]:
+    view = memoryview(data)
+    for encoding, bom in BYTE_ORDER_MARKS.items():
+        if view[: len(bom)] == bom:
+            return encoding, len(bom)
+    return None, 0
+
+
+def detect_utf16(data: Buffer, /) -> str | None:
+    head = bytes(memoryview(data)[:2])
+    if head == b'\x00<':
+        return 'utf-16-be'
+    if head == b'<\x00':
+        return 'utf-16-le'
+    return None
+
+
+def expat_encoding(encoding: str, /) -> str:
+    name = codecs.lookup(encoding).name
+    return EXPAT_ENCODINGS.get(name, name)
+
+
+def strip_bom(data: Buffer, encoding: str | None, /) -> tuple[memoryview, str | None]:
+    view = memoryview(data).cast('B')
+    bom_encoding, bom_size = detect_bom(view)
+    if bom_encoding is None:
+        return view, encoding
+    return view[bom_size:], bom_encoding
+
+
+def byte_order_mark(encoding: str, /) -> bytes:
+    return BYTE_ORDER_MARKS.get(codecs.lookup(encoding).name, b'')
+
+
+def encode_xml(xml: str, /, *, encoding: str = RSFN_ENCODING, bom: bool = False) -> bytes:
+    data = xml.encode(encoding)
+    if not bom:
+        return data
+    return byte_order_mark(encoding) + data
@@ -1,9 +1,23 @@
+from typing import Any
+
+
+def _restore_error[E: BaseException](cls: type[E], state: dict[str, Any]) -> E:
+    error = cls.__new__(cls)
+    error.__dict__.update(state)
+    return error
+
+
+class KeywordArgumentsError(Exception):
+    def __reduce__(self) -> tuple[Any, ...]:
+        return _restore_error, (type(self), self.__dict__)
+
+
 class MessageCodeNotFoundError(Exception):
     def __str__(self) -> str:
         return 'Message code not found in XML'
 
 
-class MessageNotImplementedError(Exception):
+class MessageNotImplementedError(KeywordArgumentsError):
     def __init__(self, *, message_code: str) -> None:
         self.message_code = message_code
 
@@ -11,7 +25,7 @@ class MessageNotImplementedError(Exception):
         return f'Message {self.message_code} not implemented'
 
 
-class BaseTagNameNotFoundInClassError(Exception):
+class BaseTagNameNotFoundInClassError(KeywordArgumentsError):
     def __init__(self, *, cls: type) -> None:
         self.cls = cls
 
@@ -19,7 +33,7 @@ class BaseTagNameNotFoundInClassError(Exception):
         return f'Not found XmlPath annotation in fields of {self.cls}'
 
 
-class InvalidBaseTagNameError(Exception):
+class InvalidBaseTagNameError(KeywordArgumentsError):
     def __init__(self, *, document_tag: str, expected: str) -> None:
         self.document_tag = document_tag
         self.expected = expected
@@ -28,7 +42,7 @@ class InvalidBaseTagNameError(Exception):
         return f'Invalid base tag name in document ({self.document_tag}) expected {self.expected}'
 
 
-class DiffBaseTagNameInFieldError(Exception):
+class DiffBaseTagNameInFieldError(KeywordArgumentsError):
     def __init__(self, *, cls: type, field_name: str) -> None:
         self.cls = cls
         self.field_name = field_name
@@ -37,7 +51,7 @@ class DiffBaseTagNameInFieldError(Exception):
         return f'Diff base tag name in {self.field_name} of {self.cls}'
 
 
-class LocalNameNotSetInFieldError(Exception):
+class LocalNameNotSetInFieldError(KeywordArgumentsError):
     def __init__(self, *, cls: type, field_name: str) -> None:
         self.cls = cls
         self.field_name = field_name
@@ -46,7 +60,7 @@ class LocalNameNotSetInFieldError(Exception):
         return f'Local name not set for value {self.field_name} of {self.cls}'
 
 
-class LocalNameSetInFieldError(Exception):
+class LocalNameSetInFieldError(KeywordArgumentsError):
     def __init__(self, *, cls: type, field_name: str) -> None:
         self.cls = cls
         self.field_name = field_name
@@ -55,10 +69,61 @@ class LocalNameSetInFieldError(Exception):
         return f'Local name set for sub message {self.field_name} of {self.cls}'
 
 
-class InvalidLocalNameInFieldError(Exception):
+class InvalidLocalNameInFieldError(KeywordArgumentsError):
     def __init__(self, *, cls: type, field_name: str) -> None:
         self.cls = cls
         self.field_name = field_name
 
     def __str__(self) -> str:
         return f'Invalid local name in {self.field_name} of {self.cls}'
+
+
+class FieldNotFoundInClassError(KeywordArgumentsError):
+    def __init__(self, *, cls: type, field_name: str) -> None:
+        self.cls = cls
+        self.field_name = field_name
+
+    def __str__(self) -> str:
+        return f'Field {self.field_name} not found in XmlPath fields of {self.cls}'
+
+
+class XmlBackendNotAvailableError(KeywordArgumentsError):
+    def __init__(self, *, name: str) -> None:
+        self.name = name
+
+    def __str__(self) -> str:
+        return f'XML backend {self.name} is not available'
+
+
+class InvalidIspbError(KeywordArgumentsError):
+    def __init__(self, *, ispb: str) -> None:
+        self.ispb = ispb
+
+    def __str__(self) -> str:
+        return f'Invalid ISPB {self.ispb!r}'
+
+
+class SequenceExhaustedError(KeywordArgumentsError):
+    def __init__(self, *, key: str, limit: int) -> None:
+        self.key = key
+        self.limit = limit
+
+    def __str__(self) -> str:
+        return f'Sequence {self.key} exhausted after {self.limit}'
+
+
+class InvalidSystemError(KeywordArgumentsError):
+    def __init__(self, *, system: str) -> None:
+        self.system = system
+
+    def __str__(self) -> str:
+        return f'Invalid system {self.system!r}'
+
+
+class InvalidControlNumberPrefixError(KeywordArgumentsError):
+    def __init__(self, *, system: str, prefix: str) -> None:
+        self.system = system
+        self.prefix = prefix
+
+    def __str__(self) -> str:
+        return f'Invalid control number prefix {self.prefix!r} for system {self.system}'
@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+from functools import lru_cache
+
+from .types import SystemDomain
+from .writer import escape_text, indentation
+
+HEADER_CACHE_SIZE = 4096
+HEADER_TAGS = ('IdentdEmissor', 'IdentdDestinatario', 'DomSist')
+HEADER_LEVEL = 2
+
+_INTERNED_ISPBS: dict[str, str] = {}
+
+
+@dataclass(frozen=True, slots=True)
+class HeaderFragment:
+    from_ispb: str
+    to_ispb: str
+    system_domain: SystemDomain
+    indented: str
+    compact: str
+
+
+@lru_cache(maxsize=HEADER_CACHE_SIZE, typed=True)
+def get_header_fragment(from_ispb: str, to_ispb: str, system_domain: SystemDomain, /) -> HeaderFragment:
+    elements = [
+        f'<{tag}>{escape_text(text)}</{tag}>' if text else f'<{tag} />'
+        for tag, text in zip(HEADER_TAGS, (from_ispb, to_ispb, system_domain.to_xml_value()), strict=True)
+    ]
+    return HeaderFragment(
+        from_ispb=from_ispb,
+        to_ispb=to_ispb,
+        system_domain=system_domain,
+        indented=indentation(HEADER_LEVEL).join(elements),
+        compact=''.join(elements),
+    )
+
+
+def lookup_header_fragment(from_ispb: object, to_ispb: object, system_domain: object, /) -> HeaderFragment | None:
+    if type(from_ispb) is str and type(to_ispb) is str and type(system_domain) is SystemDomain:
+        return get_header_fragment(from_ispb, to_ispb, system_domain)
+    return None
+
+
+def intern_ispb(value: str, /) -> str:
+    interned = _INTERNED_ISPBS.get(value)
+    if interned is not None:
+        return interned
+    if len(_INTERNED_ISPBS) >= HEADER_CACHE_SIZE:
+        return value
+    return _INTERNED_ISPBS.setdefault(value, value)
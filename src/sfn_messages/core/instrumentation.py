@@ -0,0 +1,174 @@
+import statistics
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import StrEnum
+
+DEFAULT_MAX_SAMPLES = 10_000
+UNKNOWN_MESSAGE_CODE = 'unknown'
+
+
+class Phase(StrEnum):
+    PARSE = 'parse'
+    MAP = 'map'
+    VALIDATE = 'validate'
+    SERIALIZE = 'serialize'
+
+
+@dataclass(frozen=True, slots=True)
+class PhaseEvent:
+    phase: Phase
+    message_code: str
+    duration_ns: int
+    payload_size: int | None = None
+    failed: bool = False
+
+
+type PhaseHook = Callable[[PhaseEvent], None]
+
+active_hooks: tuple[PhaseHook, ...] = ()
+_hooks_lock = threading.Lock()
+
+_fallback_counts: dict[tuple[str, str], int] = {}
+_fallback_lock = threading.Lock()
+
+
+def add_hook(hook: PhaseHook, /) -> None:
+    global active_hooks  # noqa: PLW0603
+    with _hooks_lock:
+        active_hooks = (*active_hooks, hook)
+
+
+def remove_hook(hook: PhaseHook, /) -> None:
+    global active_hooks  # noqa: PLW0603
+    with _hooks_lock:
+        hooks = list(active_hooks)
+        hooks.remove(hook)
+        active_hooks = tuple(hooks)
+
+
+@contextmanager
+def instrumented[H: PhaseHook](hook: H, /) -> Iterator[H]:
+    add_hook(hook)
+    try:
+        yield hook
+    finally:
+        remove_hook(hook)
+
+
+def emit(
+    phase: Phase,
+    message_code: str,
+    duration_ns: int,
+    /,
+    *,
+    payload_size: int | None = None,
+    failed: bool = False,
+) -> None:
+    event = PhaseEvent(
+        phase=phase,
+        message_code=message_code,
+        duration_ns=duration_ns,
+        payload_size=payload_size,
+        failed=failed,
+    )
+    for hook in active_hooks:
+        hook(event)
+
+
+@contextmanager
+def measure(phase: Phase, message_code: str, /, *, payload_size: int | None = None) -> Iterator[None]:
+    start = time.perf_counter_ns()
+    failed = True
+    try:
+        yield
+        failed = False
+    finally:
+        emit(phase, message_code, time.perf_counter_ns() - start, payload_size=payload_size, failed=failed)
+
+
+def record_fallback(message_code: str, field_name: str, /) -> None:
+    key = message_code, field_name
+    with _fallback_lock:
+        _fallback_counts[key] = _fallback_counts.get(key, 0) + 1
+
+
+def fallback_counts() -> dict[tuple[str, str], int]:
+    with _fallback_lock:
+        return dict(_fallback_counts)
+
+
+def reset_fallback_counts() -> None:
+    with _fallback_lock:
+        _fallback_counts.clear()
+
+
+@dataclass(frozen=True, slots=True)
+class PhaseStatistics:
+    message_code: str
+    phase: Phase
+    count: int
+    total_ns: int
+    p50_ns: float
+    p90_ns: float
+    p99_ns: float
+    failures: int = 0
+
+
+class PhaseAggregator:
+    def __init__(self, *, max_samples: int = DEFAULT_MAX_SAMPLES) -> None:
+        self.max_samples = max_samples
+        self._counts: dict[tuple[str, Phase], int] = {}
+        self._totals: dict[tuple[str, Phase], int] = {}
+        self._failures: dict[tuple[str, Phase], int] = {}
+        self._samples: dict[tuple[str, Phase], deque[int]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: PhaseEvent, /) -> None:
+        key = event.message_code, event.phase
+        with self._lock:
+            self._counts[key] = self._counts.get(key, 0) + 1
+            self._totals[key] = self._totals.get(key, 0) + event.duration_ns
+            if event.failed:
+                self._failures[key] = self._failures.get(key, 0) + 1
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self.max_samples)
+            samples.append(event.duration_ns)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+            self._totals.clear()
+            self._failures.clear()
+            self._samples.clear()
+
+    def report(self) -> list[PhaseStatistics]:
+        with self._lock:
+            snapshot = [
+                (key, self._counts[key], self._totals[key], self._failures.get(key, 0), list(self._samples[key]))
+                for key in self._counts
+            ]
+        report: list[PhaseStatistics] = []
+        for (message_code, phase), count, total_ns, failures, samples in sorted(snapshot):
+            if len(samples) > 1:
+                percentiles = statistics.quantiles(samples, n=100, method='inclusive')
+                p50, p90, p99 = percentiles[49], percentiles[89], percentiles[98]
+            else:
+                p50 = p90 = p99 = float(samples[0])
+            report.append(
+                PhaseStatistics(
+                    message_code=message_code,
+                    phase=phase,
+                    count=count,
+                    total_ns=total_ns,
+                    p50_ns=p50,
+                    p90_ns=p90,
+                    p99_ns=p99,
+                    failures=failures,
+                )
+            )
+        return report
@@ -0,0 +1,131 @@
+import threading
+from collections.abc import Buffer
+from typing import Any, Self
+
+from pydantic import BaseModel, ConfigDict
+
+from .backends import XmlBackend
+from .models import BaseMessage
+from .registry import MESSAGE_REGISTRY
+from .sniffer import MessageHeader, sniff_header
+from .types import ContinuationIndicator, Ispb, OperationNumber, SystemDomain
+
+
+class LazyMessageHeader(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    message_code: str
+    from_ispb: Ispb
+    to_ispb: Ispb
+    system_domain: SystemDomain
+    operation_number: OperationNumber
+    sequence_number: int | None = None
+    continuation_indicator: ContinuationIndicator | None = None
+
+    @classmethod
+    def from_sniffed(cls, header: MessageHeader, /) -> Self:
+        return cls(
+            message_code=header.message_code,
+            from_ispb=header.from_ispb,
+            to_ispb=header.to_ispb,
+            system_domain=header.system_domain,
+            operation_number=header.operation_number,
+            sequence_number=header.sequence_number,
+            continuation_indicator=header.continuation_indicator,
+        )
+
+
+class LazyMessage:
+    __slots__ = ('_lock', '_message', 'backend', 'encoding', 'header', 'message_class', 'raw', 'trusted')
+
+    def __init__(
+        self,
+        raw: str | Buffer,
+        header: LazyMessageHeader,
+        /,
+        *,
+        encoding: str | None = None,
+        backend: str | XmlBackend | None = None,
+        trusted: bool = False,
+    ) -> None:
+        self.raw = raw
+        self.header = header
+        self.message_class: type[BaseMessage] = MESSAGE_REGISTRY.get(header.message_code)
+        self.encoding = encoding
+        self.backend = backend
+        self.trusted = trusted
+        self._message: BaseMessage | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_xml(cls, xml: str, /, *, backend: str | XmlBackend | None = None, trusted: bool = False) -> Self:
+        header = LazyMessageHeader.from_sniffed(sniff_header(xml))
+        return cls(xml, header, backend=backend, trusted=trusted)
+
+    @classmethod
+    def from_xml_bytes(
+        cls,
+        data: Buffer,
+        /,
+        *,
+        encoding: str | None = None,
+        backend: str | XmlBackend | None = None,
+        trusted: bool = False,
+    ) -> Self:
+        header = LazyMessageHeader.from_sniffed(sniff_header(data, encoding=encoding))
+        return cls(data, header, encoding=encoding, backend=backend, trusted=trusted)
+
+    @property
+    def message_code(self) -> str:
+        return self.header.message_code
+
+    @property
+    def from_ispb(self) -> str:
+        return self.header.from_ispb
+
+    @property
+    def to_ispb(self) -> str:
+        return self.header.to_ispb
+
+    @property
+    def system_domain(self) -> SystemDomain:
+        return self.header.system_domain
+
+    @property
+    def operation_number(self) -> str:
+        return self.header.operation_number
+
+    @property
+    def sequence_number(self) -> int | None:
+        return self.header.sequence_number
+
+    @property
+    def continuation_indicator(self) -> ContinuationIndicator | None:
+        return self.header.continuation_indicator
+
+    @property
+    def is_materialized(self) -> bool:
+        return self._message is not None
+
+    def materialize(self) -> BaseMessage:
+        message = self._message
+        if message is not None:
+            return message
+        with self._lock:
+            if self._message is None:
+                raw = self.raw
+                if isinstance(raw, str):
+                    self._message = self.message_class.from_xml(raw, backend=self.backend, trusted=self.trusted)
+                else:
+                    self._message = self.message_class.from_xml_bytes(
+                        raw, encoding=self.encoding, backend=self.backend, trusted=self.trusted
+                    )
+            return self._message
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.materialize(), name)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.message_code!r}, materialized={self.is_materialized})'
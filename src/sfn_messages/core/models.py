@@ -1,31 +1,65 @@
+import sys
 from abc import ABC, abstractmethod
-from collections.abc import Iterable, Iterator
+from collections.abc import Buffer, Callable, Generator, Iterable, Iterator, Mapping
 from contextlib import suppress
 from dataclasses import dataclass
-from datetime import datetime
-from types import GenericAlias, UnionType
-from typing import Annotated, Any, ClassVar, Self, TypedDict, Union, get_args, get_origin
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import StrEnum
+from functools import lru_cache, partial
+from io import BytesIO
+from os import PathLike
+from time import perf_counter_ns
+from types import GenericAlias, MappingProxyType, UnionType
+from typing import (
+    IO,
+    Annotated,
+    Any,
+    ClassVar,
+    Literal,
+    Self,
+    TypeAliasType,
+    TypedDict,
+    TypeGuard,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+)
 from xml.etree import ElementTree as ET
 
-from defusedxml.ElementTree import fromstring
-from pydantic import BaseModel
+from pydantic import AfterValidator, BaseModel, create_model
 
+from . import instrumentation
+from .backends import XmlBackend, get_xml_backend
+from .caching import class_cache
 from .code_description import ERROR_CODE_DESCRIPTIONS
+from .encoding import RSFN_ENCODING, encode_xml
 from .errors import (
     BaseTagNameNotFoundInClassError,
     DiffBaseTagNameInFieldError,
+    FieldNotFoundInClassError,
     InvalidBaseTagNameError,
     InvalidLocalNameInFieldError,
     LocalNameNotSetInFieldError,
     LocalNameSetInFieldError,
 )
+from .headers import HEADER_LEVEL, HEADER_TAGS, intern_ispb, lookup_header_fragment
+from .instrumentation import Phase
+from .sniffer import sniff_fields
 from .types import (
     ContinuationIndicator,
+    EnumMixin,
     Ispb,
     MappableToXmlValue,
     OperationNumber,
     SystemDomain,
 )
+from .writer import XML_DECLARATION, XmlNode, XmlWriter, escape_attribute, escape_text, indentation
+
+EXTRACTION_PLAN_CACHE_SIZE = 1024
+
+_MAPPABLE_TYPES: dict[type, bool] = {}
 
 
 @dataclass(frozen=True)
@@ -39,6 +73,343 @@ class XmlPath:
         return p, None
 
 
+class XmlFieldKind(StrEnum):
+    TEXT = 'text'
+    ATTRIBUTE = 'attribute'
+    SUBMESSAGE = 'submessage'
+    LIST = 'list'
+    INVALID = 'invalid'
+
+
+type XmlFieldParser = Callable[[str | ET.Element], object]
+type XmlTrustedFieldParser = Callable[[str | ET.Element | None], object]
+type XmlFieldDecoder = Callable[[str | ET.Element], object | None]
+type XmlFieldConstructor = Callable[[object], object]
+
+TRUSTED_SCALAR_PARSERS: Mapping[type, Callable[[str], object]] = MappingProxyType(
+    {
+        int: int,
+        Decimal: Decimal,
+        date: date.fromisoformat,
+        datetime: datetime.fromisoformat,
+        time: time.fromisoformat,
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
+class XmlFieldPlan:
+    name: str
+    kind: XmlFieldKind
+    root_name: str
+    path_names: tuple[str, ...]
+    qnames: tuple[str, ...]
+    node_keys: tuple[tuple[str, ...], ...]
+    local_name: str | None
+    attribute_name: str | None
+    message_class: type['XmlSerializerMixin'] | None
+    parse: XmlFieldParser
+    parse_trusted: XmlTrustedFieldParser
+    construct: XmlFieldConstructor
+
+
+@dataclass(frozen=True, slots=True)
+class XmlPathTrieNode:
+    fields: list[XmlFieldPlan]
+    children: dict[str, 'XmlPathTrieNode']
+
+    @staticmethod
+    def build(fields: Iterable[XmlFieldPlan]) -> 'XmlPathTrieNode':
+        root = XmlPathTrieNode(fields=[], children={})
+        for field in fields:
+            node = root
+            for path_name in field.path_names:
+                child = node.children.get(path_name)
+                if child is None:
+                    child = node.children[path_name] = XmlPathTrieNode(fields=[], children={})
+                node = child
+            node.fields.append(field)
+        return root
+
+
+@dataclass(frozen=True, slots=True)
+class XmlCodecPlan:
+    namespace: str | None
+    fields: tuple[XmlFieldPlan, ...]
+    fields_by_name: Mapping[str, XmlFieldPlan]
+    root_names: tuple[str, ...]
+    trie: XmlPathTrieNode
+
+
+@dataclass(frozen=True, slots=True)
+class XmlExtractionPlan:
+    codec_plan: XmlCodecPlan
+    model: type[BaseModel]
+    streamable: bool
+    text_paths: Mapping[tuple[str, ...], str]
+    attribute_paths: Mapping[tuple[str, ...], Mapping[str, str]]
+
+
+class _TemplateMismatch(Exception):  # noqa: N818
+    pass
+
+
+def _starts_with_header(children: list['XmlTemplateNode | int'], header_fields: tuple[int, ...] | None) -> bool:
+    """Tell whether the leading children are the header leaves bound to ``header_fields``."""
+    if header_fields is None:
+        return False
+    leading = [
+        (child.start, child.leaf_field) for child in children[: len(HEADER_TAGS)] if isinstance(child, XmlTemplateNode)
+    ]
+    return leading == [(f'<{tag}', index) for tag, index in zip(HEADER_TAGS, header_fields, strict=False)]
+
+
+@dataclass(slots=True)
+class _XmlTemplateBuilder:
+    qname: str
+    field_indices: list[int]
+    text_fields: list[int]
+    attribute_fields: dict[str, list[int]]
+    children: list['_XmlTemplateBuilder | int']
+
+    def build(
+        self, namespace: str | None, header_fields: tuple[int, ...] | None = None, depth: int = 0
+    ) -> 'XmlTemplateNode':
+        children: list[XmlTemplateNode | int] = []
+        fragment_guard: set[str] = set()
+        has_fragment = False
+        last_index = -1
+        for child in self.children:
+            if isinstance(child, int):
+                first_index = end_index = child
+                has_fragment = True
+                children.append(child)
+            else:
+                first_index, end_index = min(child.field_indices), max(child.field_indices)
+                if has_fragment:
+                    fragment_guard.add(child.qname)
+                children.append(child.build(namespace, header_fields, depth + 1))
+            if first_index < last_index:
+                raise _TemplateMismatch
+            last_index = max(last_index, end_index)
+
+        uri, _, local_name = self.qname[1:].rpartition('}') if self.qname[:1] == '{' else ('', '', self.qname)
+        if uri and uri != namespace:
+            raise _TemplateMismatch
+        if depth != HEADER_LEVEL - 1 or not _starts_with_header(children, header_fields):
+            header_fields = None
+        return XmlTemplateNode(
+            start=f'<{local_name}',
+            end=f'</{local_name}>',
+            field_indices=tuple(self.field_indices),
+            text_fields=tuple(self.text_fields),
+            attribute_fields=tuple((name, tuple(indices)) for name, indices in self.attribute_fields.items()),
+            children=tuple(children),
+            fragment_guard=frozenset(fragment_guard),
+            leaf_field=self.text_fields[0]
+            if len(self.text_fields) == 1 and not self.attribute_fields and not children
+            else None,
+            header_fields=header_fields,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class XmlTemplateNode:
+    start: str
+    end: str
+    field_indices: tuple[int, ...]
+    text_fields: tuple[int, ...]
+    attribute_fields: tuple[tuple[str, tuple[int, ...]], ...]
+    children: tuple['XmlTemplateNode | int', ...]
+    fragment_guard: frozenset[str]
+    leaf_field: int | None
+    header_fields: tuple[int, ...] | None
+
+
+@dataclass(frozen=True, slots=True)
+class XmlTemplate:
+    message_class: type['XmlSerializerMixin']
+    namespace: str | None
+    qname: str
+    declarations: str
+    field_names: tuple[str, ...]
+    root: XmlTemplateNode | None
+    format_value: Callable[[object], str | XmlNode | ET.Element | list[XmlNode | ET.Element]]
+    format_node: Callable[[object], XmlNode | ET.Element]
+
+    @property
+    def is_static(self) -> bool:
+        return self.root is not None
+
+    def render(self, message: 'XmlSerializerMixin', /, *, indent: bool = True) -> str:
+        if not instrumentation.active_hooks:
+            return self._render(message, indent=indent)
+        start = perf_counter_ns()
+        xml = self._render(message, indent=indent)
+        instrumentation.emit(
+            Phase.SERIALIZE,
+            type(message).__name__,
+            perf_counter_ns() - start,
+            payload_size=len(xml),
+        )
+        return xml
+
+    def render_bytes(
+        self,
+        message: 'XmlSerializerMixin',
+        /,
+        *,
+        encoding: str = RSFN_ENCODING,
+        bom: bool = False,
+        indent: bool = True,
+    ) -> bytes:
+        return encode_xml(self.render(message, indent=indent), encoding=encoding, bom=bom)
+
+    def dump(
+        self,
+        message: 'XmlSerializerMixin',
+        sink: IO[str] | IO[bytes],
+        /,
+        *,
+        encoding: str | None = None,
+        bom: bool = False,
+        indent: bool = True,
+    ) -> None:
+        if self.root is None or type(message) is not self.message_class:
+            writer = XmlWriter(default_namespace=self.namespace, indent=indent)
+            writer.dump(message.to_xml_node(), sink, encoding=encoding, bom=bom)
+            return
+        xml = self._render(message, indent=indent)
+        if encoding is None:
+            cast('IO[str]', sink).write(xml)
+        else:
+            cast('IO[bytes]', sink).write(encode_xml(xml, encoding=encoding, bom=bom))
+
+    def _render(self, message: 'XmlSerializerMixin', *, indent: bool) -> str:
+        if self.root is not None and type(message) is self.message_class:
+            parts = [XML_DECLARATION]
+            with suppress(_TemplateMismatch):
+                self._write(message, parts, 0, indent=indent, namespace=self.namespace, declarations=self.declarations)
+                return ''.join(parts)
+        return XmlWriter(default_namespace=self.namespace, indent=indent).dumps(message.to_xml_node())
+
+    def _write(  # noqa: PLR0913
+        self,
+        message: 'XmlSerializerMixin',
+        parts: list[str],
+        level: int,
+        *,
+        indent: bool,
+        namespace: str | None,
+        declarations: str = '',
+    ) -> None:
+        values = [getattr(message, name) for name in self.field_names]
+        self._write_node(cast('XmlTemplateNode', self.root), values, parts, level, indent, namespace, declarations)
+
+    def _write_node(  # noqa: C901, PLR0912, PLR0913
+        self,
+        node: XmlTemplateNode,
+        values: list[Any],
+        parts: list[str],
+        level: int,
+        indent: bool,  # noqa: FBT001
+        namespace: str | None,
+        declarations: str = '',
+    ) -> None:
+        parts.append(node.start + declarations)
+        for attribute_name, indices in node.attribute_fields:
+            value = self._format_text(values, indices)
+            if value is not None:
+                parts.append(f' {attribute_name}="{escape_attribute(value)}"')
+        text = self._format_text(values, node.text_fields) if node.text_fields else None
+
+        children: list[str | XmlTemplateNode | XmlSerializerMixin | XmlNode | ET.Element] = []
+        node_children = node.children
+        if node.header_fields is not None and (
+            header := lookup_header_fragment(*(values[index] for index in node.header_fields))
+        ):
+            children.append(header.indented if indent else header.compact)
+            node_children = node_children[len(HEADER_TAGS) :]
+        for child in node_children:
+            if isinstance(child, XmlTemplateNode):
+                if child.leaf_field is not None:
+                    if values[child.leaf_field] is not None:
+                        leaf_text = self._format_text(values, (child.leaf_field,))
+                        children.append(
+                            f'{child.start}>{escape_text(leaf_text)}{child.end}' if leaf_text else f'{child.start} />'
+                        )
+                elif any(values[index] is not None for index in child.field_indices):
+                    children.append(child)
+            elif (value := values[child]) is not None:
+                self._collect_fragments(value, children, node.fragment_guard)
+
+        if not children:
+            parts.append(f'>{escape_text(text)}{node.end}' if text else ' />')
+            return
+
+        parts.append('>')
+        child_indentation = indentation(level + 1)
+        if indent:
+            parts.append(escape_text(text) if text and text.strip() else child_indentation)
+        elif text:
+            parts.append(escape_text(text))
+        last = len(children) - 1
+        for index, item in enumerate(children):
+            if isinstance(item, str):
+                parts.append(item)
+            elif isinstance(item, XmlTemplateNode):
+                self._write_node(item, values, parts, level + 1, indent, namespace)
+            elif isinstance(item, XmlSerializerMixin) and (template := item.compile_template()).is_static:
+                if template.declarations:
+                    raise _TemplateMismatch
+                template._write(item, parts, level + 1, indent=indent, namespace=namespace)  # noqa: SLF001
+            else:
+                writer = XmlWriter(default_namespace=namespace, indent=indent)
+                element = item.to_xml_node() if isinstance(item, XmlSerializerMixin) else item
+                parts.append(writer.dumps_fragment(element, level=level + 1))
+                if any(writer.namespaces.values()):
+                    raise _TemplateMismatch
+            if indent:
+                parts.append(child_indentation if index < last else indentation(level))
+        parts.append(node.end)
+
+    def _format_text(self, values: list[Any], indices: tuple[int, ...]) -> str | None:
+        text: str | None = None
+        for index in indices:
+            value = values[index]
+            if type(value) is str:
+                text = value
+            elif value is not None:
+                formatted = self.format_value(value)
+                if not isinstance(formatted, str):
+                    raise _TemplateMismatch
+                text = formatted
+        return text
+
+    def _collect_fragments(
+        self,
+        value: object,
+        children: list['str | XmlTemplateNode | XmlSerializerMixin | XmlNode | ET.Element'],
+        fragment_guard: frozenset[str],
+    ) -> None:
+        fragments: list[XmlSerializerMixin | XmlNode | ET.Element]
+        if isinstance(value, list):
+            fragments = [item if isinstance(item, XmlSerializerMixin) else self.format_node(item) for item in value]
+        elif isinstance(value, XmlSerializerMixin):
+            fragments = [value]
+        else:
+            formatted = self.format_value(value)
+            if isinstance(formatted, str):
+                raise _TemplateMismatch
+            fragments = list(formatted) if isinstance(formatted, list) else [formatted]
+        if fragment_guard:
+            for fragment in fragments:
+                tag = fragment.compile_template().qname if isinstance(fragment, XmlSerializerMixin) else fragment.tag
+                if tag in fragment_guard:
+                    raise _TemplateMismatch
+        children.extend(fragments)
+
+
 class XmlSerializerMixin(ABC, BaseModel):
     XML_NAMESPACE: ClassVar[str | None] = None
 
@@ -69,28 +440,271 @@ class XmlSerializerMixin(ABC, BaseModel):
         )
 
     @classmethod
-    def _ensure_root_tag(cls, xml_value: ET.Element, expected_root: str) -> None:
-        if cls._local_name(xml_value.tag) != expected_root:
-            raise InvalidBaseTagNameError(
-                document_tag=xml_value.tag,
-                expected=expected_root,
-            )
+    @class_cache
+    def get_xml_codec_plan(cls) -> XmlCodecPlan:
+        fields = tuple(
+            cls._compile_field_plan(field_name, xml_path) for field_name, xml_path in cls._iter_xmlpath_fields()
+        )
+        return XmlCodecPlan(
+            namespace=cls.get_xml_namespace(),
+            fields=fields,
+            fields_by_name=MappingProxyType({field.name: field for field in fields}),
+            root_names=tuple(dict.fromkeys(field.root_name for field in fields)),
+            trie=XmlPathTrieNode.build(fields),
+        )
 
     @classmethod
-    def _find_child_by_local_name(cls, parent: ET.Element, name: str) -> ET.Element | None:
-        for child in parent:
-            if cls._local_name(child.tag) == name:
-                return child
-        return None
+    @class_cache
+    def compile_template(cls) -> XmlTemplate:
+        plan = cls.get_xml_codec_plan()
+        namespace = cls.get_xml_namespace()
+        base_tag_name = cls.get_base_tag_name()
+        qname = cls._qname(base_tag_name)
+
+        indices = {field.name: index for index, field in enumerate(plan.fields)}
+        header_fields = tuple(indices.get(name, -1) for name in ('from_ispb', 'to_ispb', 'system_domain'))
+
+        root: XmlTemplateNode | None = None
+        with suppress(_TemplateMismatch):
+            root = cls._compile_template_root(plan, base_tag_name, qname).build(namespace, header_fields)
+        return XmlTemplate(
+            message_class=cls,
+            namespace=namespace,
+            qname=qname,
+            declarations=f' xmlns="{escape_attribute(namespace)}"' if namespace else '',
+            field_names=tuple(field.name for field in plan.fields),
+            root=root,
+            format_value=cls._format_field_value,
+            format_node=cls._format_xml_node,
+        )
+
+    @staticmethod
+    def _compile_template_root(plan: XmlCodecPlan, base_tag_name: str, qname: str) -> _XmlTemplateBuilder:
+        root = _XmlTemplateBuilder(qname, [], [], {}, [])
+        builders: dict[tuple[str, ...], _XmlTemplateBuilder] = {}
+        for index, field in enumerate(plan.fields):
+            if field.root_name != base_tag_name or field.kind is XmlFieldKind.INVALID:
+                raise _TemplateMismatch
+            root.field_indices.append(index)
+            pointer = root
+            for field_qname, key in zip(field.qnames, field.node_keys, strict=True):
+                builder = builders.get(key)
+                if builder is None:
+                    builder = builders[key] = _XmlTemplateBuilder(field_qname, [], [], {}, [])
+                    pointer.children.append(builder)
+                builder.field_indices.append(index)
+                pointer = builder
+
+            if field.kind is XmlFieldKind.TEXT:
+                pointer.text_fields.append(index)
+            elif field.kind is XmlFieldKind.ATTRIBUTE:
+                pointer.attribute_fields.setdefault(cast('str', field.attribute_name), []).append(index)
+            else:
+                pointer.children.append(index)
+        return root
+
+    @classmethod
+    @lru_cache(maxsize=EXTRACTION_PLAN_CACHE_SIZE)
+    def get_xml_extraction_plan(cls, fields: tuple[str, ...], /) -> XmlExtractionPlan:
+        codec_plan = cls.get_xml_codec_plan()
+        selected: list[XmlFieldPlan] = []
+        for field_name in fields:
+            field = codec_plan.fields_by_name.get(field_name)
+            if field is None:
+                raise FieldNotFoundInClassError(cls=cls, field_name=field_name)
+            selected.append(field)
+
+        model_fields = cls.model_fields
+        model: type[BaseModel] = create_model(  # type: ignore[call-overload]
+            f'{cls.__name__}Fields',
+            **{field.name: (model_fields[field.name].annotation, model_fields[field.name]) for field in selected},
+        )
+        text_paths: dict[tuple[str, ...], str] = {}
+        attribute_paths: dict[tuple[str, ...], dict[str, str]] = {}
+        for field in selected:
+            key = (field.root_name, *field.path_names)
+            if field.kind is XmlFieldKind.TEXT:
+                text_paths[key] = field.name
+            elif field.kind is XmlFieldKind.ATTRIBUTE:
+                attribute_paths.setdefault(key, {})[cast('str', field.attribute_name)] = field.name
+        return XmlExtractionPlan(
+            codec_plan=XmlCodecPlan(
+                namespace=codec_plan.namespace,
+                fields=tuple(selected),
+                fields_by_name=MappingProxyType({field.name: field for field in selected}),
+                root_names=tuple(dict.fromkeys(field.root_name for field in selected)),
+                trie=XmlPathTrieNode.build(selected),
+            ),
+            model=model,
+            streamable=len({field.root_name for field in selected}) == 1
+            and len(text_paths) + sum(map(len, attribute_paths.values())) == len(selected),
+            text_paths=MappingProxyType(text_paths),
+            attribute_paths=MappingProxyType(
+                {key: MappingProxyType(attributes) for key, attributes in attribute_paths.items()}
+            ),
+        )
 
     @classmethod
-    def _resolve_pointer(cls, xml_value: ET.Element, path_names: list[str]) -> ET.Element | None:
-        pointer: ET.Element | None = xml_value
-        for path_name in path_names:
-            if pointer is None:
-                break
-            pointer = cls._find_child_by_local_name(pointer, path_name)
-        return pointer
+    def _compile_field_plan(cls, field_name: str, xml_path: XmlPath) -> XmlFieldPlan:  # noqa: C901, PLR0912
+        [root_name, *path_names], local_name = xml_path.parts()
+        annotation = cls.__pydantic_fields__[field_name].annotation
+
+        decoders: list[XmlFieldDecoder] = []
+        trusted_decoders: list[XmlFieldDecoder] = []
+        fallback_parsers: list[XmlFieldDecoder] = []
+        constructors: list[XmlFieldConstructor] = []
+        message_class: type[XmlSerializerMixin] | None = None
+        is_list = False
+        for klass in cls._iter_annotation_classes(annotation):
+            if cls._is_mappable_class(klass):
+                if issubclass(klass, XmlSerializerMixin):
+                    decoders.append(partial(cls._decode_submessage, klass))
+                    trusted_decoders.append(partial(cls._parse_trusted_submessage, klass))
+                    constructors.append(partial(cls._construct_submessage, klass))
+                    if message_class is None:
+                        message_class = klass
+                else:
+                    if issubclass(klass, EnumMixin):
+                        decoder = partial(cls._decode_enum, klass.lookup_xml_value)
+                        decoders.append(decoder)
+                        trusted_decoders.append(decoder)
+                    fallback_parsers.append(partial(cls._parse_mappable_class, klass))
+                    constructors.append(partial(cls._construct_mappable, klass))
+            elif (item_class := cls._get_list_item_class(klass)) is not None:
+                decoders.append(partial(cls._parse_list_of_submessages, item_class))
+                trusted_decoders.append(partial(cls._parse_list_of_submessages, item_class, trusted=True))
+                constructors.append(partial(cls._construct_list_of_submessages, item_class))
+                if not is_list:
+                    message_class = item_class
+                    is_list = True
+            elif (scalar_type := cls._get_scalar_type(klass)) is not None:
+                scalar_parser = TRUSTED_SCALAR_PARSERS[scalar_type]
+                trusted_decoders.append(partial(cls._parse_trusted_scalar, scalar_parser))
+                constructors.append(partial(cls._construct_scalar, scalar_type, scalar_parser))
+
+        attribute_name: str | None = None
+        if local_name is None:
+            kind = XmlFieldKind.LIST if is_list else XmlFieldKind.SUBMESSAGE
+        elif local_name == 'text()':
+            kind = XmlFieldKind.TEXT
+        elif local_name.startswith('@'):
+            kind = XmlFieldKind.ATTRIBUTE
+            attribute_name = sys.intern(local_name[1:])
+        else:
+            kind = XmlFieldKind.INVALID
+
+        qnames = tuple(sys.intern(cls._qname(path_name)) for path_name in path_names)
+        return XmlFieldPlan(
+            name=field_name,
+            kind=kind,
+            root_name=sys.intern(root_name),
+            path_names=tuple(sys.intern(path_name) for path_name in path_names),
+            qnames=qnames,
+            node_keys=tuple(qnames[:index] for index in range(1, len(qnames) + 1)),
+            local_name=local_name,
+            attribute_name=attribute_name,
+            message_class=message_class if local_name is None else None,
+            parse=cls._compile_field_parser(field_name, decoders, fallback_parsers),
+            parse_trusted=cls._compile_trusted_field_parser(field_name, trusted_decoders, fallback_parsers),
+            construct=cls._compile_field_constructor(constructors),
+        )
+
+    @classmethod
+    def _compile_field_decoder(
+        cls, field_name: str, decoders: list[XmlFieldDecoder], fallback_parsers: list[XmlFieldDecoder]
+    ) -> XmlFieldDecoder:
+        message_code = cls.__name__
+
+        def fallback(xml_value: str | ET.Element) -> object | None:
+            if instrumentation.active_hooks:
+                instrumentation.record_fallback(message_code, field_name)
+            for parser in fallback_parsers:
+                parsed = parser(xml_value)
+                if parsed is not None:
+                    return parsed
+            return None
+
+        if not decoders:
+            return fallback
+
+        def decode(xml_value: str | ET.Element) -> object | None:
+            for decoder in decoders:
+                decoded = decoder(xml_value)
+                if decoded is not None:
+                    return decoded
+            return fallback(xml_value) if fallback_parsers else None
+
+        return decode
+
+    @classmethod
+    def _compile_field_parser(
+        cls, field_name: str, decoders: list[XmlFieldDecoder], fallback_parsers: list[XmlFieldDecoder]
+    ) -> XmlFieldParser:
+        if not decoders and not fallback_parsers:
+            return str
+
+        decode = cls._compile_field_decoder(field_name, decoders, fallback_parsers)
+
+        def parse(xml_value: str | ET.Element) -> object:
+            decoded = decode(xml_value)
+            return str(xml_value) if decoded is None else decoded
+
+        return parse
+
+    @classmethod
+    def _compile_trusted_field_parser(
+        cls, field_name: str, decoders: list[XmlFieldDecoder], fallback_parsers: list[XmlFieldDecoder]
+    ) -> XmlTrustedFieldParser:
+        if not decoders and not fallback_parsers:
+            return lambda xml_value: xml_value
+
+        decode = cls._compile_field_decoder(field_name, decoders, fallback_parsers)
+
+        def parse(xml_value: str | ET.Element | None) -> object:
+            if xml_value is None:
+                return None
+            decoded = decode(xml_value)
+            return xml_value if decoded is None else decoded
+
+        return parse
+
+    @staticmethod
+    def _compile_field_constructor(constructors: list[XmlFieldConstructor]) -> XmlFieldConstructor:
+        def construct(value: object) -> object:
+            if value is None:
+                return None
+            for constructor in constructors:
+                constructed = constructor(value)
+                if constructed is not None:
+                    return constructed
+            return value
+
+        return construct
+
+    @classmethod
+    def _collect_values(
+        cls,
+        pointer: ET.Element,
+        node: XmlPathTrieNode,
+        values: dict[str, str | ET.Element | None],
+    ) -> None:
+        for field in node.fields:
+            raw_value = cls._extract_value_from_pointer(pointer, field.local_name)
+            if raw_value is None and field.kind in (XmlFieldKind.ATTRIBUTE, XmlFieldKind.INVALID):
+                continue
+            values[field.name] = raw_value
+
+        if not node.children:
+            return
+
+        pending = set(node.children)
+        for child in pointer:
+            name = cls._local_name(child.tag)
+            if name in pending:
+                pending.remove(name)
+                cls._collect_values(child, node.children[name], values)
+                if not pending:
+                    break
 
     @staticmethod
     def _extract_value_from_pointer(
@@ -110,180 +724,354 @@ class XmlSerializerMixin(ABC, BaseModel):
     def get_base_tag_name(cls) -> str:
         raise NotImplementedError
 
-    def to_xml_value(self) -> ET.Element:  # noqa: C901, PLR0912
-        fields = (
-            (field_name, getattr(self, field_name), metadata)
-            for field_name, field_info in self.__class__.model_fields.items()
-            for metadata in field_info.metadata
-            if isinstance(metadata, XmlPath) and getattr(self, field_name) is not None
-        )
+    def to_xml_value(self, *, backend: str | XmlBackend | None = None) -> ET.Element:
+        return self.to_xml_node().to_element(get_xml_backend(backend).make_element)
 
-        root = ET.Element(self._qname(self.get_base_tag_name()))
+    def to_xml_node(self) -> XmlNode:  # noqa: C901, PLR0912
+        plan = self.get_xml_codec_plan()
+        base_tag_name = self.get_base_tag_name()
 
-        for field_name, field_value, xml_path in fields:
-            pointer = root
-            [root_name, *path_names], local_name = xml_path.parts()
+        root = XmlNode(self._qname(base_tag_name))
+        nodes: dict[tuple[str, ...], XmlNode | ET.Element] = {}
+
+        for field in plan.fields:
+            field_value = getattr(self, field.name)
+            if field_value is None:
+                continue
 
-            if self._local_name(pointer.tag) != root_name:
-                raise DiffBaseTagNameInFieldError(cls=self.__class__, field_name=field_name)
+            if field.root_name != base_tag_name:
+                raise DiffBaseTagNameInFieldError(cls=self.__class__, field_name=field.name)
 
-            for path_name in path_names:
-                qname = self._qname(path_name)
-                new_pointer = pointer.find(qname)
+            pointer: XmlNode | ET.Element = root
+            for qname, key in zip(field.qnames, field.node_keys, strict=True):
+                new_pointer = nodes.get(key)
                 if new_pointer is None:
-                    new_pointer = ET.SubElement(pointer, qname)
+                    new_pointer = pointer.find(qname)
+                    if new_pointer is None:
+                        new_pointer = self._append_xml_node(pointer, XmlNode(qname))
+                    nodes[key] = new_pointer
                 pointer = new_pointer
 
             value = self._format_field_value(field_value)
 
             if isinstance(value, str):
-                if local_name is None:
-                    raise LocalNameNotSetInFieldError(cls=self.__class__, field_name=field_name)
-                if local_name == 'text()':
+                if field.kind is XmlFieldKind.TEXT:
                     pointer.text = value
-                elif local_name.startswith('@'):
-                    pointer.attrib[local_name[1:]] = value
+                elif field.kind is XmlFieldKind.ATTRIBUTE:
+                    pointer.attrib[cast('str', field.attribute_name)] = value
+                elif field.local_name is None:
+                    raise LocalNameNotSetInFieldError(cls=self.__class__, field_name=field.name)
                 else:
-                    raise InvalidLocalNameInFieldError(cls=self.__class__, field_name=field_name)
-            elif local_name is None:
+                    raise InvalidLocalNameInFieldError(cls=self.__class__, field_name=field.name)
+            elif field.local_name is None:
                 if not isinstance(value, list):
                     value = [value]
                 for element in value:
-                    pointer.append(element)
+                    self._append_xml_node(pointer, element)
             else:
-                raise LocalNameSetInFieldError(cls=self.__class__, field_name=field_name)
+                raise LocalNameSetInFieldError(cls=self.__class__, field_name=field.name)
 
         return root
 
     @staticmethod
-    def _format_field_value(field_value: object, /) -> str | ET.Element | list[ET.Element]:
+    def _append_xml_node(parent: XmlNode | ET.Element, child: XmlNode | ET.Element) -> XmlNode | ET.Element:
+        if isinstance(parent, XmlNode):
+            parent.append(child)
+            return child
+        element = child.to_element() if isinstance(child, XmlNode) else child
+        parent.append(element)
+        return element
+
+    @staticmethod
+    def _format_xml_node(value: object, /) -> XmlNode | ET.Element:
+        if isinstance(value, XmlSerializerMixin):
+            return value.to_xml_node()
+        return cast('ET.Element', cast('MappableToXmlValue', value).to_xml_value())
+
+    @classmethod
+    def _format_field_value(cls, field_value: object, /) -> str | XmlNode | ET.Element | list[XmlNode | ET.Element]:
+        if type(field_value) is str:
+            return field_value
         if isinstance(field_value, list):
-            return [value.to_xml_value() for value in field_value]
-        if isinstance(field_value, MappableToXmlValue):
+            return [cls._format_xml_node(value) for value in field_value]
+        if isinstance(field_value, XmlSerializerMixin):
+            return field_value.to_xml_node()
+        if cls._is_mappable_value(field_value):
             return field_value.to_xml_value()
         if isinstance(field_value, datetime):
             return field_value.strftime('%Y-%m-%dT%H:%M:%S')
         return str(field_value)
 
     @classmethod
-    def from_xml_value(cls, xml_value: str | ET.Element) -> Self:
+    def from_xml_value(cls, xml_value: str | ET.Element, *, trusted: bool = False) -> Self:
         if isinstance(xml_value, str):
             raise TypeError
+        return cls._build_from_values(cls._map_xml_values(xml_value, trusted=trusted), trusted=trusted)
 
-        kwargs: dict[str, Any] = {}
+    @classmethod
+    def extract_xml_value(
+        cls, xml_value: ET.Element, fields: Iterable[str], /, *, trusted: bool = False
+    ) -> dict[str, Any]:
+        plan = cls.get_xml_extraction_plan(tuple(fields))
+        values = cls._map_xml_values(xml_value, trusted=trusted, plan=plan.codec_plan)
+        return cls._build_extracted_values(plan, values, trusted=trusted)
 
-        for field_name, xml_path in cls._iter_xmlpath_fields():
-            [root_name, *path_names], local_name = xml_path.parts()
+    @classmethod
+    def extract_xml(
+        cls,
+        xml: str | Buffer,
+        fields: Iterable[str],
+        /,
+        *,
+        encoding: str | None = None,
+        backend: str | XmlBackend | None = None,
+        trusted: bool = False,
+    ) -> dict[str, Any]:
+        plan = cls.get_xml_extraction_plan(tuple(fields))
+        if not plan.streamable:
+            xml_backend = get_xml_backend(backend)
+            if isinstance(xml, str):
+                element = xml_backend.parse_string(xml)
+            else:
+                element = xml_backend.parse_bytes(xml, encoding=encoding)
+            return cls.extract_xml_value(element, plan.codec_plan.fields_by_name, trusted=trusted)
 
-            cls._ensure_root_tag(xml_value, root_name)
+        codec_plan = plan.codec_plan
+        raw_values = sniff_fields(
+            xml, codec_plan.root_names[0], plan.text_paths, plan.attribute_paths, encoding=encoding
+        )
+        return cls._build_extracted_values(
+            plan, cls._parse_collected_values(codec_plan, raw_values, trusted=trusted), trusted=trusted
+        )
 
-            pointer = cls._resolve_pointer(xml_value, path_names)
-            if pointer is None:
-                continue
+    @staticmethod
+    def _build_extracted_values(plan: XmlExtractionPlan, values: dict[str, Any], *, trusted: bool) -> dict[str, Any]:
+        if trusted:
+            return dict(plan.model.model_construct(**values))
+        return dict(plan.model.model_validate(values))
 
-            raw_value = cls._extract_value_from_pointer(pointer, local_name)
-            if raw_value is None and local_name not in (None, 'text()'):
-                continue
+    @classmethod
+    def _map_xml_values(
+        cls, xml_value: ET.Element, *, trusted: bool, plan: XmlCodecPlan | None = None
+    ) -> dict[str, Any]:
+        if plan is None:
+            plan = cls.get_xml_codec_plan()
+        root_name = cls._local_name(xml_value.tag)
+        for expected_root in plan.root_names:
+            if expected_root != root_name:
+                raise InvalidBaseTagNameError(document_tag=xml_value.tag, expected=expected_root)
+
+        values: dict[str, str | ET.Element | None] = {}
+        cls._collect_values(xml_value, plan.trie, values)
+        return cls._parse_collected_values(plan, values, trusted=trusted)
 
-            kwargs[field_name] = raw_value
+    @staticmethod
+    def _parse_collected_values(
+        plan: XmlCodecPlan, values: Mapping[str, str | ET.Element | None], *, trusted: bool
+    ) -> dict[str, Any]:
+        if trusted:
+            return {
+                field.name: field.parse_trusted(values[field.name]) for field in plan.fields if field.name in values
+            }
+        return {
+            field.name: field.parse(cast('str | ET.Element', values[field.name]))
+            for field in plan.fields
+            if field.name in values
+        }
 
-        parsed_kwargs = {name: cls._parse_field_value(name, value) for name, value in kwargs.items()}
-        return cls(**parsed_kwargs)
+    @classmethod
+    def _build_from_values(cls, values: dict[str, Any], *, trusted: bool) -> Self:
+        if trusted:
+            return cls._construct(values)
+        return cls(**values)
 
     @classmethod
     def _iter_annotation_classes(cls, annotation: object | None) -> Iterator[object]:
         if annotation is None:
             return
 
-        origin = get_origin(annotation)
-        if origin in (Union, UnionType):
-            for arg in get_args(annotation):
+        unwrapped = annotation
+        while isinstance(unwrapped, TypeAliasType) or get_origin(unwrapped) is Annotated:
+            unwrapped = unwrapped.__value__ if isinstance(unwrapped, TypeAliasType) else get_args(unwrapped)[0]
+        if get_origin(unwrapped) in (Union, UnionType):
+            for arg in get_args(unwrapped):
                 yield from cls._iter_annotation_classes(arg)
             return
 
         yield annotation
 
+    @staticmethod
+    def _is_mappable_class(klass: object) -> TypeGuard[type[MappableToXmlValue]]:
+        return isinstance(klass, type) and issubclass(klass, MappableToXmlValue)
+
+    @staticmethod
+    def _is_mappable_value(value: object) -> TypeGuard[MappableToXmlValue]:
+        klass = type(value)
+        mappable = _MAPPABLE_TYPES.get(klass)
+        if mappable is None:
+            mappable = _MAPPABLE_TYPES[klass] = issubclass(klass, MappableToXmlValue)
+        return mappable
+
+    @staticmethod
+    def _get_list_item_class(klass: object) -> type['XmlSerializerMixin'] | None:
+        if not isinstance(klass, GenericAlias):
+            return None
+
+        origin = klass.__origin__
+        if not (isinstance(origin, type) and issubclass(origin, list)):
+            return None
+
+        t = klass.__args__[0]
+        if not (isinstance(t, type) and issubclass(t, XmlSerializerMixin)):
+            return None
+
+        return t
+
     @classmethod
     def _parse_mappable_class(
         cls,
-        klass: object,
+        klass: type[MappableToXmlValue],
         xml_value: str | ET.Element,
     ) -> object | None:
-        if not (isinstance(klass, type) and issubclass(klass, MappableToXmlValue)):
-            return None
-
         with suppress(ValueError):
-            value: str | ET.Element = xml_value
-            if issubclass(klass, XmlSerializerMixin) and isinstance(xml_value, ET.Element):
-                base = klass.get_base_tag_name()
-                for child in xml_value:
-                    if cls._local_name(child.tag) == base:
-                        value = child
-                        break
+            value = xml_value
+            if issubclass(klass, XmlSerializerMixin) and not isinstance(xml_value, str):
+                value = cls._find_submessage_element(klass, xml_value)
             return klass.from_xml_value(value)
 
         return None
 
+    @staticmethod
+    def _decode_enum(lookup: Callable[[str], object | None], xml_value: str | ET.Element) -> object | None:
+        if not isinstance(xml_value, str):
+            return None
+        return lookup(xml_value)
+
+    @classmethod
+    def _decode_submessage(cls, klass: type['XmlSerializerMixin'], xml_value: str | ET.Element) -> object | None:
+        if isinstance(xml_value, str):
+            return None
+        return cls._parse_mappable_class(klass, xml_value)
+
+    @classmethod
+    def _find_submessage_element(cls, klass: type['XmlSerializerMixin'], xml_value: ET.Element) -> ET.Element:
+        base = klass.get_base_tag_name()
+        for child in xml_value:
+            if cls._local_name(child.tag) == base:
+                return child
+        return xml_value
+
+    @classmethod
+    def _parse_trusted_submessage(
+        cls, klass: type['XmlSerializerMixin'], xml_value: str | ET.Element
+    ) -> object | None:
+        if isinstance(xml_value, str):
+            return None
+        return klass.from_xml_value(cls._find_submessage_element(klass, xml_value), trusted=True)
+
     @classmethod
     def _parse_list_of_submessages(
         cls,
-        klass: object,
+        klass: type['XmlSerializerMixin'],
         xml_value: str | ET.Element,
+        *,
+        trusted: bool = False,
     ) -> object | None:
-        if not isinstance(klass, GenericAlias):
+        if isinstance(xml_value, str):
             return None
 
-        origin = klass.__origin__
-        if not (isinstance(origin, type) and issubclass(origin, list)):
-            return None
+        base = klass.get_base_tag_name()
+        elements = [child for child in xml_value if cls._local_name(child.tag) == base]
+        return [klass.from_xml_value(element, trusted=trusted) for element in elements]
 
-        t = klass.__args__[0]
-        if not (isinstance(t, type) and issubclass(t, XmlSerializerMixin)):
+    @staticmethod
+    def _get_scalar_type(klass: object) -> type | None:
+        while True:
+            if isinstance(klass, TypeAliasType):
+                klass = klass.__value__
+                continue
+            origin = get_origin(klass)
+            if origin is Annotated:
+                klass = get_args(klass)[0]
+                continue
+            if origin is Literal:
+                klass = type(get_args(klass)[0])
+            return klass if isinstance(klass, type) and klass in TRUSTED_SCALAR_PARSERS else None
+
+    @staticmethod
+    def _parse_trusted_scalar(parser: Callable[[str], object], xml_value: str | ET.Element) -> object | None:
+        if not isinstance(xml_value, str):
             return None
+        with suppress(ValueError, ArithmeticError):
+            return parser(xml_value)
+        return None
 
-        if isinstance(xml_value, str):
-            raise TypeError
+    @staticmethod
+    def _construct_scalar(scalar_type: type, parser: Callable[[str], object], value: object) -> object | None:
+        if type(value) is scalar_type:
+            return value
+        if isinstance(value, str | int | float):
+            with suppress(ValueError, ArithmeticError):
+                return parser(str(value))
+        return None
 
-        elements = [child for child in xml_value if cls._local_name(child.tag) == t.get_base_tag_name()]
-        return [t.from_xml_value(element) for element in elements]
+    @staticmethod
+    def _construct_mappable(klass: type[MappableToXmlValue], value: object) -> object | None:
+        if isinstance(value, klass):
+            return value
+        with suppress(ValueError, TypeError):
+            return klass(value)  # type: ignore[call-arg]
+        return None
 
-    @classmethod
-    def _parse_field_value(cls, field_name: str, xml_value: str | ET.Element, /) -> object:
-        annotation = cls.__pydantic_fields__[field_name].annotation
+    @staticmethod
+    def _construct_submessage(klass: type['XmlSerializerMixin'], value: object) -> object | None:
+        if isinstance(value, klass):
+            return value
+        if isinstance(value, Mapping):
+            return klass.model_validate(value, trusted=True)
+        return None
 
-        if annotation is None:
-            return str(xml_value)
+    @classmethod
+    def _construct_list_of_submessages(cls, klass: type['XmlSerializerMixin'], value: object) -> object | None:
+        if not isinstance(value, list):
+            return None
+        return [cls._construct_submessage(klass, item) or item for item in value]
 
-        for klass in cls._iter_annotation_classes(annotation):
-            parsed = cls._parse_mappable_class(klass, xml_value)
-            if parsed is not None:
-                return parsed
+    @classmethod
+    def model_validate(cls, obj: Any, *, trusted: bool = False, **kwargs: Any) -> Self:  # noqa: ANN401
+        if not trusted:
+            return super().model_validate(obj, **kwargs)
+        if isinstance(obj, cls):
+            return obj
+
+        fields = cls.get_xml_codec_plan().fields_by_name
+        values: dict[str, Any] = {}
+        for name, value in cast('Mapping[str, object]', obj).items():
+            field = fields.get(name)
+            values[name] = value if field is None else field.construct(value)
+        return cls._construct(values)
 
-            parsed = cls._parse_list_of_submessages(klass, xml_value)
-            if parsed is not None:
-                return parsed
+    @classmethod
+    def _construct(cls, values: dict[str, Any]) -> Self:
+        return cast('Self', cls.model_construct(**values))
 
-        return str(xml_value)
+    @classmethod
+    def _parse_field_value(cls, field_name: str, xml_value: str | ET.Element, /) -> object:
+        return cls.get_xml_codec_plan().fields_by_name[field_name].parse(xml_value)
 
 
 class BaseSubMessage(XmlSerializerMixin, BaseModel):
     @classmethod
     def get_base_tag_name(cls) -> str:
-        xml_paths = (
-            metadata
-            for field_info in cls.model_fields.values()
-            for metadata in field_info.metadata
-            if isinstance(metadata, XmlPath)
-        )
-        with suppress(StopIteration):
-            xml_path = next(xml_paths)
-            return xml_path.parts()[0][0]
-        raise BaseTagNameNotFoundInClassError(cls=cls)
+        fields = cls.get_xml_codec_plan().fields
+        if not fields:
+            raise BaseTagNameNotFoundInClassError(cls=cls)
+        return fields[0].root_name
 
 
 class BaseMessage(BaseSubMessage):
-    from_ispb: Annotated[Ispb, XmlPath('DOC/BCMSG/IdentdEmissor/text()')]
-    to_ispb: Annotated[Ispb, XmlPath('DOC/BCMSG/IdentdDestinatario/text()')]
+    from_ispb: Annotated[Ispb, AfterValidator(intern_ispb), XmlPath('DOC/BCMSG/IdentdEmissor/text()')]
+    to_ispb: Annotated[Ispb, AfterValidator(intern_ispb), XmlPath('DOC/BCMSG/IdentdDestinatario/text()')]
     system_domain: Annotated[SystemDomain, XmlPath('DOC/BCMSG/DomSist/text()')]
     operation_number: Annotated[OperationNumber, XmlPath('DOC/BCMSG/NUOp/text()')]
     sequence_number: Annotated[int | None, XmlPath('DOC/BCMSG/Grupo_Seq/NumSeq/text()')] = None
@@ -291,20 +1079,165 @@ class BaseMessage(BaseSubMessage):
         None
     )
 
-    def to_xml(self) -> str:
-        xml = self.to_xml_value()
+    def to_xml(self, *, indent: bool = True) -> str:
+        return self.compile_template().render(self, indent=indent)
+
+    def write_xml(
+        self,
+        sink: IO[str] | IO[bytes],
+        /,
+        *,
+        encoding: str | None = None,
+        bom: bool = False,
+        indent: bool = True,
+    ) -> None:
+        template = self.compile_template()
+        if not instrumentation.active_hooks:
+            template.dump(self, sink, encoding=encoding, bom=bom, indent=indent)
+            return
+        with instrumentation.measure(Phase.SERIALIZE, type(self).__name__):
+            template.dump(self, sink, encoding=encoding, bom=bom, indent=indent)
+
+    def to_xml_bytes(self, *, encoding: str = RSFN_ENCODING, bom: bool = False, indent: bool = True) -> bytes:
+        return encode_xml(self.to_xml(indent=indent), encoding=encoding, bom=bom)
 
-        ns = self.get_xml_namespace()
-        if ns:
-            ET.register_namespace('', ns)
+    @classmethod
+    def from_xml(
+        cls,
+        value: str,
+        /,
+        *,
+        backend: str | XmlBackend | None = None,
+        trusted: bool = False,
+    ) -> Self:
+        if not instrumentation.active_hooks:
+            return cls.from_xml_value(get_xml_backend(backend).parse_string(value), trusted=trusted)
+        with instrumentation.measure(Phase.PARSE, cls.__name__, payload_size=len(value)):
+            xml = get_xml_backend(backend).parse_string(value)
+        return cls.from_parsed_xml(xml, trusted=trusted, payload_size=len(value))
+
+    @classmethod
+    def from_xml_bytes(
+        cls,
+        data: Buffer,
+        /,
+        *,
+        encoding: str | None = None,
+        backend: str | XmlBackend | None = None,
+        trusted: bool = False,
+    ) -> Self:
+        if not instrumentation.active_hooks:
+            return cls.from_xml_value(get_xml_backend(backend).parse_bytes(data, encoding=encoding), trusted=trusted)
+        payload_size = memoryview(data).nbytes
+        with instrumentation.measure(Phase.PARSE, cls.__name__, payload_size=payload_size):
+            xml = get_xml_backend(backend).parse_bytes(data, encoding=encoding)
+        return cls.from_parsed_xml(xml, trusted=trusted, payload_size=payload_size)
+
+    @classmethod
+    def from_parsed_xml(cls, xml: ET.Element, /, *, trusted: bool = False, payload_size: int | None = None) -> Self:
+        if not instrumentation.active_hooks:
+            return cls.from_xml_value(xml, trusted=trusted)
+        with instrumentation.measure(Phase.MAP, cls.__name__, payload_size=payload_size):
+            values = cls._map_xml_values(xml, trusted=trusted)
+        with instrumentation.measure(Phase.VALIDATE, cls.__name__, payload_size=payload_size):
+            return cls._build_from_values(values, trusted=trusted)
+
+    @classmethod
+    def model_validate(cls, obj: Any, *, trusted: bool = False, **kwargs: Any) -> Self:  # noqa: ANN401
+        if not instrumentation.active_hooks:
+            return super().model_validate(obj, trusted=trusted, **kwargs)
+        with instrumentation.measure(Phase.VALIDATE, cls.__name__):
+            return super().model_validate(obj, trusted=trusted, **kwargs)
+
+    @classmethod
+    @class_cache
+    def _get_list_containers(cls) -> dict[int, dict[str, type[XmlSerializerMixin]]]:
+        plan = cls.get_xml_codec_plan()
+        containers: dict[int, dict[str, type[XmlSerializerMixin]]] = {}
+        for field in plan.fields:
+            if field.kind is XmlFieldKind.LIST and field.message_class is not None:
+                container = plan.trie
+                for path_name in field.path_names:
+                    container = container.children[path_name]
+                item_classes = containers.setdefault(id(container), {})
+                item_classes[field.message_class.get_base_tag_name()] = field.message_class
+        return containers
+
+    @classmethod
+    def iter_xml(
+        cls,
+        source: str | PathLike[str] | IO[bytes],
+        /,
+        *,
+        backend: str | XmlBackend | None = None,
+        trusted: bool = False,
+    ) -> Generator[XmlSerializerMixin, None, Self]:
+        if isinstance(source, str):
+            source = BytesIO(source.encode())
+        plan = cls.get_xml_codec_plan()
+        groups = cls._get_list_containers()
+
+        root: ET.Element | None = None
+        nodes: list[XmlPathTrieNode | None] = []
+        elements: list[ET.Element] = []
+
+        for event, element in get_xml_backend(backend).iterparse(source, events=('start', 'end')):
+            if event == 'start':
+                if root is None:
+                    root = element
+                    for expected_root in plan.root_names:
+                        if expected_root != cls._local_name(element.tag):
+                            raise InvalidBaseTagNameError(document_tag=element.tag, expected=expected_root)
+                    nodes.append(plan.trie)
+                else:
+                    parent = nodes[-1]
+                    nodes.append(None if parent is None else parent.children.get(cls._local_name(element.tag)))
+                elements.append(element)
+                continue
+
+            nodes.pop()
+            elements.pop()
+            if not nodes:
+                continue
+
+            item_classes = groups.get(id(nodes[-1]))
+            if item_classes is None:
+                continue
+            item_class = item_classes.get(cls._local_name(element.tag))
+            if item_class is None:
+                continue
+
+            yield item_class.from_xml_value(element, trusted=trusted)
+            element.clear()
+            elements[-1].remove(element)
 
-        ET.indent(xml)
-        return '<?xml version="1.0"?>\n' + ET.tostring(xml, encoding='unicode')
+        return cls._build_streamed_header(root, trusted=trusted)
+
+    @classmethod
+    def _build_streamed_header(cls, root: ET.Element | None, *, trusted: bool) -> Self:
+        plan = cls.get_xml_codec_plan()
+        values: dict[str, str | ET.Element | None] = {}
+        if root is not None:
+            cls._collect_values(root, plan.trie, values)
+
+        header_kwargs: dict[str, Any] = {
+            field.name: []
+            if field.kind is XmlFieldKind.LIST
+            else field.parse_trusted(values[field.name])
+            if trusted
+            else field.parse(cast('str | ET.Element', values[field.name]))
+            for field in plan.fields
+            if field.name in values
+        }
+        return cls._build_from_values(header_kwargs, trusted=trusted)
 
     @classmethod
-    def from_xml(cls, value: str, /) -> Self:
-        xml = fromstring(value)
-        return cls.from_xml_value(xml)
+    def _build_from_values(cls, values: dict[str, Any], *, trusted: bool) -> Self:
+        if trusted:
+            for name in ('from_ispb', 'to_ispb'):
+                if type(value := values.get(name)) is str:
+                    values[name] = intern_ispb(value)
+        return super()._build_from_values(values, trusted=trusted)
 
     def to_error(self) -> dict[str, Any]:
         res: dict[str, Any] = {
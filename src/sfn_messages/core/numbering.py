@@ -0,0 +1,287 @@
+import math
+import os
+import re
+import sys
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta, tzinfo
+from datetime import time as datetime_time
+from os import PathLike
+from pathlib import Path
+from typing import Self
+
+from .errors import InvalidControlNumberPrefixError, InvalidIspbError, InvalidSystemError, SequenceExhaustedError
+
+if sys.platform == 'win32':
+    import msvcrt
+
+    def _lock_file(fd: int) -> None:
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+    def _unlock_file(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock_file(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+    def _unlock_file(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+ISPB_PATTERN = re.compile(r'[0-9A-Z]{8}')
+OPERATION_DATE_FORMAT = '%y%m%d'
+OPERATION_SEQUENCE_DIGITS = 9
+OPERATION_SEQUENCE_LIMIT = 10**OPERATION_SEQUENCE_DIGITS - 1
+DEFAULT_BLOCK_SIZE = 4096
+SYSTEM_PATTERN = re.compile(r'[A-Z]{3}')
+CONTROL_NUMBER_PREFIX_PATTERN = re.compile(r'[0-9A-Z]*')
+CONTROL_NUMBER_LENGTH = 20
+CONTROL_SEQUENCE_MIN_DIGITS = 4
+DEFAULT_LEASE_SIZE = 1024
+COUNTER_SUFFIX = '.counter'
+
+
+class CounterFile:
+    def __init__(self, path: str | PathLike[str]) -> None:
+        self.path = Path(path)
+        self.lock_path = self.path.with_name(f'{self.path.name}.lock')
+
+    def reserve(self, key: str, size: int, /, *, limit: int) -> tuple[str, int, int]:
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            _lock_file(fd)
+            try:
+                stored_key, start = self.read()
+                if stored_key is None or key > stored_key:
+                    stored_key, start = key, 1
+                if start > limit:
+                    raise SequenceExhaustedError(key=stored_key, limit=limit)
+                stop = min(start + size, limit + 1)
+                self._write(stored_key, stop)
+            finally:
+                _unlock_file(fd)
+        finally:
+            os.close(fd)
+        return stored_key, start, stop
+
+    def read(self) -> tuple[str | None, int]:
+        try:
+            content = self.path.read_text(encoding='ascii')
+        except FileNotFoundError:
+            return None, 1
+        key, value = content.split()
+        return key, int(value)
+
+    def _write(self, key: str, value: int) -> None:
+        temporary = self.path.with_name(f'{self.path.name}.tmp')
+        with temporary.open('w', encoding='ascii') as file:
+            file.write(f'{key} {value}\n')
+            file.flush()
+            os.fsync(file.fileno())
+        temporary.replace(self.path)
+
+
+_SEQUENCES: weakref.WeakSet['LeasedSequence'] = weakref.WeakSet()
+
+
+def _reset_sequences_after_fork() -> None:
+    for sequence in _SEQUENCES:
+        sequence.reset()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_sequences_after_fork)
+
+
+class LeasedSequence(ABC):
+    def __init__(
+        self,
+        counter: CounterFile | str | PathLike[str],
+        /,
+        *,
+        block_size: int,
+        clock: Callable[[], float],
+    ) -> None:
+        self.counter = counter if isinstance(counter, CounterFile) else CounterFile(counter)
+        self.block_size = block_size
+        self.clock = clock
+        self.reset()
+        _SEQUENCES.add(self)
+
+    def reset(self) -> None:
+        self._lock = threading.Lock()
+        self._template = ''
+        self._next = 0
+        self._stop = 0
+        self._expires_at = 0.0
+
+    def __iter__(self) -> Self:
+        return self
+
+    def __next__(self) -> str:
+        with self._lock:
+            if self._next >= self._stop or self.clock() >= self._expires_at:
+                self._refill()
+            value = self._next
+            self._next = value + 1
+            template = self._template
+        return template % value
+
+    def take(self, count: int, /) -> list[str]:
+        numbers: list[str] = []
+        with self._lock:
+            while len(numbers) < count:
+                if self._next >= self._stop or self.clock() >= self._expires_at:
+                    self._refill()
+                start = self._next
+                stop = min(self._stop, start + count - len(numbers))
+                numbers.extend(map(self._template.__mod__, range(start, stop)))
+                self._next = stop
+        return numbers
+
+    @abstractmethod
+    def _lease(self) -> tuple[str, int, int, float]:
+        raise NotImplementedError
+
+    def _refill(self) -> None:
+        self._template, self._next, self._stop, self._expires_at = self._lease()
+
+
+class OperationNumberGenerator(LeasedSequence):
+    def __init__(
+        self,
+        ispb: str,
+        counter: CounterFile | str | PathLike[str],
+        /,
+        *,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        tz: tzinfo | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        ispb = ispb.strip().upper()
+        if not ISPB_PATTERN.fullmatch(ispb):
+            raise InvalidIspbError(ispb=ispb)
+        self.ispb = ispb
+        self.tz = tz
+        super().__init__(counter, block_size=block_size, clock=clock)
+
+    def _lease(self) -> tuple[str, int, int, float]:
+        today = datetime.fromtimestamp(self.clock(), self.tz).date()
+        key, start, stop = self.counter.reserve(
+            today.strftime(OPERATION_DATE_FORMAT), self.block_size, limit=OPERATION_SEQUENCE_LIMIT
+        )
+        rollover_at = datetime.combine(today + timedelta(days=1), datetime_time(), self.tz).timestamp()
+        return f'{self.ispb}{key}%0{OPERATION_SEQUENCE_DIGITS}d', start, stop, rollover_at
+
+
+class ControlNumberSequence(LeasedSequence):
+    def __init__(
+        self,
+        system: str,
+        prefix: str,
+        counter: CounterFile | str | PathLike[str],
+        /,
+        *,
+        lease_size: int = DEFAULT_LEASE_SIZE,
+        length: int = CONTROL_NUMBER_LENGTH,
+    ) -> None:
+        if not CONTROL_NUMBER_PREFIX_PATTERN.fullmatch(prefix) or len(prefix) > length - CONTROL_SEQUENCE_MIN_DIGITS:
+            raise InvalidControlNumberPrefixError(system=system, prefix=prefix)
+        self.system = system
+        self.prefix = prefix
+        self.digits = length - len(prefix)
+        self.limit = 10**self.digits - 1
+        super().__init__(counter, block_size=lease_size, clock=time.monotonic)
+
+    def format(self, value: int, /) -> str:
+        return f'{self.prefix}{value:0{self.digits}d}'
+
+    def _lease(self) -> tuple[str, int, int, float]:
+        _, start, stop = self.counter.reserve(self.system, self.block_size, limit=self.limit)
+        return f'{self.prefix}%0{self.digits}d', start, stop, math.inf
+
+
+@dataclass(frozen=True, slots=True)
+class ControlNumberState:
+    system: str
+    prefix: str
+    next_sequence: int
+    next_number: str | None
+    remaining: int
+
+
+class InstitutionControlNumberAllocator:
+    def __init__(
+        self,
+        directory: str | PathLike[str],
+        /,
+        *,
+        prefixes: Mapping[str, str] | None = None,
+        lease_size: int = DEFAULT_LEASE_SIZE,
+        length: int = CONTROL_NUMBER_LENGTH,
+    ) -> None:
+        self.directory = Path(directory)
+        self.lease_size = lease_size
+        self.length = length
+        self.prefixes = {
+            self._normalize_system(system): prefix.strip().upper() for system, prefix in (prefixes or {}).items()
+        }
+        self._sequences: dict[str, ControlNumberSequence] = {}
+
+    def sequence(self, system: str, /) -> ControlNumberSequence:
+        system = self._normalize_system(system)
+        sequence = self._sequences.get(system)
+        if sequence is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            sequence = self._sequences.setdefault(system, self._make_sequence(system))
+        return sequence
+
+    def allocate(self, system: str, /) -> str:
+        return next(self.sequence(system))
+
+    def take(self, system: str, count: int, /) -> list[str]:
+        return self.sequence(system).take(count)
+
+    def state(self) -> list[ControlNumberState]:
+        states: list[ControlNumberState] = []
+        for path in sorted(self.directory.glob(f'*{COUNTER_SUFFIX}')):
+            system = path.name.removesuffix(COUNTER_SUFFIX)
+            if not SYSTEM_PATTERN.fullmatch(system):
+                continue
+            sequence = self._make_sequence(system)
+            _, next_sequence = sequence.counter.read()
+            remaining = max(sequence.limit - next_sequence + 1, 0)
+            states.append(
+                ControlNumberState(
+                    system=sequence.system,
+                    prefix=sequence.prefix,
+                    next_sequence=next_sequence,
+                    next_number=sequence.format(next_sequence) if remaining else None,
+                    remaining=remaining,
+                )
+            )
+        return states
+
+    def _make_sequence(self, system: str, /) -> ControlNumberSequence:
+        return ControlNumberSequence(
+            system,
+            self.prefixes.get(system, system),
+            self.directory / f'{system}{COUNTER_SUFFIX}',
+            lease_size=self.lease_size,
+            length=self.length,
+        )
+
+    @staticmethod
+    def _normalize_system(system: str, /) -> str:
+        normalized = system.strip().upper()
+        if not SYSTEM_PATTERN.fullmatch(normalized):
+            raise InvalidSystemError(system=system)
+        return normalized
@@ -0,0 +1,86 @@
+import pkgutil
+import re
+import threading
+from importlib import import_module
+
+from .errors import MessageNotImplementedError
+from .models import BaseMessage
+
+MESSAGES_PACKAGE = 'sfn_messages'
+MESSAGE_CODE_RE = re.compile(r'^(?P<event>(?P<service>[A-Za-z]{3})[0-9]{4}).*$')
+NEGATIVE_CACHE_SIZE = 4096
+
+
+class MessageRegistry:
+    def __init__(self, package: str = MESSAGES_PACKAGE, *, negative_cache_size: int = NEGATIVE_CACHE_SIZE) -> None:
+        self.package = package
+        self.negative_cache_size = negative_cache_size
+        self._classes: dict[str, type[BaseMessage]] = {}
+        self._families: set[str] = set()
+        self._unknown: set[str] = set()
+        self._lock = threading.Lock()
+
+    def get(self, message_code: str, /) -> type[BaseMessage]:
+        klass = self._classes.get(message_code)
+        if klass is not None:
+            return klass
+        if message_code in self._unknown:
+            raise MessageNotImplementedError(message_code=message_code)
+
+        parts = MESSAGE_CODE_RE.match(message_code)
+        if parts is None:
+            raise ValueError
+        family = parts.group('service').lower()
+        if family not in self._families:
+            self.load_family(family)
+            klass = self._classes.get(message_code)
+            if klass is not None:
+                return klass
+
+        if len(self._unknown) >= self.negative_cache_size:
+            self._unknown.clear()
+        self._unknown.add(message_code)
+        raise MessageNotImplementedError(message_code=message_code)
+
+    def load_family(self, family: str, /) -> None:
+        with self._lock:
+            if family in self._families:
+                return
+            try:
+                package = import_module(f'{self.package}.{family}')
+            except ModuleNotFoundError:
+                package = None
+            if package is not None:
+                for module_info in pkgutil.iter_modules(package.__path__, f'{package.__name__}.'):
+                    self._register_module(import_module(module_info.name))
+            self._families.add(family)
+
+    def _register_module(self, module: object) -> None:
+        module_name = getattr(module, '__name__', None)
+        for name, value in vars(module).items():
+            if (
+                isinstance(value, type)
+                and issubclass(value, BaseMessage)
+                and value.__module__ == module_name
+                and MESSAGE_CODE_RE.match(name) is not None
+            ):
+                self._classes[name] = value
+
+    def families(self) -> list[str]:
+        package = import_module(self.package)
+        return [
+            module_info.name
+            for module_info in pkgutil.iter_modules(package.__path__)
+            if module_info.ispkg and module_info.name != 'core'
+        ]
+
+    def warm_up(self) -> None:
+        for family in self.families():
+            self.load_family(family)
+
+    def registered_codes(self) -> list[str]:
+        self.warm_up()
+        return sorted(self._classes)
+
+
+MESSAGE_REGISTRY = MessageRegistry()
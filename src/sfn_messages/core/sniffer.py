@@ -0,0 +1,256 @@
+from abc import ABC, abstractmethod
+from collections.abc import Buffer, Mapping
+from dataclasses import dataclass
+from typing import NoReturn, cast
+from xml.etree import ElementTree as ET
+from xml.parsers import expat
+
+from defusedxml import DTDForbidden
+
+from .encoding import expat_encoding, strip_bom
+from .errors import InvalidBaseTagNameError, MessageCodeNotFoundError
+from .types import ContinuationIndicator
+
+SNIFF_CHUNK_SIZE = 512
+SNIFF_MAX_SIZE = 64 * 1024
+
+HEADER_PATHS = {
+    ('BCMSG', 'IdentdEmissor'): 'from_ispb',
+    ('BCMSG', 'IdentdDestinatario'): 'to_ispb',
+    ('BCMSG', 'DomSist'): 'system_domain',
+    ('BCMSG', 'NUOp'): 'operation_number',
+    ('BCMSG', 'Grupo_Seq', 'NumSeq'): 'sequence_number',
+    ('BCMSG', 'Grupo_Seq', 'IndrCont'): 'continuation_indicator',
+}
+MESSAGE_CODE_DEPTH = 3
+
+
+@dataclass(frozen=True, slots=True)
+class MessageHeader:
+    message_code: str
+    namespace: str | None
+    from_ispb: str | None = None
+    to_ispb: str | None = None
+    system_domain: str | None = None
+    operation_number: str | None = None
+    sequence_number: int | None = None
+    continuation_indicator: ContinuationIndicator | None = None
+
+
+class _SniffComplete(Exception):  # noqa: N818
+    pass
+
+
+class _ExpatSniffer(ABC):
+    def __init__(self, *, encoding: str | None = None) -> None:
+        self._parser = expat.ParserCreate(encoding, namespace_separator='}')
+        self._parser.StartElementHandler = self._start
+        self._parser.EndElementHandler = self._end
+        self._parser.CharacterDataHandler = self._data
+        self._parser.StartDoctypeDeclHandler = self._forbid_doctype
+
+    def feed(self, data: str | Buffer, *, final: bool = False) -> bool:
+        try:
+            self._parser.Parse(data, final)
+        except _SniffComplete:
+            return True
+        except expat.ExpatError as exc:
+            error = ET.ParseError(str(exc))
+            error.code = exc.code
+            error.position = exc.lineno, exc.offset
+            raise error from None
+        return False
+
+    @abstractmethod
+    def _start(self, tag: str, attrib: dict[str, str]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _end(self, tag: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _data(self, data: str) -> None:
+        raise NotImplementedError
+
+    @staticmethod
+    def _forbid_doctype(name: str, sysid: str | None, pubid: str | None, _has_internal_subset: bool) -> NoReturn:  # noqa: FBT001
+        raise DTDForbidden(name, sysid, pubid)
+
+
+class HeaderSniffer(_ExpatSniffer):
+    def __init__(self, *, encoding: str | None = None) -> None:
+        super().__init__(encoding=encoding)
+        self.namespace: str | None = None
+        self.values: dict[str, str] = {}
+        self._path: list[str] = []
+        self._text: list[str] | None = None
+
+    def header(self) -> MessageHeader:
+        values = self.values
+        message_code = values.get('message_code')
+        if message_code is None:
+            raise MessageCodeNotFoundError
+        sequence_number = values.get('sequence_number')
+        continuation_indicator = values.get('continuation_indicator')
+        return MessageHeader(
+            message_code=message_code,
+            namespace=self.namespace,
+            from_ispb=values.get('from_ispb'),
+            to_ispb=values.get('to_ispb'),
+            system_domain=values.get('system_domain'),
+            operation_number=values.get('operation_number'),
+            sequence_number=None if sequence_number is None else int(sequence_number),
+            continuation_indicator=None
+            if continuation_indicator is None
+            else ContinuationIndicator.from_xml_value(continuation_indicator),
+        )
+
+    def _start(self, tag: str, _attrib: dict[str, str]) -> None:
+        uri, _, local_name = tag.rpartition('}')
+        if self.namespace is None and not self._path and uri:
+            self.namespace = uri
+        self._path.append(local_name)
+        self._text = []
+
+    def _end(self, _tag: str) -> None:
+        path = self._path
+        text = self._text
+        self._text = None
+        if text is not None:
+            key = tuple(path[1:])
+            name = HEADER_PATHS.get(key)
+            if name is None and len(key) == MESSAGE_CODE_DEPTH and key[0] == 'SISMSG' and key[2] == 'CodMsg':
+                name = 'message_code'
+            if name is not None:
+                self.values[name] = ''.join(text).strip()
+                if name == 'message_code':
+                    raise _SniffComplete
+        path.pop()
+
+    def _data(self, data: str) -> None:
+        if self._text is not None:
+            self._text.append(data)
+
+
+class FieldSniffer(_ExpatSniffer):
+    def __init__(
+        self,
+        root_name: str,
+        text_paths: Mapping[tuple[str, ...], str],
+        attribute_paths: Mapping[tuple[str, ...], Mapping[str, str]],
+        *,
+        encoding: str | None = None,
+    ) -> None:
+        super().__init__(encoding=encoding)
+        self.root_name = root_name
+        self.text_paths = text_paths
+        self.attribute_paths = attribute_paths
+        self.values: dict[str, str | None] = {}
+        self._remaining = len(text_paths) + sum(map(len, attribute_paths.values()))
+        self._path: list[str] = []
+        self._seen: set[tuple[str, ...]] = set()
+        self._skip_depth = 0
+        self._text_field: str | None = None
+        self._text: list[str] = []
+        self._parser.buffer_text = True
+        self._parser.CharacterDataHandler = None
+
+    def _start(self, tag: str, attrib: dict[str, str]) -> None:
+        if self._text_field is not None:
+            self._finish_text()
+        if self._skip_depth:
+            self._skip_depth += 1
+            return
+
+        uri, _, local_name = tag.rpartition('}')
+        path = self._path
+        if not path and local_name != self.root_name:
+            raise InvalidBaseTagNameError(
+                document_tag=f'{{{uri}}}{local_name}' if uri else tag, expected=self.root_name
+            )
+        path.append(local_name)
+        key = tuple(path)
+        if key in self._seen:
+            path.pop()
+            self._skip_depth = 1
+            return
+        self._seen.add(key)
+
+        if (attributes := self.attribute_paths.get(key)) is not None:
+            for attribute_name, field_name in attributes.items():
+                if attribute_name in attrib:
+                    self.values[field_name] = attrib[attribute_name]
+                self._remaining -= 1
+            if not self._remaining:
+                raise _SniffComplete
+        if (text_field := self.text_paths.get(key)) is not None:
+            self._text_field = text_field
+            self._parser.CharacterDataHandler = self._data
+
+    def _end(self, _tag: str) -> None:
+        if self._text_field is not None:
+            self._finish_text()
+        if self._skip_depth:
+            self._skip_depth -= 1
+            return
+        self._path.pop()
+
+    def _data(self, data: str) -> None:
+        self._text.append(data)
+
+    def _finish_text(self) -> None:
+        field_name = cast('str', self._text_field)
+        self.values[field_name] = ''.join(self._text) or None
+        self._text_field = None
+        self._text.clear()
+        self._parser.CharacterDataHandler = None
+        self._remaining -= 1
+        if not self._remaining:
+            raise _SniffComplete
+
+
+def sniff_fields(
+    data: str | Buffer,
+    /,
+    root_name: str,
+    text_paths: Mapping[tuple[str, ...], str],
+    attribute_paths: Mapping[tuple[str, ...], Mapping[str, str]],
+    *,
+    encoding: str | None = None,
+) -> dict[str, str | None]:
+    if isinstance(data, str):
+        view: str | memoryview = data
+    else:
+        view, encoding = strip_bom(data, encoding)
+    sniffer = FieldSniffer(
+        root_name,
+        text_paths,
+        attribute_paths,
+        encoding=None if encoding is None else expat_encoding(encoding),
+    )
+    sniffer.feed(view, final=True)
+    return sniffer.values
+
+
+def sniff_header(
+    data: str | Buffer,
+    /,
+    *,
+    encoding: str | None = None,
+    chunk_size: int = SNIFF_CHUNK_SIZE,
+    max_size: int = SNIFF_MAX_SIZE,
+) -> MessageHeader:
+    if isinstance(data, str):
+        view: str | memoryview = data
+    else:
+        view, encoding = strip_bom(data, encoding)
+    sniffer = HeaderSniffer(encoding=None if encoding is None else expat_encoding(encoding))
+
+    size = min(len(view), max_size)
+    for start in range(0, size, chunk_size):
+        if sniffer.feed(view[start : start + chunk_size]):
+            return sniffer.header()
+    if size == len(view):
+        sniffer.feed('' if isinstance(view, str) else b'', final=True)
+    raise MessageCodeNotFoundError
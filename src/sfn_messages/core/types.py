@@ -1,24 +1,27 @@
-from contextlib import suppress
+from collections.abc import Mapping
 from decimal import Decimal
 from enum import Enum, StrEnum
-from functools import cache
-from typing import Annotated, Any, Protocol, Self, runtime_checkable
+from types import MappingProxyType
+from typing import Annotated, Any, ClassVar, Protocol, Self, cast, runtime_checkable
 from xml.etree import ElementTree as ET
 
-from pydantic import GetPydanticSchema
+from pydantic import Discriminator, GetPydanticSchema, Tag
 from pydantic_core import core_schema
-from validate_docbr import CNPJ, CPF
+
+from .documents import is_valid_cnpj, is_valid_cpf
+
+CPF_LENGTH = 11
 
 
 def cnpj_validator(value: str) -> str:
-    if not CNPJ().validate(value):
+    if not is_valid_cnpj(value):
         msg = 'Invalid CNPJ format'
         raise ValueError(msg)
     return value
 
 
 def cpf_validator(value: str) -> str:
-    if not CPF().validate(value):
+    if not is_valid_cpf(value):
         msg = 'Invalid CPF format'
         raise ValueError(msg)
     return value
@@ -33,44 +36,57 @@ class MappableToXmlValue(Protocol):
 
 
 class EnumMixin(Enum):
+    _xml_values: ClassVar[Mapping[Any, str] | None]
+    _xml_members: ClassVar[Mapping[str, Any] | None]
+    _member_aliases: ClassVar[Mapping[str, Any]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:  # noqa: ANN401
+        super().__init_subclass__(**kwargs)
+        members = cls.__members__
+        value_to_xml = cls._value_to_xml() if members else None
+        cls._xml_values = MappingProxyType(dict(value_to_xml)) if value_to_xml else None
+        cls._xml_members = (
+            MappingProxyType({xml_value: member for member, xml_value in value_to_xml.items()})
+            if value_to_xml
+            else None
+        )
+
+        aliases = {name.upper(): member for name, member in members.items()}
+        aliases.update((member.value.upper(), member) for member in members.values() if isinstance(member.value, str))
+        cls._member_aliases = MappingProxyType(aliases)
+
     @classmethod
     def _missing_(cls, value: Any) -> Any:  # noqa: ANN401
+        if isinstance(value, str):
+            return cls._member_aliases.get(value.upper())
         if isinstance(value, cls):
             return value
-        with suppress(KeyError):
-            return cls._value2member_map_[value]
-        if isinstance(value, str):
-            upper_value = value.upper()
-            with suppress(KeyError):
-                return cls._value2member_map_[upper_value]
-            with suppress(KeyError):
-                return cls._member_map_[value]
-            with suppress(KeyError):
-                return cls._member_map_[upper_value]
         return None
 
     @classmethod
     def _value_to_xml(cls) -> dict[Self, str] | None:
         return None
 
-    @classmethod
-    @cache
-    def _xml_to_value(cls) -> dict[str, Self] | None:
-        if value_to_xml := cls._value_to_xml():
-            return {value: key for key, value in value_to_xml.items()}
-        return None
-
     def to_xml_value(self) -> str:
-        if value_to_xml := self._value_to_xml():
-            return value_to_xml[self]
+        if xml_values := self._xml_values:
+            return xml_values[self]
         return str(self)
 
     @classmethod
     def from_xml_value(cls, xml_value: str) -> Self:
-        if xml_to_value := cls._xml_to_value():
-            return cls(xml_to_value[xml_value])
+        if xml_members := cls._xml_members:
+            return cast('Self', xml_members[xml_value])
         return cls(xml_value)
 
+    @classmethod
+    def lookup_xml_value(cls, xml_value: str) -> Self | None:
+        if xml_members := cls._xml_members:
+            return cast('Self | None', xml_members.get(xml_value))
+        member = cls._value2member_map_.get(xml_value)
+        if member is None:
+            member = cls._member_aliases.get(xml_value.upper())
+        return cast('Self | None', member)
+
 
 class AccountType(EnumMixin, StrEnum):
     CURRENT = 'CURRENT'
@@ -582,6 +598,28 @@ type Cpf = Annotated[
     ),
 ]
 
+
+def document_kind(value: object) -> str:
+    if isinstance(value, str) and len(value.strip()) == CPF_LENGTH:
+        return 'cpf'
+    return 'cnpj'
+
+
+type CnpjOrCpf = Annotated[
+    Annotated[Cnpj, Tag('cnpj')] | Annotated[Cpf, Tag('cpf')],
+    Discriminator(document_kind),
+]
+
+type PartyDocument = Annotated[
+    str,
+    GetPydanticSchema(
+        lambda _tp, _handler: core_schema.str_schema(
+            pattern=r'^(?:[0-9]{11}|[0-9A-Z]{12}[0-9]{2})$',
+            strip_whitespace=True,
+        )
+    ),
+]
+
 type TransactionId = Annotated[
     str,
     GetPydanticSchema(
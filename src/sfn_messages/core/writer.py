@@ -0,0 +1,210 @@
+import codecs
+import sys
+from collections.abc import Callable, Mapping
+from functools import cache
+from types import MappingProxyType
+from typing import IO, cast
+from xml.etree import ElementTree as ET
+
+from .encoding import byte_order_mark
+
+XML_DECLARATION = '<?xml version="1.0"?>\n'
+INDENT_SPACE = '  '
+FLUSH_PARTS = 512
+
+
+class XmlNode:
+    __slots__ = ('attrib', 'children', 'tag', 'text')
+
+    def __init__(self, tag: str) -> None:
+        self.tag = tag
+        self.text: str | None = None
+        self.attrib: dict[str, str] = {}
+        self.children: list[XmlNode | ET.Element] = []
+
+    def find(self, tag: str) -> 'XmlNode | ET.Element | None':
+        for child in self.children:
+            if child.tag == tag:
+                return child
+        return None
+
+    def append(self, child: 'XmlNode | ET.Element') -> None:
+        self.children.append(child)
+
+    def to_element(self, factory: Callable[[str, dict[str, str]], ET.Element] = ET.Element) -> ET.Element:
+        element = factory(self.tag, self.attrib)
+        element.text = self.text
+        for child in self.children:
+            element.append(child.to_element(factory) if isinstance(child, XmlNode) else child)
+        return element
+
+
+def escape_text(text: str) -> str:
+    if '&' in text:
+        text = text.replace('&', '&amp;')
+    if '<' in text:
+        text = text.replace('<', '&lt;')
+    if '>' in text:
+        text = text.replace('>', '&gt;')
+    return text
+
+
+def escape_attribute(text: str) -> str:
+    text = escape_text(text)
+    if '"' in text:
+        text = text.replace('"', '&quot;')
+    if '\r' in text:
+        text = text.replace('\r', '&#13;')
+    if '\n' in text:
+        text = text.replace('\n', '&#10;')
+    if '\t' in text:
+        text = text.replace('\t', '&#09;')
+    return text
+
+
+@cache
+def indentation(level: int) -> str:
+    return '\n' + INDENT_SPACE * level
+
+
+class XmlWriter:
+    def __init__(self, *, default_namespace: str | None = None, indent: bool = True) -> None:
+        self.default_namespace = default_namespace
+        self.indent = indent
+        self._parts: list[str] = []
+        self._names: dict[str, str] = {}
+        self._namespaces: dict[str, str] = {}
+        self._indentations: list[str] = ['\n']
+        self._flush: Callable[[list[str]], object] | None = None
+        self._flush_size = sys.maxsize
+
+    def dumps(self, root: XmlNode | ET.Element) -> str:
+        self._parts = parts = [XML_DECLARATION]
+        self._names = {}
+        self._namespaces = {}
+
+        root_index = len(parts)
+        parts.append('')
+        self._write_content(root, 0)
+
+        parts[root_index] = self._start_tag(root, self._declarations())
+        return ''.join(parts)
+
+    def dumps_fragment(self, node: XmlNode | ET.Element, /, *, level: int = 0) -> str:
+        parts: list[str] = []
+        self._parts = parts
+        self._write_element(node, level)
+        return ''.join(parts)
+
+    @property
+    def namespaces(self) -> Mapping[str, str]:
+        return MappingProxyType(self._namespaces)
+
+    def dump(
+        self,
+        root: XmlNode | ET.Element,
+        sink: IO[str] | IO[bytes],
+        /,
+        *,
+        encoding: str | None = None,
+        bom: bool = False,
+    ) -> None:
+        self._names = {}
+        self._namespaces = {}
+        self._collect_names(root)
+
+        flush: Callable[[list[str]], object]
+        if encoding is None:
+            flush = cast('IO[str]', sink).writelines
+        else:
+            binary_sink = cast('IO[bytes]', sink)
+            encoder = codecs.getincrementalencoder(encoding)()
+            if bom:
+                binary_sink.write(byte_order_mark(encoding))
+            flush = lambda parts: binary_sink.write(encoder.encode(''.join(parts)))  # noqa: E731
+
+        self._parts = parts = [XML_DECLARATION, self._start_tag(root, self._declarations())]
+        self._flush = flush
+        self._flush_size = FLUSH_PARTS
+        try:
+            self._write_content(root, 0)
+            flush(parts)
+        finally:
+            self._parts = []
+            self._flush = None
+            self._flush_size = sys.maxsize
+
+    def _collect_names(self, node: XmlNode | ET.Element) -> None:
+        self._name(node.tag)
+        for child in node.children if isinstance(node, XmlNode) else node:
+            self._collect_names(child)
+
+    def _declarations(self) -> str:
+        return ''.join(
+            f' xmlns:{prefix}="{escape_attribute(uri)}"' if prefix else f' xmlns="{escape_attribute(uri)}"'
+            for uri, prefix in sorted(self._namespaces.items(), key=lambda item: item[1])
+        )
+
+    def _name(self, tag: str) -> str:
+        name = self._names.get(tag)
+        if name is None:
+            name = tag
+            if tag[:1] == '{':
+                uri, local_name = tag[1:].split('}', 1)
+                prefix = self._namespaces.get(uri)
+                if prefix is None:
+                    prefix = '' if uri == self.default_namespace else f'ns{len(self._namespaces)}'
+                    self._namespaces[uri] = prefix
+                name = f'{prefix}:{local_name}' if prefix else local_name
+            self._names[tag] = name
+        return name
+
+    def _start_tag(self, node: XmlNode | ET.Element, declarations: str = '') -> str:
+        if not node.attrib:
+            return f'<{self._name(node.tag)}{declarations}'
+        attributes = ''.join(f' {key}="{escape_attribute(value)}"' for key, value in node.attrib.items())
+        return f'<{self._name(node.tag)}{declarations}{attributes}'
+
+    def _indentation(self, level: int) -> str:
+        indentations = self._indentations
+        while len(indentations) <= level:
+            indentations.append(indentations[-1] + INDENT_SPACE)
+        return indentations[level]
+
+    def _write_element(self, node: XmlNode | ET.Element, level: int) -> None:
+        parts = self._parts
+        parts.append(self._start_tag(node))
+        self._write_content(node, level)
+        if len(parts) >= self._flush_size and self._flush is not None:
+            self._flush(parts)
+            parts.clear()
+
+    def _write_content(self, node: XmlNode | ET.Element, level: int) -> None:
+        parts = self._parts
+        name = self._name(node.tag)
+        children = node.children if isinstance(node, XmlNode) else list(node)
+        text = node.text
+
+        if not children:
+            if text:
+                parts.append(f'>{escape_text(text)}</{name}>')
+            else:
+                parts.append(' />')
+            return
+
+        parts.append('>')
+        if not self.indent:
+            if text:
+                parts.append(escape_text(text))
+            for child in children:
+                self._write_element(child, level + 1)
+            parts.append(f'</{name}>')
+            return
+
+        child_indentation = self._indentation(level + 1)
+        parts.append(escape_text(text) if text and text.strip() else child_indentation)
+        last = len(children) - 1
+        for index, child in enumerate(children):
+            self._write_element(child, level + 1)
+            parts.append(child_indentation if index < last else self._indentation(level))
+        parts.append(f'</{name}>')
@@ -8,7 +8,7 @@ from sfn_messages.core.types import (
     AccountType,
     Branch,
     Cnpj,
-    Cpf,
+    CnpjOrCpf,
     Description,
     ErrorCode,
     Ispb,
@@ -39,7 +39,7 @@ class SLB0001(BaseMessage):
     debtor_account_type: Annotated[AccountType | None, XmlPath(f'{PATH}/TpCtDebtd/text()')] = None
     account_number: Annotated[AccountNumber | None, XmlPath(f'{PATH}/CtDebtd/text()')] = None
     debtor_type: Annotated[PersonType | None, XmlPath(f'{PATH}/TpPessoaDebtd/text()')] = None
-    debtor_document: Annotated[Cnpj | Cpf | None, XmlPath(f'{PATH}/CNPJ_CPFCliDebtd/text()')] = None
+    debtor_document: Annotated[CnpjOrCpf | None, XmlPath(f'{PATH}/CNPJ_CPFCliDebtd/text()')] = None
     settlement_date: Annotated[date, XmlPath(f'{PATH}/DtMovto/text()')]
 
 
@@ -59,7 +59,7 @@ class SLB0001E(BaseMessage):
     debtor_account_type: Annotated[AccountType | None, XmlPath(f'{PATH_E}/TpCtDebtd/text()')] = None
     account_number: Annotated[AccountNumber | None, XmlPath(f'{PATH_E}/CtDebtd/text()')] = None
     debtor_type: Annotated[PersonType | None, XmlPath(f'{PATH_E}/TpPessoaDebtd/text()')] = None
-    debtor_document: Annotated[Cnpj | Cpf | None, XmlPath(f'{PATH_E}/CNPJ_CPFCliDebtd/text()')] = None
+    debtor_document: Annotated[CnpjOrCpf | None, XmlPath(f'{PATH_E}/CNPJ_CPFCliDebtd/text()')] = None
     settlement_date: Annotated[date | None, XmlPath(f'{PATH_E}/DtMovto/text()')] = None
 
     general_error_code: Annotated[ErrorCode | None, XmlPath(f'{PATH_E}/@CodErro')] = None
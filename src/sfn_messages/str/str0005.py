@@ -7,14 +7,13 @@ from sfn_messages.core.types import (
     AccountNumber,
     AccountType,
     Branch,
-    Cnpj,
-    Cpf,
     CustomerPurpose,
     Description,
     ErrorCode,
     InstitutionControlNumber,
     Ispb,
     Name,
+    PartyDocument,
     PaymentAccountNumber,
     PersonType,
     Priority,
@@ -46,7 +45,7 @@ class STR0005(PartyValidations, BaseMessage):
     debtor_institution_ispb: Annotated[Ispb, XmlPath(f'{PATH}/ISPBIFDebtd/text()')]
     debtor_branch: Annotated[Branch, XmlPath(f'{PATH}/AgDebtd/text()')]
     sender_type: Annotated[PersonType, XmlPath(f'{PATH}/TpPessoaRemet/text()')]
-    sender_document: Annotated[Cnpj | Cpf, XmlPath(f'{PATH}/CNPJ_CPFRemet/text()')]
+    sender_document: Annotated[PartyDocument, XmlPath(f'{PATH}/CNPJ_CPFRemet/text()')]
     sender_name: Annotated[Name, XmlPath(f'{PATH}/NomRemet/text()')]
     creditor_institution_ispb: Annotated[Ispb, XmlPath(f'{PATH}/ISPBIFCredtd/text()')]
     creditor_branch: Annotated[Branch | None, XmlPath(f'{PATH}/AgCredtd/text()')] = None
@@ -56,7 +55,7 @@ class STR0005(PartyValidations, BaseMessage):
     )
     creditor_account_type: Annotated[AccountType | None, XmlPath(f'{PATH}/TpCtCredtd/text()')] = None
     recipient_type: Annotated[PersonType, XmlPath(f'{PATH}/TpPessoaDestinatario/text()')]
-    recipient_document: Annotated[Cnpj | Cpf, XmlPath(f'{PATH}/CNPJ_CPFDestinatario/text()')]
+    recipient_document: Annotated[PartyDocument, XmlPath(f'{PATH}/CNPJ_CPFDestinatario/text()')]
     recipient_name: Annotated[Name, XmlPath(f'{PATH}/NomDestinatario/text()')]
     amount: Annotated[Decimal, XmlPath(f'{PATH}/VlrLanc/text()')]
     purpose: Annotated[CustomerPurpose, XmlPath(f'{PATH}/FinlddCli/text()')]
@@ -82,7 +81,7 @@ class STR0005R1(BaseMessage):
 class STR0005R2(PartyValidations, BaseMessage):
     XML_NAMESPACE: ClassVar[str | None] = XML_NAMESPACE
 
-    document_parties: ClassVar[list[str]] = ['debtor', 'creditor']
+    document_parties: ClassVar[list[str]] = ['sender', 'recipient']
     account_parties: ClassVar[list[str]] = ['debtor', 'creditor']
     others_enum_value: ClassVar[CustomerPurpose | None] = CustomerPurpose.OTHERS
     purpose_attr: ClassVar[str] = 'purpose'
@@ -94,7 +93,7 @@ class STR0005R2(PartyValidations, BaseMessage):
     debtor_institution_ispb: Annotated[Ispb, XmlPath(f'{PATH_R2}/ISPBIFDebtd/text()')]
     debtor_branch: Annotated[Branch, XmlPath(f'{PATH_R2}/AgDebtd/text()')]
     sender_type: Annotated[PersonType, XmlPath(f'{PATH_R2}/TpPessoaRemet/text()')]
-    sender_document: Annotated[Cnpj | Cpf, XmlPath(f'{PATH_R2}/CNPJ_CPFRemet/text()')]
+    sender_document: Annotated[PartyDocument, XmlPath(f'{PATH_R2}/CNPJ_CPFRemet/text()')]
     sender_name: Annotated[Name, XmlPath(f'{PATH_R2}/NomRemet/text()')]
     creditor_institution_ispb: Annotated[Ispb, XmlPath(f'{PATH_R2}/ISPBIFCredtd/text()')]
     creditor_branch: Annotated[Branch | None, XmlPath(f'{PATH_R2}/AgCredtd/text()')] = None
@@ -104,7 +103,7 @@ class STR0005R2(PartyValidations, BaseMessage):
     ] = None
     creditor_account_type: Annotated[AccountType | None, XmlPath(f'{PATH_R2}/TpCtCredtd/text()')] = None
     recipient_type: Annotated[PersonType, XmlPath(f'{PATH_R2}/TpPessoaDestinatario/text()')]
-    recipient_document: Annotated[Cnpj | Cpf, XmlPath(f'{PATH_R2}/CNPJ_CPFDestinatario/text()')]
+    recipient_document: Annotated[PartyDocument, XmlPath(f'{PATH_R2}/CNPJ_CPFDestinatario/text()')]
     recipient_name: Annotated[Name, XmlPath(f'{PATH_R2}/NomDestinatario/text()')]
     amount: Annotated[Decimal, XmlPath(f'{PATH_R2}/VlrLanc/text()')]
     purpose: Annotated[CustomerPurpose, XmlPath(f'{PATH_R2}/FinlddCli/text()')]
@@ -128,7 +127,7 @@ class STR0005E(PartyValidations, BaseMessage):
     debtor_institution_ispb: Annotated[Ispb | None, XmlPath(f'{PATH_E}/ISPBIFDebtd/text()')] = None
     debtor_branch: Annotated[Branch | None, XmlPath(f'{PATH_E}/AgDebtd/text()')] = None
     sender_type: Annotated[PersonType | None, XmlPath(f'{PATH_E}/TpPessoaRemet/text()')] = None
-    sender_document: Annotated[Cnpj | None | Cpf, XmlPath(f'{PATH_E}/CNPJ_CPFRemet/text()')] = None
+    sender_document: Annotated[PartyDocument | None, XmlPath(f'{PATH_E}/CNPJ_CPFRemet/text()')] = None
     sender_name: Annotated[Name | None, XmlPath(f'{PATH_E}/NomRemet/text()')] = None
     creditor_institution_ispb: Annotated[Ispb | None, XmlPath(f'{PATH_E}/ISPBIFCredtd/text()')] = None
     creditor_branch: Annotated[Branch | None, XmlPath(f'{PATH_E}/AgCredtd/text()')] = None
@@ -138,7 +137,7 @@ class STR0005E(PartyValidations, BaseMessage):
     ] = None
     creditor_account_type: Annotated[AccountType | None, XmlPath(f'{PATH_E}/TpCtCredtd/text()')] = None
     recipient_type: Annotated[PersonType | None, XmlPath(f'{PATH_E}/TpPessoaDestinatario/text()')] = None
-    recipient_document: Annotated[Cnpj | None | Cpf, XmlPath(f'{PATH_E}/CNPJ_CPFDestinatario/text()')] = None
+    recipient_document: Annotated[PartyDocument | None, XmlPath(f'{PATH_E}/CNPJ_CPFDestinatario/text()')] = None
     recipient_name: Annotated[Name | None, XmlPath(f'{PATH_E}/NomDestinatario/text()')] = None
     amount: Annotated[Decimal | None, XmlPath(f'{PATH_E}/VlrLanc/text()')] = None
     purpose: Annotated[CustomerPurpose | None, XmlPath(f'{PATH_E}/FinlddCli/text()')] = None
@@ -7,8 +7,6 @@ from sfn_messages.core.types import (
     AccountNumber,
     AccountType,
     Branch,
-    Cnpj,
-    Cpf,
     CreditContractNumber,
     CustomerPurpose,
     Description,
@@ -16,6 +14,7 @@ from sfn_messages.core.types import (
     InstitutionControlNumber,
     Ispb,
     Name,
+    PartyDocument,
     PaymentAccountNumber,
     PersonType,
     Priority,
@@ -55,13 +54,13 @@ class STR0006(PartyValidations, BaseMessage):
         PaymentAccountNumber | None, XmlPath(f'{PATH}/Grupo_STR0006_CtDebtd/CtPgtoDebtd/text()')
     ] = None
     sender_type: Annotated[PersonType | None, XmlPath(f'{PATH}/TpPessoaDebtd_Remet/text()')] = None
-    sender_document: Annotated[Cnpj | Cpf | None, XmlPath(f'{PATH}/CNPJ_CPFCliDebtd_Remet/text()')] = None
+    sender_document: Annotated[PartyDocument | None, XmlPath(f'{PATH}/CNPJ_CPFCliDebtd_Remet/text()')] = None
     sender_name: Annotated[Name | None, XmlPath(f'{PATH}/NomCliDebtd_Remet/text()')] = None
     creditor_institution_ispb: Annotated[Ispb, XmlPath(f'{PATH}/ISPBIFCredtd/text()')]
     creditor_branch: Annotated[Branch | None, XmlPath(f'{PATH}/AgCredtd/text()')] = None
     creditor_account_number: Annotated[AccountNumber | None, XmlPath(f'{PATH}/CtCredtd/text()')] = None
     recipient_type: Annotated[PersonType | None, XmlPath(f'{PATH}/TpPessoaDestinatario/text()')] = None
-    recipient_document: Annotated[Cnpj | Cpf | None, XmlPath(f'{PATH}/CNPJ_CPFDestinatario/text()')] = None
+    recipient_document: Annotated[PartyDocument | None, XmlPath(f'{PATH}/CNPJ_CPFDestinatario/text()')] = None
     recipient_name: Annotated[Name | None, XmlPath(f'{PATH}/NomDestinatario/text()')] = None
     credit_contract_number: Annotated[CreditContractNumber | None, XmlPath(f'{PATH}/NumContrtoOpCred/text()')] = None
     amount: Annotated[Decimal, XmlPath(f'{PATH}/VlrLanc/text()')]
@@ -108,13 +107,13 @@ class STR0006R2(PartyValidations, BaseMessage):
         PaymentAccountNumber | None, XmlPath(f'{PATH_R2}/Grupo_STR0006R2_CtDebtd/CtPgtoDebtd/text()')
     ] = None
     sender_type: Annotated[PersonType | None, XmlPath(f'{PATH_R2}/TpPessoaDebtd_Remet/text()')] = None
-    sender_document: Annotated[Cnpj | Cpf | None, XmlPath(f'{PATH_R2}/CNPJ_CPFCliDebtd_Remet/text()')] = None
+    sender_document: Annotated[PartyDocument | None, XmlPath(f'{PATH_R2}/CNPJ_CPFCliDebtd_Remet/text()')] = None
     sender_name: Annotated[Name | None, XmlPath(f'{PATH_R2}/NomCliDebtd_Remet/text()')] = None
     creditor_institution_ispb: Annotated[Ispb, XmlPath(f'{PATH_R2}/ISPBIFCredtd/text()')]
     creditor_branch: Annotated[Branch | None, XmlPath(f'{PATH_R2}/AgCredtd/text()')] = None
     creditor_account_number: Annotated[AccountNumber | None, XmlPath(f'{PATH_R2}/CtCredtd/text()')] = None
     recipient_type: Annotated[PersonType | None, XmlPath(f'{PATH_R2}/TpPessoaDestinatario/text()')] = None
-    recipient_document: Annotated[Cnpj | Cpf | None, XmlPath(f'{PATH_R2}/CNPJ_CPFDestinatario/text()')] = None
+    recipient_document: Annotated[PartyDocument | None, XmlPath(f'{PATH_R2}/CNPJ_CPFDestinatario/text()')] = None
     recipient_name: Annotated[Name | None, XmlPath(f'{PATH_R2}/NomDestinatario/text()')] = None
     credit_contract_number: Annotated[CreditContractNumber | None, XmlPath(f'{PATH_R2}/NumContrtoOpCred/text()')] = (
         None
@@ -151,13 +150,13 @@ class STR0006E(PartyValidations, BaseMessage):
         PaymentAccountNumber | None, XmlPath(f'{PATH_E}/Grupo_STR0006_CtDebtd/CtPgtoDebtd/text()')
     ] = None
     sender_type: Annotated[PersonType | None, XmlPath(f'{PATH_E}/TpPessoaDebtd_Remet/text()')] = None
-    sender_document: Annotated[Cnpj | Cpf | None, XmlPath(f'{PATH_E}/CNPJ_CPFCliDebtd_Remet/text()')] = None
+    sender_document: Annotated[PartyDocument | None, XmlPath(f'{PATH_E}/CNPJ_CPFCliDebtd_Remet/text()')] = None
     sender_name: Annotated[Name | None, XmlPath(f'{PATH_E}/NomCliDebtd_Remet/text()')] = None
     creditor_institution_ispb: Annotated[Ispb | None, XmlPath(f'{PATH_E}/ISPBIFCredtd/text()')] = None
     creditor_branch: Annotated[Branch | None, XmlPath(f'{PATH_E}/AgCredtd/text()')] = None
     creditor_account_number: Annotated[AccountNumber | None, XmlPath(f'{PATH_E}/CtCredtd/text()')] = None
     recipient_type: Annotated[PersonType | None, XmlPath(f'{PATH_E}/TpPessoaDestinatario/text()')] = None
-    recipient_document: Annotated[Cnpj | Cpf | None, XmlPath(f'{PATH_E}/CNPJ_CPFDestinatario/text()')] = None
+    recipient_document: Annotated[PartyDocument | None, XmlPath(f'{PATH_E}/CNPJ_CPFDestinatario/text()')] = None
     recipient_name: Annotated[Name | None, XmlPath(f'{PATH_E}/NomDestinatario/text()')] = None
     credit_contract_number: Annotated[CreditContractNumber | None, XmlPath(f'{PATH_E}/NumContrtoOpCred/text()')] = None
     amount: Annotated[Decimal | None, XmlPath(f'{PATH_E}/VlrLanc/text()')] = None
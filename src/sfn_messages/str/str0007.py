@@ -7,7 +7,6 @@ from sfn_messages.core.types import (
     AccountNumber,
     AccountType,
     Branch,
-    Cnpj,
     Cpf,
     CreditContractNumber,
     Description,
@@ -15,6 +14,7 @@ from sfn_messages.core.types import (
     InstitutionControlNumber,
     Ispb,
     Name,
+    PartyDocument,
     PaymentAccountNumber,
     PersonType,
     Priority,
@@ -47,7 +47,7 @@ class STR0007(PartyValidations, BaseMessage):
     institution_control_number: Annotated[InstitutionControlNumber, XmlPath(f'{PATH}/NumCtrlIF/text()')]
     debtor_institution_ispb: Annotated[Ispb, XmlPath(f'{PATH}/ISPBIFDebtd/text()')]
     sender_type: Annotated[PersonType | None, XmlPath(f'{PATH}/TpPessoaRemet/text()')] = None
-    sender_document: Annotated[Cnpj | Cpf | None, XmlPath(f'{PATH}/CNPJ_CPFRemet/text()')] = None
+    sender_document: Annotated[PartyDocument | None, XmlPath(f'{PATH}/CNPJ_CPFRemet/text()')] = None
     sender_name: Annotated[Name | None, XmlPath(f'{PATH}/NomRemet/text()')] = None
     creditor_institution_ispb: Annotated[Ispb, XmlPath(f'{PATH}/ISPBIFCredtd/text()')]
     creditor_branch: Annotated[Branch | None, XmlPath(f'{PATH}/AgCredtd/text()')] = None
@@ -57,7 +57,7 @@ class STR0007(PartyValidations, BaseMessage):
         None
     )
     creditor_type: Annotated[PersonType, XmlPath(f'{PATH}/TpPessoaCredtd/text()')]
-    creditor_document: Annotated[Cnpj | Cpf, XmlPath(f'{PATH}/CNPJ_CPFCliCredtd/text()')]
+    creditor_document: Annotated[PartyDocument, XmlPath(f'{PATH}/CNPJ_CPFCliCredtd/text()')]
     creditor_name: Annotated[Name, XmlPath(f'{PATH}/NomCliCredtd/text()')]
     credit_contract_number: Annotated[CreditContractNumber | None, XmlPath(f'{PATH}/NumContrtoOpCred/text()')] = None
     amount: Annotated[Decimal, XmlPath(f'{PATH}/VlrLanc/text()')]
@@ -96,7 +96,7 @@ class STR0007R2(PartyValidations, BaseMessage):
     vendor_timestamp: Annotated[datetime, XmlPath(f'{PATH_R2}/DtHrBC/text()')]
     debtor_institution_ispb: Annotated[Ispb, XmlPath(f'{PATH_R2}/ISPBIFDebtd/text()')]
     sender_type: Annotated[PersonType | None, XmlPath(f'{PATH_R2}/TpPessoaRemet/text()')] = None
-    sender_document: Annotated[Cnpj | Cpf | None, XmlPath(f'{PATH_R2}/CNPJ_CPFRemet/text()')] = None
+    sender_document: Annotated[PartyDocument | None, XmlPath(f'{PATH_R2}/CNPJ_CPFRemet/text()')] = None
     sender_name: Annotated[Name | None, XmlPath(f'{PATH_R2}/NomRemet/text()')] = None
     creditor_institution_ispb: Annotated[Ispb, XmlPath(f'{PATH_R2}/ISPBIFCredtd/text()')]
     creditor_branch: Annotated[Branch | None, XmlPath(f'{PATH_R2}/AgCredtd/text()')] = None
@@ -106,7 +106,7 @@ class STR0007R2(PartyValidations, BaseMessage):
         PaymentAccountNumber | None, XmlPath(f'{PATH_R2}/CtPgtoCredtd/text()')
     ] = None
     creditor_type: Annotated[PersonType, XmlPath(f'{PATH_R2}/TpPessoaCredtd/text()')]
-    creditor_document: Annotated[Cnpj | Cpf, XmlPath(f'{PATH_R2}/CNPJ_CPFCliCredtd/text()')]
+    creditor_document: Annotated[PartyDocument, XmlPath(f'{PATH_R2}/CNPJ_CPFCliCredtd/text()')]
     creditor_name: Annotated[Name, XmlPath(f'{PATH_R2}/NomCliCredtd/text()')]
     credit_contract_number: Annotated[CreditContractNumber | None, XmlPath(f'{PATH_R2}/NumContrtoOpCred/text()')] = (
         None
@@ -133,7 +133,7 @@ class STR0007E(PartyValidations, BaseMessage):
     )
     debtor_institution_ispb: Annotated[Ispb | None, XmlPath(f'{PATH_E}/ISPBIFDebtd/text()')] = None
     sender_type: Annotated[PersonType | None, XmlPath(f'{PATH_E}/TpPessoaRemet/text()')] = None
-    sender_document: Annotated[Cnpj | None | Cpf, XmlPath(f'{PATH_E}/CNPJ_CPFRemet/text()')] = None
+    sender_document: Annotated[PartyDocument | None, XmlPath(f'{PATH_E}/CNPJ_CPFRemet/text()')] = None
     sender_name: Annotated[Name | None, XmlPath(f'{PATH_E}/NomRemet/text()')] = None
     creditor_institution_ispb: Annotated[Ispb | None, XmlPath(f'{PATH_E}/ISPBIFCredtd/text()')] = None
     creditor_branch: Annotated[Branch | None, XmlPath(f'{PATH_E}/AgCredtd/text()')] = None
@@ -143,7 +143,7 @@ class STR0007E(PartyValidations, BaseMessage):
         PaymentAccountNumber | None, XmlPath(f'{PATH_E}/CtPgtoCredtd/text()')
     ] = None
     creditor_type: Annotated[PersonType | None, XmlPath(f'{PATH_E}/TpPessoaCredtd/text()')] = None
-    creditor_document: Annotated[Cnpj | None | Cpf, XmlPath(f'{PATH_E}/CNPJ_CPFCliCredtd/text()')] = None
+    creditor_document: Annotated[PartyDocument | None, XmlPath(f'{PATH_E}/CNPJ_CPFCliCredtd/text()')] = None
     creditor_name: Annotated[Name | None, XmlPath(f'{PATH_E}/NomCliCredtd/text()')] = None
     credit_contract_number: Annotated[CreditContractNumber | None, XmlPath(f'{PATH_E}/NumContrtoOpCred/text()')] = None
     amount: Annotated[Decimal | None, XmlPath(f'{PATH_E}/VlrLanc/text()')] = None
@@ -7,7 +7,6 @@ from sfn_messages.core.types import (
     AccountNumber,
     AccountType,
     Branch,
-    Cnpj,
     Cpf,
     CustomerPurpose,
     Description,
@@ -15,6 +14,7 @@ from sfn_messages.core.types import (
     InstitutionControlNumber,
     Ispb,
     Name,
+    PartyDocument,
     PaymentAccountNumber,
     PersonType,
     Priority,
@@ -50,7 +50,7 @@ class STR0008(PartyValidations, BaseMessage):
     debtor_account_number: Annotated[AccountNumber | None, XmlPath(f'{PATH}/CtDebtd/text()')] = None
     debtor_payment_account_number: Annotated[PaymentAccountNumber | None, XmlPath(f'{PATH}/CtPgtoDebtd/text()')] = None
     debtor_type: Annotated[PersonType, XmlPath(f'{PATH}/TpPessoaDebtd/text()')]
-    debtor_document: Annotated[Cnpj | Cpf, XmlPath(f'{PATH}/CNPJ_CPFCliDebtd/text()')]
+    debtor_document: Annotated[PartyDocument, XmlPath(f'{PATH}/CNPJ_CPFCliDebtd/text()')]
     debtor_name: Annotated[Name, XmlPath(f'{PATH}/NomCliDebtd/text()')]
     creditor_institution_ispb: Annotated[Ispb, XmlPath(f'{PATH}/ISPBIFCredtd/text()')]
     creditor_branch: Annotated[Branch | None, XmlPath(f'{PATH}/AgCredtd/text()')] = None
@@ -60,7 +60,7 @@ class STR0008(PartyValidations, BaseMessage):
         None
     )
     creditor_type: Annotated[PersonType, XmlPath(f'{PATH}/TpPessoaCredtd/text()')]
-    creditor_document: Annotated[Cnpj | Cpf, XmlPath(f'{PATH}/CNPJ_CPFCliCredtd/text()')]
+    creditor_document: Annotated[PartyDocument, XmlPath(f'{PATH}/CNPJ_CPFCliCredtd/text()')]
     creditor_name: Annotated[Name, XmlPath(f'{PATH}/NomCliCredtd/text()')]
     amount: Annotated[Decimal, XmlPath(f'{PATH}/VlrLanc/text()')]
     purpose: Annotated[CustomerPurpose, XmlPath(f'{PATH}/FinlddCli/text()')]
@@ -104,7 +104,7 @@ class STR0008R2(PartyValidations, BaseMessage):
         None
     )
     debtor_type: Annotated[PersonType, XmlPath(f'{PATH_R2}/TpPessoaDebtd/text()')]
-    debtor_document: Annotated[Cnpj | Cpf, XmlPath(f'{PATH_R2}/CNPJ_CPFCliDebtd/text()')]
+    debtor_document: Annotated[PartyDocument, XmlPath(f'{PATH_R2}/CNPJ_CPFCliDebtd/text()')]
     debtor_name: Annotated[Name, XmlPath(f'{PATH_R2}/NomCliDebtd/text()')]
     creditor_institution_ispb: Annotated[Ispb, XmlPath(f'{PATH_R2}/ISPBIFCredtd/text()')]
     creditor_branch: Annotated[Branch | None, XmlPath(f'{PATH_R2}/AgCredtd/text()')] = None
@@ -114,7 +114,7 @@ class STR0008R2(PartyValidations, BaseMessage):
         PaymentAccountNumber | None, XmlPath(f'{PATH_R2}/CtPgtoCredtd/text()')
     ] = None
     creditor_type: Annotated[PersonType, XmlPath(f'{PATH_R2}/TpPessoaCredtd/text()')]
-    creditor_document: Annotated[Cnpj | Cpf, XmlPath(f'{PATH_R2}/CNPJ_CPFCliCredtd/text()')]
+    creditor_document: Annotated[PartyDocument, XmlPath(f'{PATH_R2}/CNPJ_CPFCliCredtd/text()')]
     creditor_name: Annotated[Name, XmlPath(f'{PATH_R2}/NomCliCredtd/text()')]
     amount: Annotated[Decimal, XmlPath(f'{PATH_R2}/VlrLanc/text()')]
     purpose: Annotated[CustomerPurpose, XmlPath(f'{PATH_R2}/FinlddCli/text()')]
@@ -144,7 +144,7 @@ class STR0008E(PartyValidations, BaseMessage):
         None
     )
     debtor_type: Annotated[PersonType | None, XmlPath(f'{PATH_E}/TpPessoaDebtd/text()')] = None
-    debtor_document: Annotated[Cnpj | None | Cpf, XmlPath(f'{PATH_E}/CNPJ_CPFCliDebtd/text()')] = None
+    debtor_document: Annotated[PartyDocument | None, XmlPath(f'{PATH_E}/CNPJ_CPFCliDebtd/text()')] = None
     debtor_name: Annotated[Name | None, XmlPath(f'{PATH_E}/NomCliDebtd/text()')] = None
     creditor_institution_ispb: Annotated[Ispb | None, XmlPath(f'{PATH_E}/ISPBIFCredtd/text()')] = None
     creditor_branch: Annotated[Branch | None, XmlPath(f'{PATH_E}/AgCredtd/text()')] = None
@@ -154,7 +154,7 @@ class STR0008E(PartyValidations, BaseMessage):
         PaymentAccountNumber | None, XmlPath(f'{PATH_E}/CtPgtoCredtd/text()')
     ] = None
     creditor_type: Annotated[PersonType | None, XmlPath(f'{PATH_E}/TpPessoaCredtd/text()')] = None
-    creditor_document: Annotated[Cnpj | None | Cpf, XmlPath(f'{PATH_E}/CNPJ_CPFCliCredtd/text()')] = None
+    creditor_document: Annotated[PartyDocument | None, XmlPath(f'{PATH_E}/CNPJ_CPFCliCredtd/text()')] = None
     creditor_name: Annotated[Name | None, XmlPath(f'{PATH_E}/NomCliCredtd/text()')] = None
     amount: Annotated[Decimal | None, XmlPath(f'{PATH_E}/VlrLanc/text()')] = None
     purpose: Annotated[CustomerPurpose | None, XmlPath(f'{PATH_E}/FinlddCli/text()')] = None
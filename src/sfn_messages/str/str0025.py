@@ -7,13 +7,12 @@ from sfn_messages.core.types import (
     AccountNumber,
     AccountType,
     Branch,
-    Cnpj,
-    Cpf,
     DepositIdentifier,
     ErrorCode,
     InstitutionControlNumber,
     Ispb,
     Name,
+    PartyDocument,
     PaymentAccountNumber,
     PersonType,
     Priority,
@@ -46,7 +45,7 @@ class STR0025(PartyValidations, BaseMessage):
     debtor_payment_account_number: Annotated[PaymentAccountNumber | None, XmlPath(f'{PATH}/CtPgtoDebtd/text()')] = None
     debtor_name: Annotated[Name, XmlPath(f'{PATH}/NomCliDebtd/text()')]
     debtor_type: Annotated[PersonType, XmlPath(f'{PATH}/TpPessoaDebtd/text()')]
-    debtor_document: Annotated[Cnpj | Cpf, XmlPath(f'{PATH}/CNPJ_CPFCliDebtd/text()')]
+    debtor_document: Annotated[PartyDocument, XmlPath(f'{PATH}/CNPJ_CPFCliDebtd/text()')]
     creditor_institution_ispb: Annotated[Ispb, XmlPath(f'{PATH}/ISPBIFCredtd/text()')]
     amount: Annotated[Decimal, XmlPath(f'{PATH}/VlrLanc/text()')]
     priority: Annotated[Priority | None, XmlPath(f'{PATH}/NivelPref/text()')] = None
@@ -86,7 +85,7 @@ class STR0025R2(PartyValidations, BaseMessage):
     )
     creditor_name: Annotated[Name, XmlPath(f'{PATH_R2}/NomCliCredtd/text()')]
     creditor_type: Annotated[PersonType, XmlPath(f'{PATH_R2}/TpPessoaCredtd/text()')]
-    creditor_document: Annotated[Cnpj | Cpf, XmlPath(f'{PATH_R2}/CNPJ_CPFCliCredtd/text()')]
+    creditor_document: Annotated[PartyDocument, XmlPath(f'{PATH_R2}/CNPJ_CPFCliCredtd/text()')]
     creditor_institution_ispb: Annotated[Ispb, XmlPath(f'{PATH_R2}/ISPBIFCredtd/text()')]
     amount: Annotated[Decimal, XmlPath(f'{PATH_R2}/VlrLanc/text()')]
     deposit_identifier: Annotated[DepositIdentifier, XmlPath(f'{PATH_R2}/IdentcDep/text()')]
@@ -112,7 +111,7 @@ class STR0025E(PartyValidations, BaseMessage):
     )
     debtor_name: Annotated[Name | None, XmlPath(f'{PATH_E}/NomCliDebtd/text()')] = None
     debtor_type: Annotated[PersonType | None, XmlPath(f'{PATH_E}/TpPessoaDebtd/text()')] = None
-    debtor_document: Annotated[Cnpj | Cpf | None, XmlPath(f'{PATH_E}/CNPJ_CPFCliDebtd/text()')] = None
+    debtor_document: Annotated[PartyDocument | None, XmlPath(f'{PATH_E}/CNPJ_CPFCliDebtd/text()')] = None
     creditor_institution_ispb: Annotated[Ispb | None, XmlPath(f'{PATH_E}/ISPBIFCredtd/text()')] = None
     amount: Annotated[Decimal | None, XmlPath(f'{PATH_E}/VlrLanc/text()')] = None
     priority: Annotated[Priority | None, XmlPath(f'{PATH_E}/NivelPref/text()')] = None
@@ -7,14 +7,13 @@ from sfn_messages.core.types import (
     AccountNumber,
     AccountType,
     Branch,
-    Cnpj,
-    Cpf,
     CustomerPurpose,
     Description,
     ErrorCode,
     InstitutionControlNumber,
     Ispb,
     Name,
+    PartyDocument,
     PaymentAccountNumber,
     PersonType,
     Priority,
@@ -50,7 +49,7 @@ class STR0034(PartyValidations, BaseMessage):
     debtor_account_number: Annotated[AccountNumber | None, XmlPath(f'{PATH}/CtDebtd/text()')] = None
     debtor_payment_account_number: Annotated[PaymentAccountNumber | None, XmlPath(f'{PATH}/CtPgtoDebtd/text()')] = None
     debtor_type: Annotated[PersonType, XmlPath(f'{PATH}/TpPessoaDebtd/text()')]
-    debtor_document: Annotated[Cnpj | Cpf, XmlPath(f'{PATH}/CNPJ_CPFCliDebtd/text()')]
+    debtor_document: Annotated[PartyDocument, XmlPath(f'{PATH}/CNPJ_CPFCliDebtd/text()')]
     debtor_name: Annotated[Name, XmlPath(f'{PATH}/NomCliDebtd/text()')]
     creditor_institution_ispb: Annotated[Ispb, XmlPath(f'{PATH}/ISPBIFCredtd/text()')]
     creditor_branch: Annotated[Branch | None, XmlPath(f'{PATH}/AgCredtd/text()')] = None
@@ -60,13 +59,13 @@ class STR0034(PartyValidations, BaseMessage):
         None
     )
     creditor_type: Annotated[PersonType, XmlPath(f'{PATH}/TpPessoaCredtd/text()')]
-    creditor_document: Annotated[Cnpj | Cpf, XmlPath(f'{PATH}/CNPJ_CPFCliCredtd/text()')]
+    creditor_document: Annotated[PartyDocument, XmlPath(f'{PATH}/CNPJ_CPFCliCredtd/text()')]
     creditor_name: Annotated[Name, XmlPath(f'{PATH}/NomCliCredtd/text()')]
     amount: Annotated[Decimal, XmlPath(f'{PATH}/VlrLanc/text()')]
     purpose: Annotated[CustomerPurpose, XmlPath(f'{PATH}/FinlddCli/text()')]
     transaction_id: Annotated[TransactionId | None, XmlPath(f'{PATH}/CodCli/text()')] = None
     investor_type: Annotated[PersonType, XmlPath(f'{PATH}/TpPessoaInvest/text()')]
-    investor_document: Annotated[Cnpj | Cpf, XmlPath(f'{PATH}/CNPJ_CPFInvest/text()')]
+    investor_document: Annotated[PartyDocument, XmlPath(f'{PATH}/CNPJ_CPFInvest/text()')]
     investor_name: Annotated[Name, XmlPath(f'{PATH}/Nom_RzSocInvest/text()')]
     description: Annotated[Description | None, XmlPath(f'{PATH}/Hist/text()')] = None
     priority: Annotated[Priority | None, XmlPath(f'{PATH}/NivelPref/text()')] = None
@@ -107,7 +106,7 @@ class STR0034R2(PartyValidations, BaseMessage):
         None
     )
     debtor_type: Annotated[PersonType, XmlPath(f'{PATH_R2}/TpPessoaDebtd/text()')]
-    debtor_document: Annotated[Cnpj | Cpf, XmlPath(f'{PATH_R2}/CNPJ_CPFCliDebtd/text()')]
+    debtor_document: Annotated[PartyDocument, XmlPath(f'{PATH_R2}/CNPJ_CPFCliDebtd/text()')]
     debtor_name: Annotated[Name, XmlPath(f'{PATH_R2}/NomCliDebtd/text()')]
     creditor_institution_ispb: Annotated[Ispb, XmlPath(f'{PATH_R2}/ISPBIFCredtd/text()')]
     creditor_branch: Annotated[Branch | None, XmlPath(f'{PATH_R2}/AgCredtd/text()')] = None
@@ -117,13 +116,13 @@ class STR0034R2(PartyValidations, BaseMessage):
         PaymentAccountNumber | None, XmlPath(f'{PATH_R2}/CtPgtoCredtd/text()')
     ] = None
     creditor_type: Annotated[PersonType, XmlPath(f'{PATH_R2}/TpPessoaCredtd/text()')]
-    creditor_document: Annotated[Cnpj | Cpf, XmlPath(f'{PATH_R2}/CNPJ_CPFCliCredtd/text()')]
+    creditor_document: Annotated[PartyDocument, XmlPath(f'{PATH_R2}/CNPJ_CPFCliCredtd/text()')]
     creditor_name: Annotated[Name, XmlPath(f'{PATH_R2}/NomCliCredtd/text()')]
     amount: Annotated[Decimal, XmlPath(f'{PATH_R2}/VlrLanc/text()')]
     purpose: Annotated[CustomerPurpose, XmlPath(f'{PATH_R2}/FinlddCli/text()')]
     transaction_id: Annotated[TransactionId | None, XmlPath(f'{PATH_R2}/CodCli/text()')] = None
     investor_type: Annotated[PersonType, XmlPath(f'{PATH_R2}/TpPessoaInvest/text()')]
-    investor_document: Annotated[Cnpj | Cpf, XmlPath(f'{PATH_R2}/CNPJ_CPFInvest/text()')]
+    investor_document: Annotated[PartyDocument, XmlPath(f'{PATH_R2}/CNPJ_CPFInvest/text()')]
     investor_name: Annotated[Name, XmlPath(f'{PATH_R2}/Nom_RzSocInvest/text()')]
     description: Annotated[Description | None, XmlPath(f'{PATH_R2}/Hist/text()')] = None
     settlement_date: Annotated[date, XmlPath(f'{PATH_R2}/DtMovto/text()')]
@@ -150,7 +149,7 @@ class STR0034E(PartyValidations, BaseMessage):
         None
     )
     debtor_type: Annotated[PersonType | None, XmlPath(f'{PATH_E}/TpPessoaDebtd/text()')] = None
-    debtor_document: Annotated[Cnpj | None | Cpf, XmlPath(f'{PATH_E}/CNPJ_CPFCliDebtd/text()')] = None
+    debtor_document: Annotated[PartyDocument | None, XmlPath(f'{PATH_E}/CNPJ_CPFCliDebtd/text()')] = None
     debtor_name: Annotated[Name | None, XmlPath(f'{PATH_E}/NomCliDebtd/text()')] = None
     creditor_institution_ispb: Annotated[Ispb | None, XmlPath(f'{PATH_E}/ISPBIFCredtd/text()')] = None
     creditor_branch: Annotated[Branch | None, XmlPath(f'{PATH_E}/AgCredtd/text()')] = None
@@ -160,13 +159,13 @@ class STR0034E(PartyValidations, BaseMessage):
         PaymentAccountNumber | None, XmlPath(f'{PATH_E}/CtPgtoCredtd/text()')
     ] = None
     creditor_type: Annotated[PersonType | None, XmlPath(f'{PATH_E}/TpPessoaCredtd/text()')] = None
-    creditor_document: Annotated[Cnpj | Cpf | None, XmlPath(f'{PATH_E}/CNPJ_CPFCliCredtd/text()')] = None
+    creditor_document: Annotated[PartyDocument | None, XmlPath(f'{PATH_E}/CNPJ_CPFCliCredtd/text()')] = None
     creditor_name: Annotated[Name | None, XmlPath(f'{PATH_E}/NomCliCredtd/text()')] = None
     amount: Annotated[Decimal | None, XmlPath(f'{PATH_E}/VlrLanc/text()')] = None
     purpose: Annotated[CustomerPurpose | None, XmlPath(f'{PATH_E}/FinlddCli/text()')] = None
     transaction_id: Annotated[TransactionId | None, XmlPath(f'{PATH_E}/CodCli/text()')] = None
     investor_type: Annotated[PersonType | None, XmlPath(f'{PATH_E}/TpPessoaInvest/text()')] = None
-    investor_document: Annotated[Cnpj | Cpf | None, XmlPath(f'{PATH_E}/CNPJ_CPFInvest/text()')] = None
+    investor_document: Annotated[PartyDocument | None, XmlPath(f'{PATH_E}/CNPJ_CPFInvest/text()')] = None
     investor_name: Annotated[Name | None, XmlPath(f'{PATH_E}/Nom_RzSocInvest/text()')] = None
     description: Annotated[Description | None, XmlPath(f'{PATH_E}/Hist/text()')] = None
     priority: Annotated[Priority | None, XmlPath(f'{PATH_E}/NivelPref/text()')] = None
@@ -7,6 +7,7 @@ from sfn_messages.core.types import (
     AccountNumber,
     Branch,
     Cnpj,
+    CnpjOrCpf,
     Cpf,
     Description,
     ErrorCode,
@@ -37,7 +38,7 @@ XML_NAMESPACE_ERROR = 'http://www.bcb.gov.br/SPB/STR0047E.xsd'
 
 class FinancialAgentDebitedGroup(BaseSubMessage):
     debtor_account_number: Annotated[AccountNumber, XmlPath(f'{PATH_DEBIT_GROUP}/CtDebtd/text()')]
-    debtor_document: Annotated[Cnpj | Cpf, XmlPath(f'{PATH_DEBIT_GROUP}/CNPJ_CPFCliDebtd/text()')]
+    debtor_document: Annotated[CnpjOrCpf, XmlPath(f'{PATH_DEBIT_GROUP}/CNPJ_CPFCliDebtd/text()')]
     debtor_name: Annotated[Name, XmlPath(f'{PATH_DEBIT_GROUP}/NomeCliDebtd/text()')]
 
 
@@ -82,7 +83,7 @@ class STR0047R1(BaseMessage):
 
 class FinancialAgentDebitedR2Group(BaseSubMessage):
     debtor_account_number: Annotated[AccountNumber, XmlPath(f'{PATH_R2_DEBIT_GROUP}/CtDebtd/text()')]
-    debtor_document: Annotated[Cnpj | Cpf, XmlPath(f'{PATH_R2_DEBIT_GROUP}/CNPJ_CPFCliDebtd/text()')]
+    debtor_document: Annotated[CnpjOrCpf, XmlPath(f'{PATH_R2_DEBIT_GROUP}/CNPJ_CPFCliDebtd/text()')]
     debtor_name: Annotated[Name, XmlPath(f'{PATH_R2_DEBIT_GROUP}/NomeCliDebtd/text()')]
 
 
@@ -113,7 +114,7 @@ class STR0047R2(BaseMessage):
 
 class FinancialAgentDebitedR3Group(BaseSubMessage):
     debtor_account_number: Annotated[AccountNumber, XmlPath(f'{PATH_R3_DEBIT_GROUP}/CtDebtd/text()')]
-    debtor_document: Annotated[Cnpj | Cpf, XmlPath(f'{PATH_R3_DEBIT_GROUP}/CNPJ_CPFCliDebtd/text()')]
+    debtor_document: Annotated[CnpjOrCpf, XmlPath(f'{PATH_R3_DEBIT_GROUP}/CNPJ_CPFCliDebtd/text()')]
     debtor_name: Annotated[Name, XmlPath(f'{PATH_R3_DEBIT_GROUP}/NomeCliDebtd/text()')]
 
 
@@ -144,7 +145,7 @@ class STR0047R3(BaseMessage):
 
 class FinancialAgentDebitedGroupError(BaseSubMessage):
     debtor_account_number: Annotated[AccountNumber | None, XmlPath(f'{PATH_DEBIT_GROUP}/CtDebtd/text()')] = None
-    debtor_document: Annotated[Cnpj | Cpf | None, XmlPath(f'{PATH_DEBIT_GROUP}/CNPJ_CPFCliDebtd/text()')] = None
+    debtor_document: Annotated[CnpjOrCpf | None, XmlPath(f'{PATH_DEBIT_GROUP}/CNPJ_CPFCliDebtd/text()')] = None
     debtor_name: Annotated[Name | None, XmlPath(f'{PATH_DEBIT_GROUP}/NomeCliDebtd/text()')] = None
 
     debtor_account_number_error_code: Annotated[ErrorCode | None, XmlPath(f'{PATH_DEBIT_GROUP}/CtDebtd/@CodErro')] = (
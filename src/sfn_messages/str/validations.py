@@ -1,10 +1,75 @@
-from collections.abc import Iterable
+from collections.abc import Callable
+from dataclasses import dataclass
+from operator import attrgetter
 from typing import Any, ClassVar, Self
 
 from pydantic import model_validator
-from validate_docbr import CNPJ, CPF
 
-from sfn_messages.core.types import AccountNumber, AccountType, Branch, PaymentAccountNumber, PersonType
+from sfn_messages.core.caching import class_cache
+from sfn_messages.core.documents import CPF, is_valid_cnpj, is_valid_cpf
+from sfn_messages.core.types import AccountType, PersonType
+
+type FieldGetter = Callable[[object], Any]
+
+
+def _missing_field(_message: object, /) -> None:
+    return None
+
+
+@dataclass(frozen=True, slots=True)
+class PartyDocumentRule:
+    party: str
+    get_type: FieldGetter
+    get_document: FieldGetter
+
+    def validate(self, message: object, errors: list[str]) -> None:
+        document: str | None = self.get_document(message)
+        if not document:
+            return
+
+        person_type: PersonType | None = self.get_type(message)
+        if person_type is PersonType.BUSINESS:
+            if not is_valid_cnpj(document):
+                errors.append(f'Invalid CNPJ for {self.party}_type BUSINESS')
+        elif person_type is PersonType.INDIVIDUAL:
+            if not is_valid_cpf(document):
+                errors.append(f'Invalid CPF for {self.party}_type INDIVIDUAL')
+        elif not (is_valid_cpf(document) if len(document) == CPF.length else is_valid_cnpj(document)):
+            errors.append(f'Invalid CNPJ or CPF for {self.party}_document')
+
+
+@dataclass(frozen=True, slots=True)
+class PartyAccountRule:
+    party: str
+    get_account_type: FieldGetter
+    get_branch: FieldGetter
+    get_account_number: FieldGetter
+    get_payment_account_number: FieldGetter
+
+    def validate(self, message: object, errors: list[str]) -> None:
+        account_type: AccountType | None = self.get_account_type(message)
+        if account_type is None:
+            return
+
+        party = self.party
+        if account_type == AccountType.PAYMENT:
+            if self.get_payment_account_number(message) is None:
+                errors.append(f'{party}_payment_account_number is required when {party}_account_type is PAYMENT')
+            return
+
+        if self.get_branch(message) is None:
+            errors.append(f'{party}_branch is required when {party}_account_type is not PAYMENT')
+
+        if self.get_account_number(message) is None:
+            errors.append(f'{party}_account_number is required when {party}_account_type is not PAYMENT')
+
+
+@dataclass(frozen=True, slots=True)
+class PartyValidationPlan:
+    documents: tuple[PartyDocumentRule, ...]
+    accounts: tuple[PartyAccountRule, ...]
+    get_purpose: FieldGetter
+    get_description: FieldGetter
 
 
 class PartyValidations:
@@ -15,33 +80,51 @@ class PartyValidations:
     description_attr: ClassVar[str] = 'description'
 
     @classmethod
-    def normalize_parties(cls, value: object) -> list[str]:
-        if value is None:
-            return []
-        if isinstance(value, str):
-            return [value]
-        if isinstance(value, Iterable):
-            return [str(v) for v in value]
-        msg = 'Parties must be a string or iterable of strings.'
-        raise TypeError(msg)
+    def _field_getter(cls, name: str) -> FieldGetter:
+        fields: dict[str, Any] = getattr(cls, 'model_fields', {})
+        return attrgetter(name) if name in fields else _missing_field
+
+    @classmethod
+    @class_cache
+    def get_party_validation_plan(cls) -> PartyValidationPlan:
+        field = cls._field_getter
+        return PartyValidationPlan(
+            documents=tuple(
+                PartyDocumentRule(
+                    party=party,
+                    get_type=field(f'{party}_type'),
+                    get_document=field(f'{party}_document'),
+                )
+                for party in cls.document_parties
+            ),
+            accounts=tuple(
+                PartyAccountRule(
+                    party=party,
+                    get_account_type=field(f'{party}_account_type'),
+                    get_branch=field(f'{party}_branch'),
+                    get_account_number=field(f'{party}_account_number'),
+                    get_payment_account_number=field(f'{party}_payment_account_number'),
+                )
+                for party in cls.account_parties
+            ),
+            get_purpose=field(cls.purpose_attr),
+            get_description=field(cls.description_attr),
+        )
 
     @model_validator(mode='after')
     def validate_business_rules_mixin(self) -> Self:
         errors: list[str] = []
+        plan = self.get_party_validation_plan()
 
-        doc_parties = self.normalize_parties(self.document_parties)
-        acc_parties = self.normalize_parties(self.account_parties)
-
-        for party in doc_parties:
-            self._validate_party_document(party=party, errors=errors)
+        for document_rule in plan.documents:
+            document_rule.validate(self, errors)
 
-        for party in acc_parties:
-            self._validate_account_requirements(party=party, errors=errors)
+        for account_rule in plan.accounts:
+            account_rule.validate(self, errors)
 
         if self.others_enum_value is not None:
-            purpose = getattr(self, self.purpose_attr, None)
-            description = getattr(self, self.description_attr, None)
-            if purpose == self.others_enum_value and not description:
+            purpose = plan.get_purpose(self)
+            if purpose == self.others_enum_value and not plan.get_description(self):
                 errors.append(f'{self.description_attr} is required when {self.purpose_attr} is OTHERS')
 
         if errors:
@@ -49,39 +132,3 @@ class PartyValidations:
             raise ValueError(msg)
 
         return self
-
-    def _validate_party_document(self, party: str, errors: list[str]) -> None:
-        prefix = f'{party}_'
-
-        person_type: PersonType | None = getattr(self, prefix + 'type', None)
-        document: str | None = getattr(self, prefix + 'document', None)
-
-        if not person_type or not document:
-            return
-
-        if person_type == PersonType.BUSINESS and not CNPJ().validate(document):
-            errors.append(f'Invalid CNPJ for {party}_type BUSINESS')
-        if person_type == PersonType.INDIVIDUAL and not CPF().validate(document):
-            errors.append(f'Invalid CPF for {party}_type INDIVIDUAL')
-
-    def _validate_account_requirements(self, party: str, errors: list[str]) -> None:
-        prefix = f'{party}_'
-
-        account_type: AccountType | None = getattr(self, prefix + 'account_type', None)
-        branch: Branch | None = getattr(self, prefix + 'branch', None)
-        account_number: AccountNumber | None = getattr(self, prefix + 'account_number', None)
-        payment_account_number: PaymentAccountNumber | None = getattr(self, prefix + 'payment_account_number', None)
-
-        if account_type is None:
-            return
-
-        if account_type == AccountType.PAYMENT:
-            if payment_account_number is None:
-                errors.append(f'{party}_payment_account_number is required when {party}_account_type is PAYMENT')
-            return
-
-        if branch is None:
-            errors.append(f'{party}_branch is required when {party}_account_type is not PAYMENT')
-
-        if account_number is None:
-            errors.append(f'{party}_account_number is required when {party}_account_type is not PAYMENT')
@@ -1,13 +1,39 @@
+from collections.abc import Generator
+from typing import cast
 from xml.etree import ElementTree as ET
 
+import pytest
 from defusedxml.ElementTree import fromstring
 from pydantic import ValidationError
 
+from sfn_messages.core.backends import set_xml_backend
+
+XML_BACKEND_NAMES = ['stdlib', 'lxml']
+
+
+@pytest.fixture(params=XML_BACKEND_NAMES)
+def xml_backend(request: pytest.FixtureRequest) -> Generator[str]:
+    name = cast('str', request.param)
+    if name == 'lxml':
+        pytest.importorskip('lxml')
+    previous = set_xml_backend(name)
+    yield name
+    set_xml_backend(previous)
+
 
 def extract_missing_fields(exc: ValidationError) -> set[str]:
     return {str(err['loc'][0]) for err in exc.errors() if err['type'] == 'missing'}
 
 
+def drain[T, R](iterator: Generator[T, None, R]) -> tuple[list[T], R]:
+    items: list[T] = []
+    while True:
+        try:
+            items.append(next(iterator))
+        except StopIteration as exc:
+            return items, exc.value
+
+
 def normalize_xml(xml: str) -> str:
     root = fromstring(xml)
 
@@ -0,0 +1,160 @@
+import inspect
+import pkgutil
+from importlib import import_module
+from io import BytesIO
+from typing import Any
+from xml.etree import ElementTree as ET
+
+import pytest
+from defusedxml import DTDForbidden
+
+from sfn_messages.core import from_xml, from_xml_bytes, load_message_class
+from sfn_messages.core.backends import (
+    XML_BACKENDS,
+    StdlibXmlBackend,
+    XmlBackend,
+    get_xml_backend,
+    set_xml_backend,
+)
+from sfn_messages.core.errors import XmlBackendNotAvailableError
+
+XML = '<?xml version="1.0"?>\n<DOC xmlns="urn:test"><!-- c --><A b="1">Ação</A><?pi x?><C /></DOC>'
+
+MALICIOUS_XML = [
+    '<!DOCTYPE DOC [<!ENTITY e "x">]><DOC>&e;</DOC>',
+    '<!DOCTYPE DOC [<!ENTITY e SYSTEM "file:///etc/passwd">]><DOC>&e;</DOC>',
+    '<!DOCTYPE DOC SYSTEM "http://example.com/doc.dtd"><DOC />',
+]
+MESSAGE_FAMILIES = ('gen', 'ldl', 'lpi', 'ltr', 'slb', 'sme', 'str')
+
+
+def load_message_corpus() -> list[tuple[str, dict[str, Any]]]:
+    corpus: list[tuple[str, dict[str, Any]]] = []
+    for family in MESSAGE_FAMILIES:
+        package = import_module(f'tests.{family}')
+        for module_info in pkgutil.iter_modules(package.__path__, f'{package.__name__}.'):
+            module = import_module(module_info.name)
+            for name, factory in inspect.getmembers(module, inspect.isfunction):
+                if factory.__module__ != module.__name__ or not name.startswith('make_valid_'):
+                    continue
+                if any(
+                    parameter.default is parameter.empty
+                    for parameter in inspect.signature(factory).parameters.values()
+                ):
+                    continue
+                corpus.append((name.removeprefix('make_valid_').removesuffix('_params').upper(), factory()))
+    return corpus
+
+
+MESSAGE_CORPUS = load_message_corpus()
+
+
+def assert_parsed(element: ET.Element) -> None:
+    assert element.tag == '{urn:test}DOC'
+    assert [child.tag for child in element] == ['{urn:test}A', '{urn:test}C']
+    assert element[0].text == 'Ação'
+    assert element[0].get('b') == '1'
+
+
+def test_parse_string(xml_backend: str) -> None:
+    assert_parsed(get_xml_backend(xml_backend).parse_string(XML))
+
+
+@pytest.mark.parametrize(('encoding', 'declared'), [('utf-16-be', None), ('utf-16-be', 'utf-16-be'), ('utf-8', None)])
+def test_parse_bytes(xml_backend: str, encoding: str, declared: str | None) -> None:
+    data = memoryview(XML.encode(encoding))
+
+    assert_parsed(get_xml_backend(xml_backend).parse_bytes(data, encoding=declared))
+
+
+def test_iterparse(xml_backend: str) -> None:
+    events = list(get_xml_backend(xml_backend).iterparse(BytesIO(XML.encode()), events=('start', 'end')))
+
+    assert [(event, element.tag) for event, element in events] == [
+        ('start', '{urn:test}DOC'),
+        ('start', '{urn:test}A'),
+        ('end', '{urn:test}A'),
+        ('start', '{urn:test}C'),
+        ('end', '{urn:test}C'),
+        ('end', '{urn:test}DOC'),
+    ]
+    assert_parsed(events[-1][1])
+
+
+def test_make_element(xml_backend: str) -> None:
+    element = get_xml_backend(xml_backend).make_element('A', {'b': '1'})
+
+    assert element.tag == 'A'
+    assert element.get('b') == '1'
+
+
+@pytest.mark.parametrize('xml', MALICIOUS_XML)
+def test_should_forbid_dtd(xml_backend: str, xml: str) -> None:
+    backend = get_xml_backend(xml_backend)
+
+    with pytest.raises(DTDForbidden):
+        backend.parse_string(xml)
+    with pytest.raises(DTDForbidden):
+        backend.parse_bytes(xml.encode('utf-16-be'))
+    with pytest.raises(DTDForbidden):
+        list(backend.iterparse(BytesIO(xml.encode()), events=('start', 'end')))
+
+
+@pytest.mark.parametrize('xml', ['<DOC>&e;</DOC>', '<DOC>'])
+def test_should_raise_parse_error(xml_backend: str, xml: str) -> None:
+    backend = get_xml_backend(xml_backend)
+
+    with pytest.raises(ET.ParseError):
+        backend.parse_string(xml)
+    with pytest.raises(ET.ParseError):
+        list(backend.iterparse(BytesIO(xml.encode()), events=('start', 'end')))
+
+
+def test_get_xml_backend_should_return_default_and_instances(xml_backend: str) -> None:
+    backend = get_xml_backend(xml_backend)
+    custom = StdlibXmlBackend()
+
+    assert get_xml_backend() is backend
+    assert get_xml_backend(backend.name) is backend
+    assert get_xml_backend(custom) is custom
+
+
+def test_set_xml_backend_should_return_previous(xml_backend: str) -> None:
+    previous = set_xml_backend('stdlib')
+    try:
+        assert previous.name == xml_backend
+        assert get_xml_backend().name == 'stdlib'
+    finally:
+        set_xml_backend(previous)
+
+
+def test_get_xml_backend_should_raise_error_for_unknown_backend() -> None:
+    with pytest.raises(XmlBackendNotAvailableError) as exc_info:
+        get_xml_backend('unknown')
+
+    assert str(exc_info.value) == 'XML backend unknown is not available'
+
+
+def test_get_xml_backend_should_raise_error_for_missing_dependency(monkeypatch: pytest.MonkeyPatch) -> None:
+    def factory() -> XmlBackend:
+        raise ImportError
+
+    monkeypatch.setitem(XML_BACKENDS, 'missing', factory)
+
+    with pytest.raises(XmlBackendNotAvailableError):
+        get_xml_backend('missing')
+
+
+@pytest.mark.parametrize(('message_code', 'params'), MESSAGE_CORPUS, ids=[code for code, _ in MESSAGE_CORPUS])
+def test_backends_should_agree_on_message_corpus(message_code: str, params: dict[str, Any]) -> None:
+    pytest.importorskip('lxml')
+    message = load_message_class(message_code).model_validate(params)
+    xml = message.to_xml()
+    data = message.to_xml_bytes()
+
+    stdlib = from_xml(xml, backend='stdlib')
+    lxml = from_xml(xml, backend='lxml')
+
+    assert stdlib == lxml == message
+    assert from_xml_bytes(data, backend='stdlib') == from_xml_bytes(data, backend='lxml') == message
+    assert stdlib.to_xml() == lxml.to_xml() == xml
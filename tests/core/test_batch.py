@@ -0,0 +1,78 @@
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from sfn_messages.core import from_xml, to_xml
+from sfn_messages.core.batch import (
+    BatchError,
+    BatchResult,
+    convert_from_xml_chunk,
+    from_xml_many,
+    iter_ordered_results,
+    to_xml_many,
+)
+from sfn_messages.core.errors import MessageNotImplementedError
+from tests.str.test_str0001 import make_numbered_str0001_params
+
+MAX_CONSUMED_AFTER_FIRST = 6
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 64])
+def test_from_xml_many(chunk_size: int) -> None:
+    xmls = [to_xml('STR0001', make_numbered_str0001_params(index)) for index in range(5)]
+    xmls.insert(2, '<DOC />')
+
+    returned = list(from_xml_many(xmls, max_workers=2, chunk_size=chunk_size, message_codes=['STR0001']))
+
+    assert [result.index for result in returned] == list(range(6))
+    assert [result.ok for result in returned] == [True, True, False, True, True, True]
+    assert returned[2].error == BatchError(
+        type='sfn_messages.core.errors.MessageCodeNotFoundError',
+        message='Message code not found in XML',
+    )
+    assert [result.value for result in returned if result.ok] == [from_xml(xml) for xml in xmls if xml != '<DOC />']
+
+
+def test_to_xml_many() -> None:
+    items = [('STR0001', make_numbered_str0001_params(index)) for index in range(3)]
+    items.append(('STR9999', {}))
+
+    returned = list(to_xml_many(items, max_workers=2, chunk_size=2, trusted=True))
+
+    assert [result.value for result in returned[:3]] == [to_xml(code, msg) for code, msg in items[:3]]
+    assert returned[3] == BatchResult(
+        index=3,
+        error=BatchError.from_exception(MessageNotImplementedError(message_code='STR9999')),
+    )
+
+
+def test_convert_from_xml_chunk_should_keep_indexes() -> None:
+    xml = to_xml('STR0001', make_numbered_str0001_params(1))
+
+    returned = convert_from_xml_chunk(((7, xml), (9, 'invalid')), trusted=False)
+
+    assert [(result.index, result.ok) for result in returned] == [(7, True), (9, False)]
+    assert returned[1].error is not None
+    assert returned[1].error.type == 'sfn_messages.core.errors.MessageCodeNotFoundError'
+
+
+def test_iter_ordered_results_should_consume_input_lazily() -> None:
+    consumed: list[int] = []
+
+    def items() -> Iterator[int]:
+        for item in range(100):
+            consumed.append(item)
+            yield item
+
+    def double(chunk: tuple[tuple[int, int], ...]) -> list[int]:
+        return [item * 2 for _, item in chunk]
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        results = iter_ordered_results(executor, double, items(), chunk_size=2, window=2)
+        first = next(results)
+        consumed_after_first = len(consumed)
+        rest = list(results)
+
+    assert [first, *rest] == [item * 2 for item in range(100)]
+    assert consumed_after_first <= MAX_CONSUMED_AFTER_FIRST
@@ -0,0 +1,29 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sfn_messages.core.caching import class_cache
+
+THREADS = 8
+
+
+def test_class_cache_should_compute_once_per_class() -> None:
+    calls: list[type] = []
+    barrier = threading.Barrier(THREADS)
+
+    @class_cache
+    def compute(cls: type) -> list[str]:
+        calls.append(cls)
+        time.sleep(0.01)
+        return [cls.__name__]
+
+    def call(cls: type) -> list[str]:
+        barrier.wait()
+        return compute(cls)
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        returned = list(executor.map(call, [int, str] * (THREADS // 2)))
+
+    assert sorted(calls, key=lambda cls: cls.__name__) == [int, str]
+    assert all(result is compute(int) for result in returned[::2])
+    assert all(result is compute(str) for result in returned[1::2])
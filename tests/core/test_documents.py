@@ -0,0 +1,120 @@
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from sfn_messages.core import documents
+from sfn_messages.core.documents import (
+    cnpj_check_digits,
+    cpf_check_digits,
+    is_valid_cnpj,
+    is_valid_cpf,
+    validate_cnpjs,
+    validate_cpfs,
+)
+
+VALID_CNPJS = ['11222333000181', '12ABC34501DE35', '59952259000185']
+INVALID_CNPJS = [
+    '11222333000182',
+    '12ABC34501DE36',
+    '00000000000000',
+    'AAAAAAAAAAAAAA',
+    '12abc34501de35',
+    '11.222.333/0001-81',
+    '112223330001811',
+    '1122233300018',
+    '12ABC34501DEA5',
+    '',
+]
+VALID_CPFS = ['52998224725', '11144477735']
+INVALID_CPFS = ['52998224726', '11111111111', '529.982.247-25', '529982247250', '5299822472', '5299822472A', '']
+CNPJS = VALID_CNPJS + INVALID_CNPJS
+CPFS = VALID_CPFS + INVALID_CPFS
+EXPECTED_CNPJS = [True] * len(VALID_CNPJS) + [False] * len(INVALID_CNPJS)
+EXPECTED_CPFS = [True] * len(VALID_CPFS) + [False] * len(INVALID_CPFS)
+
+
+@pytest.mark.parametrize(
+    ('base', 'expected'),
+    [
+        ('112223330001', '81'),
+        ('12ABC34501DE', '35'),
+        ('599522590001', '85'),
+    ],
+)
+def test_cnpj_check_digits(base: str, expected: str) -> None:
+    assert cnpj_check_digits(base) == expected
+
+
+@pytest.mark.parametrize(('base', 'expected'), [('529982247', '25'), ('111444777', '35')])
+def test_cpf_check_digits(base: str, expected: str) -> None:
+    assert cpf_check_digits(base) == expected
+
+
+@pytest.mark.parametrize('base', ['12abc34501de', '11222333000', '1122233300011', '11.222.333/0001'])
+def test_cnpj_check_digits_rejects_invalid_base(base: str) -> None:
+    with pytest.raises(ValueError, match='Invalid CNPJ base'):
+        cnpj_check_digits(base)
+
+
+@pytest.mark.parametrize('base', ['12345678A', '12345678', '1234567890'])
+def test_cpf_check_digits_rejects_invalid_base(base: str) -> None:
+    with pytest.raises(ValueError, match='Invalid CPF base'):
+        cpf_check_digits(base)
+
+
+@pytest.mark.parametrize('document', VALID_CNPJS)
+def test_is_valid_cnpj_accepts_valid_document(document: str) -> None:
+    assert is_valid_cnpj(document)
+
+
+@pytest.mark.parametrize('document', INVALID_CNPJS)
+def test_is_valid_cnpj_rejects_invalid_document(document: str) -> None:
+    assert not is_valid_cnpj(document)
+
+
+@pytest.mark.parametrize('document', VALID_CPFS)
+def test_is_valid_cpf_accepts_valid_document(document: str) -> None:
+    assert is_valid_cpf(document)
+
+
+@pytest.mark.parametrize('document', INVALID_CPFS)
+def test_is_valid_cpf_rejects_invalid_document(document: str) -> None:
+    assert not is_valid_cpf(document)
+
+
+def test_is_valid_cnpj_should_cache_repeated_documents() -> None:
+    is_valid_cnpj.cache_clear()
+
+    assert is_valid_cnpj('11222333000181')
+    assert is_valid_cnpj('11222333000181')
+
+    info = is_valid_cnpj.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+    assert info.maxsize == documents.DEFAULT_CACHE_SIZE
+
+
+def test_validate_many_should_use_scalar_path_without_numpy(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr(documents, 'NUMPY_AVAILABLE', False)
+    monkeypatch.setattr(documents, 'VECTORIZE_THRESHOLD', 1)
+
+    assert validate_cnpjs(CNPJS) == EXPECTED_CNPJS
+    assert validate_cpfs(CPFS) == EXPECTED_CPFS
+
+
+def test_validate_many_should_vectorize_with_numpy(monkeypatch: MonkeyPatch) -> None:
+    pytest.importorskip('numpy')
+    monkeypatch.setattr(documents, 'VECTORIZE_THRESHOLD', 1)
+
+    assert validate_cnpjs(CNPJS) == EXPECTED_CNPJS
+    assert validate_cpfs(CPFS) == EXPECTED_CPFS
+
+
+def test_validate_many_should_match_scalar_validation_on_large_batches() -> None:
+    cnpjs = [f'{base:012d}{cnpj_check_digits(f"{base:012d}")}' for base in range(1000, 1600)]
+    cnpjs += [f'{document[:-1]}{(int(document[-1]) + 1) % 10}' for document in cnpjs[:100]]
+
+    assert validate_cnpjs(cnpjs) == [is_valid_cnpj(document) for document in cnpjs]
+
+
+def test_validate_many_should_accept_empty_batch() -> None:
+    assert validate_cnpjs([]) == []
+    assert validate_cpfs([]) == []
@@ -0,0 +1,73 @@
+import codecs
+
+import pytest
+
+from sfn_messages.core.encoding import detect_bom, detect_utf16, encode_xml, expat_encoding, strip_bom
+
+
+@pytest.mark.parametrize(
+    ('data', 'expected'),
+    [
+        (codecs.BOM_UTF8 + b'<a />', ('utf-8', 3)),
+        (codecs.BOM_UTF16_BE + '<a />'.encode('utf-16-be'), ('utf-16-be', 2)),
+        (codecs.BOM_UTF16_LE + '<a />'.encode('utf-16-le'), ('utf-16-le', 2)),
+        ('<a />'.encode('utf-16-be'), (None, 0)),
+        (b'', (None, 0)),
+    ],
+)
+def test_detect_bom(data: bytes, expected: tuple[str | None, int]) -> None:
+    assert detect_bom(data) == expected
+
+
+@pytest.mark.parametrize(
+    ('data', 'expected'),
+    [
+        ('<a />'.encode('utf-16-be'), 'utf-16-be'),
+        ('<a />'.encode('utf-16-le'), 'utf-16-le'),
+        (b'<a />', None),
+        (b'', None),
+    ],
+)
+def test_detect_utf16(data: bytes, expected: str | None) -> None:
+    assert detect_utf16(data) == expected
+
+
+@pytest.mark.parametrize(
+    ('encoding', 'expected'),
+    [
+        ('utf-16-be', 'UTF-16BE'),
+        ('UTF_16_LE', 'UTF-16LE'),
+        ('utf8', 'UTF-8'),
+        ('latin-1', 'ISO-8859-1'),
+        ('cp1252', 'cp1252'),
+    ],
+)
+def test_expat_encoding(encoding: str, expected: str) -> None:
+    assert expat_encoding(encoding) == expected
+
+
+@pytest.mark.parametrize(
+    ('data', 'encoding', 'expected'),
+    [
+        (codecs.BOM_UTF16_LE + b'<\x00', 'utf-16-be', (b'<\x00', 'utf-16-le')),
+        (b'\x00<', 'utf-16-be', (b'\x00<', 'utf-16-be')),
+        (b'<', None, (b'<', None)),
+    ],
+)
+def test_strip_bom(data: bytes, encoding: str | None, expected: tuple[bytes, str | None]) -> None:
+    view, returned_encoding = strip_bom(data, encoding)
+
+    assert (bytes(view), returned_encoding) == expected
+
+
+@pytest.mark.parametrize(
+    ('encoding', 'bom', 'expected'),
+    [
+        ('utf-16-be', False, '<a />'.encode('utf-16-be')),
+        ('utf-16-be', True, codecs.BOM_UTF16_BE + '<a />'.encode('utf-16-be')),
+        ('utf-8', True, codecs.BOM_UTF8 + b'<a />'),
+        ('ascii', True, b'<a />'),
+    ],
+)
+def test_encode_xml(encoding: str, *, bom: bool, expected: bytes) -> None:
+    assert encode_xml('<a />', encoding=encoding, bom=bom) == expected
@@ -1,16 +1,26 @@
+import pickle
+
 import pytest
 
 from sfn_messages.core.errors import (
     BaseTagNameNotFoundInClassError,
     DiffBaseTagNameInFieldError,
+    FieldNotFoundInClassError,
     InvalidBaseTagNameError,
+    InvalidControlNumberPrefixError,
+    InvalidIspbError,
     InvalidLocalNameInFieldError,
+    InvalidSystemError,
     LocalNameNotSetInFieldError,
     LocalNameSetInFieldError,
     MessageCodeNotFoundError,
     MessageNotImplementedError,
+    SequenceExhaustedError,
+    XmlBackendNotAvailableError,
 )
 
+SEQUENCE_LIMIT = 9
+
 
 def test_message_code_not_found_error_str() -> None:
     exc = MessageCodeNotFoundError()
@@ -145,3 +155,63 @@ def test_invalid_local_name_in_field_error_str(
     assert exc.cls is cls
     assert exc.field_name == field_name
     assert str(exc) == f'Invalid local name in {field_name} of {cls}'
+
+
+def test_field_not_found_in_class_error_str() -> None:
+    exc = FieldNotFoundInClassError(cls=dict, field_name='invalid')
+    assert exc.cls is dict
+    assert exc.field_name == 'invalid'
+    assert str(exc) == f'Field invalid not found in XmlPath fields of {dict}'
+
+
+def test_invalid_ispb_error_str() -> None:
+    exc = InvalidIspbError(ispb='123')
+    assert exc.ispb == '123'
+    assert str(exc) == "Invalid ISPB '123'"
+
+
+def test_sequence_exhausted_error_str() -> None:
+    exc = SequenceExhaustedError(key='250908', limit=SEQUENCE_LIMIT)
+    assert exc.key == '250908'
+    assert exc.limit == SEQUENCE_LIMIT
+    assert str(exc) == 'Sequence 250908 exhausted after 9'
+
+
+def test_invalid_system_error_str() -> None:
+    exc = InvalidSystemError(system='st')
+    assert exc.system == 'st'
+    assert str(exc) == "Invalid system 'st'"
+
+
+def test_invalid_control_number_prefix_error_str() -> None:
+    exc = InvalidControlNumberPrefixError(system='STR', prefix='STR-')
+    assert exc.system == 'STR'
+    assert exc.prefix == 'STR-'
+    assert str(exc) == "Invalid control number prefix 'STR-' for system STR"
+
+
+@pytest.mark.parametrize(
+    'exc',
+    [
+        MessageCodeNotFoundError(),
+        MessageNotImplementedError(message_code='STR9999'),
+        BaseTagNameNotFoundInClassError(cls=dict),
+        InvalidBaseTagNameError(document_tag='DOC', expected='BCMSG'),
+        DiffBaseTagNameInFieldError(cls=dict, field_name='from_ispb'),
+        LocalNameNotSetInFieldError(cls=dict, field_name='from_ispb'),
+        LocalNameSetInFieldError(cls=dict, field_name='from_ispb'),
+        InvalidLocalNameInFieldError(cls=dict, field_name='from_ispb'),
+        FieldNotFoundInClassError(cls=dict, field_name='from_ispb'),
+        XmlBackendNotAvailableError(name='unknown'),
+        InvalidIspbError(ispb='123'),
+        SequenceExhaustedError(key='250908', limit=9),
+        InvalidSystemError(system='st'),
+        InvalidControlNumberPrefixError(system='STR', prefix='STR-'),
+    ],
+)
+def test_errors_should_be_picklable(exc: Exception) -> None:
+    returned = pickle.loads(pickle.dumps(exc))
+
+    assert type(returned) is type(exc)
+    assert vars(returned) == vars(exc)
+    assert str(returned) == str(exc)
@@ -0,0 +1,97 @@
+from io import StringIO
+
+import pytest
+
+from sfn_messages.core import from_xml, to_xml
+from sfn_messages.core.headers import get_header_fragment, intern_ispb, lookup_header_fragment
+from sfn_messages.core.types import SystemDomain
+from sfn_messages.core.writer import XmlWriter
+from sfn_messages.str.str0008 import STR0008
+from tests.str.test_str0008 import make_valid_str0008_params
+
+pytestmark = pytest.mark.usefixtures('xml_backend')
+
+
+def test_get_header_fragment() -> None:
+    returned = get_header_fragment('31680151', 'A&B', SystemDomain.SPB01)
+
+    assert returned.indented == (
+        '<IdentdEmissor>31680151</IdentdEmissor>\n'
+        '    <IdentdDestinatario>A&amp;B</IdentdDestinatario>\n'
+        '    <DomSist>SPB01</DomSist>'
+    )
+    assert returned.compact == (
+        '<IdentdEmissor>31680151</IdentdEmissor><IdentdDestinatario>A&amp;B</IdentdDestinatario><DomSist>SPB01</DomSist>'
+    )
+    assert get_header_fragment('31680151', 'A&B', SystemDomain.SPB01) is returned
+
+
+def test_get_header_fragment_should_render_empty_values() -> None:
+    returned = get_header_fragment('', '00038166', SystemDomain.MES01)
+
+    assert returned.compact.startswith('<IdentdEmissor /><IdentdDestinatario>')
+
+
+@pytest.mark.parametrize(
+    ('from_ispb', 'to_ispb', 'system_domain'),
+    [
+        (None, '00038166', SystemDomain.SPB01),
+        ('31680151', '00038166', 'SPB01'),
+        ('31680151', 38166, SystemDomain.SPB01),
+    ],
+)
+def test_lookup_header_fragment_should_skip_unexpected_types(
+    from_ispb: object, to_ispb: object, system_domain: object
+) -> None:
+    assert lookup_header_fragment(from_ispb, to_ispb, system_domain) is None
+
+
+@pytest.mark.parametrize('indent', [True, False])
+def test_template_should_splice_cached_header(*, indent: bool) -> None:
+    message = STR0008.model_validate(make_valid_str0008_params())
+    template = STR0008.compile_template()
+    get_header_fragment.cache_clear()
+
+    first = template.render(message, indent=indent)
+    second = template.render(message.model_copy(update={'operation_number': '31680151250908000000002'}), indent=indent)
+
+    assert first == XmlWriter(default_namespace=STR0008.get_xml_namespace(), indent=indent).dumps(
+        message.to_xml_node()
+    )
+    assert second == first.replace('31680151250908000000001', '31680151250908000000002')
+    assert get_header_fragment.cache_info().hits == 1
+
+
+@pytest.mark.parametrize('indent', [True, False])
+def test_to_xml_should_splice_cached_header(*, indent: bool) -> None:
+    message = STR0008.model_validate(make_valid_str0008_params())
+    get_header_fragment.cache_clear()
+
+    first = message.to_xml(indent=indent)
+    stream = StringIO()
+    message.write_xml(stream, indent=indent)
+
+    assert stream.getvalue() == first
+    assert get_header_fragment.cache_info().hits == 1
+
+
+@pytest.mark.parametrize('trusted', [True, False])
+def test_from_xml_should_share_header_strings(*, trusted: bool) -> None:
+    xml = to_xml('STR0008', make_valid_str0008_params())
+    get_header_fragment.cache_clear()
+
+    first = from_xml(xml, trusted=trusted)
+    second = from_xml(xml, trusted=trusted)
+
+    assert first == second
+    assert first.from_ispb is second.from_ispb
+    assert first.to_ispb is second.to_ispb
+    assert get_header_fragment.cache_info().currsize == 0
+
+
+def test_intern_ispb() -> None:
+    first = intern_ispb(b'31680151'.decode())
+    second = intern_ispb(b'31680151'.decode())
+
+    assert first == '31680151'
+    assert first is second
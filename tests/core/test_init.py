@@ -0,0 +1,165 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from xml.etree import ElementTree as ET
+
+import pytest
+from pydantic import ValidationError
+
+from sfn_messages.core import (
+    extract,
+    from_xml,
+    from_xml_bytes,
+    get_message_code_from_element,
+    to_xml,
+    to_xml_bytes,
+)
+from sfn_messages.core.errors import FieldNotFoundInClassError, InvalidBaseTagNameError, MessageCodeNotFoundError
+from sfn_messages.core.models import BaseMessage
+from sfn_messages.ldl.ldl0006 import LDL0006
+from sfn_messages.str.str0001 import STR0001
+from tests.gen.test_gen0021 import make_valid_gen0021_params
+from tests.ldl.test_ldl0006 import make_valid_ldl0006_params
+from tests.str.test_str0001 import make_valid_str0001_params
+from tests.str.test_str0008 import make_valid_str0008_params
+
+pytestmark = pytest.mark.usefixtures('xml_backend')
+
+
+def test_to_xml_bytes() -> None:
+    returned = to_xml_bytes('STR0001', make_valid_str0001_params())
+
+    assert returned == to_xml('STR0001', make_valid_str0001_params()).encode('utf-16-be')
+
+
+@pytest.mark.parametrize('bom', [True, False])
+def test_from_xml_bytes(*, bom: bool) -> None:
+    data = to_xml_bytes('STR0001', make_valid_str0001_params(), bom=bom)
+
+    returned = from_xml_bytes(memoryview(data))
+
+    assert isinstance(returned, STR0001)
+    assert returned == from_xml(to_xml('STR0001', make_valid_str0001_params()))
+
+
+def test_to_xml_trusted() -> None:
+    returned = to_xml('STR0001', make_valid_str0001_params(), trusted=True)
+
+    assert returned == to_xml('STR0001', make_valid_str0001_params())
+
+
+@pytest.mark.parametrize('bom', [True, False])
+def test_from_xml_bytes_trusted(*, bom: bool) -> None:
+    data = to_xml_bytes('STR0001', make_valid_str0001_params(), bom=bom)
+
+    returned = from_xml_bytes(data, trusted=True)
+
+    assert returned == from_xml_bytes(data)
+
+
+def test_from_xml_with_backend(xml_backend: str) -> None:
+    xml = to_xml('STR0001', make_valid_str0001_params())
+
+    returned = from_xml(xml, backend=xml_backend)
+
+    assert returned == from_xml(xml, backend='stdlib')
+
+
+def test_from_xml_bytes_with_encoding() -> None:
+    data = to_xml_bytes('STR0001', make_valid_str0001_params(), encoding='latin-1')
+
+    returned = from_xml_bytes(data, encoding='latin-1')
+
+    assert isinstance(returned, STR0001)
+
+
+@pytest.mark.parametrize('trusted', [True, False])
+def test_extract(*, trusted: bool) -> None:
+    xml = to_xml('STR0008', make_valid_str0008_params())
+    fields = ['operation_number', 'debtor_document', 'amount', 'settlement_date']
+
+    returned = extract(xml, 'STR0008', fields=fields, trusted=trusted)
+
+    message = from_xml(xml)
+    assert returned == {field: getattr(message, field) for field in fields}
+
+
+def test_extract_bytes() -> None:
+    data = to_xml_bytes('STR0001', make_valid_str0001_params(), bom=True)
+
+    returned = extract(data, 'STR0001', fields=['reference_date', 'hour_type'])
+
+    message = STR0001.from_xml_bytes(data)
+    assert returned == {'reference_date': message.reference_date, 'hour_type': message.hour_type}
+
+
+def test_extract_should_fall_back_to_tree_for_submessages() -> None:
+    xml = to_xml('LDL0006', make_valid_ldl0006_params())
+
+    returned = extract(xml, 'LDL0006', fields=['amount', 'credit_refund_group'], backend='stdlib')
+
+    message = LDL0006.from_xml(xml)
+    assert returned == {'amount': message.amount, 'credit_refund_group': message.credit_refund_group}
+
+
+def test_extract_should_omit_missing_optional_fields() -> None:
+    params = make_valid_str0001_params()
+    xml = to_xml('STR0001', params)
+
+    assert extract(xml, 'STR0001', fields=['from_ispb', 'sequence_number']) == {
+        'from_ispb': '31680151',
+        'sequence_number': None,
+    }
+
+
+def test_extract_should_validate_requested_fields() -> None:
+    xml = to_xml('STR0001', make_valid_str0001_params()).replace('<DtRef>2026', '<DtRef>X026')
+
+    assert extract(xml, 'STR0001', fields=['from_ispb']) == {'from_ispb': '31680151'}
+    with pytest.raises(ValidationError):
+        extract(xml, 'STR0001', fields=['reference_date'])
+
+
+def test_extract_should_raise_error_for_unknown_field() -> None:
+    xml = to_xml('STR0001', make_valid_str0001_params())
+
+    with pytest.raises(FieldNotFoundInClassError):
+        extract(xml, 'STR0001', fields=['unknown'])
+
+
+def test_extract_should_raise_error_for_invalid_root() -> None:
+    xml = to_xml('STR0001', make_valid_str0001_params()).replace('DOC', 'MSG')
+
+    with pytest.raises(InvalidBaseTagNameError):
+        extract(xml, 'STR0001', fields=['from_ispb'])
+
+
+def test_get_message_code_from_element_should_raise_error_without_code() -> None:
+    xml = ET.fromstring('<DOC><BCMSG /></DOC>')
+
+    with pytest.raises(MessageCodeNotFoundError):
+        get_message_code_from_element(xml)
+
+
+def test_to_xml_and_from_xml_should_be_thread_safe() -> None:
+    threads = 8
+    messages = [
+        ('STR0001', make_valid_str0001_params()),
+        ('STR0008', make_valid_str0008_params()),
+        ('LDL0006', make_valid_ldl0006_params()),
+        ('GEN0021', make_valid_gen0021_params()),
+    ] * 25
+    expected = [to_xml(message_code, msg) for message_code, msg in messages]
+    barrier = threading.Barrier(threads)
+
+    def convert(offset: int) -> list[tuple[str, BaseMessage]]:
+        barrier.wait()
+        rotated = messages[offset:] + messages[:offset]
+        return [(to_xml(message_code, msg), from_xml(to_xml(message_code, msg))) for message_code, msg in rotated]
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        returned = list(executor.map(convert, range(threads)))
+
+    for offset, results in enumerate(returned):
+        rotated_expected = expected[offset:] + expected[:offset]
+        assert [xml for xml, _ in results] == rotated_expected
+        assert [message.to_xml() for _, message in results] == rotated_expected
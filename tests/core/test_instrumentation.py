@@ -0,0 +1,191 @@
+from io import StringIO
+from xml.etree import ElementTree as ET
+
+import pytest
+from pydantic import ValidationError
+
+from sfn_messages.core import from_xml_bytes, to_xml, to_xml_bytes
+from sfn_messages.core.instrumentation import (
+    UNKNOWN_MESSAGE_CODE,
+    Phase,
+    PhaseAggregator,
+    PhaseEvent,
+    PhaseStatistics,
+    add_hook,
+    emit,
+    fallback_counts,
+    instrumented,
+    measure,
+    record_fallback,
+    remove_hook,
+    reset_fallback_counts,
+)
+from sfn_messages.str.str0001 import STR0001
+from tests.str.test_str0001 import make_valid_str0001_params
+
+
+def test_add_and_remove_hook() -> None:
+    events: list[PhaseEvent] = []
+
+    add_hook(events.append)
+    emit(Phase.PARSE, 'STR0001', 10, payload_size=20)
+    remove_hook(events.append)
+    emit(Phase.PARSE, 'STR0001', 10)
+
+    assert events == [PhaseEvent(phase=Phase.PARSE, message_code='STR0001', duration_ns=10, payload_size=20)]
+
+
+def test_measure() -> None:
+    with instrumented(PhaseAggregator()) as aggregator, measure(Phase.MAP, 'STR0001', payload_size=5):
+        pass
+
+    [returned] = aggregator.report()
+    assert returned.message_code == 'STR0001'
+    assert returned.phase is Phase.MAP
+    assert returned.count == 1
+
+
+def test_from_xml_should_emit_phases() -> None:
+    xml = to_xml('STR0001', make_valid_str0001_params())
+    events: list[PhaseEvent] = []
+
+    with instrumented(events.append):
+        STR0001.from_xml(xml)
+
+    assert [(event.phase, event.message_code, event.payload_size) for event in events] == [
+        (Phase.PARSE, 'STR0001', len(xml)),
+        (Phase.MAP, 'STR0001', len(xml)),
+        (Phase.VALIDATE, 'STR0001', len(xml)),
+    ]
+    assert all(event.duration_ns >= 0 for event in events)
+
+
+def test_from_xml_bytes_should_emit_phases() -> None:
+    data = to_xml_bytes('STR0001', make_valid_str0001_params())
+    events: list[PhaseEvent] = []
+
+    with instrumented(events.append):
+        from_xml_bytes(data)
+
+    assert [(event.phase, event.payload_size) for event in events] == [
+        (Phase.PARSE, len(data)),
+        (Phase.MAP, len(data)),
+        (Phase.VALIDATE, len(data)),
+    ]
+
+
+def test_to_xml_should_emit_phases() -> None:
+    events: list[PhaseEvent] = []
+
+    with instrumented(events.append):
+        xml = to_xml('STR0001', make_valid_str0001_params())
+        STR0001.model_validate(make_valid_str0001_params()).write_xml(StringIO())
+
+    assert [(event.phase, event.payload_size) for event in events] == [
+        (Phase.VALIDATE, None),
+        (Phase.SERIALIZE, len(xml)),
+        (Phase.VALIDATE, None),
+        (Phase.SERIALIZE, None),
+    ]
+
+
+def test_template_render_should_emit_serialize_phase() -> None:
+    message = STR0001.model_validate(make_valid_str0001_params())
+    template = STR0001.compile_template()
+    events: list[PhaseEvent] = []
+
+    with instrumented(events.append):
+        xml = template.render(message)
+
+    assert [(event.phase, event.message_code, event.payload_size) for event in events] == [
+        (Phase.SERIALIZE, 'STR0001', len(xml))
+    ]
+
+
+def test_hooks_should_not_be_called_when_removed() -> None:
+    events: list[PhaseEvent] = []
+
+    with instrumented(events.append):
+        pass
+    to_xml('STR0001', make_valid_str0001_params())
+
+    assert events == []
+
+
+def test_failed_phase_should_emit_failed_event() -> None:
+    events: list[PhaseEvent] = []
+
+    with instrumented(events.append), pytest.raises(ValueError, match=r'^$'), measure(Phase.PARSE, 'STR0001'):
+        raise ValueError
+
+    [returned] = events
+    assert returned.phase is Phase.PARSE
+    assert returned.failed
+
+
+def test_failed_validation_should_be_aggregated() -> None:
+    xml = to_xml('STR0001', make_valid_str0001_params()).replace('<DtRef>2026', '<DtRef>X026')
+
+    with instrumented(PhaseAggregator()) as aggregator, pytest.raises(ValidationError):
+        STR0001.from_xml(xml)
+
+    assert [(stats.phase, stats.count, stats.failures) for stats in aggregator.report()] == [
+        (Phase.MAP, 1, 0),
+        (Phase.PARSE, 1, 0),
+        (Phase.VALIDATE, 1, 1),
+    ]
+
+
+def test_failed_from_xml_bytes_should_emit_unknown_parse() -> None:
+    events: list[PhaseEvent] = []
+
+    with instrumented(events.append), pytest.raises(ET.ParseError):
+        from_xml_bytes(b'<DOC>')
+
+    assert [(event.phase, event.message_code, event.payload_size, event.failed) for event in events] == [
+        (Phase.PARSE, UNKNOWN_MESSAGE_CODE, len(b'<DOC>'), True)
+    ]
+
+
+def test_phase_aggregator() -> None:
+    aggregator = PhaseAggregator(max_samples=3)
+    for duration_ns, failed in [(40, True), (10, False), (20, False), (30, False)]:
+        aggregator(PhaseEvent(phase=Phase.PARSE, message_code='STR0001', duration_ns=duration_ns, failed=failed))
+    aggregator(PhaseEvent(phase=Phase.SERIALIZE, message_code='STR0001', duration_ns=5))
+
+    assert aggregator.report() == [
+        PhaseStatistics(
+            message_code='STR0001',
+            phase=Phase.PARSE,
+            count=4,
+            total_ns=100,
+            p50_ns=20.0,
+            p90_ns=28.0,
+            p99_ns=29.8,
+            failures=1,
+        ),
+        PhaseStatistics(
+            message_code='STR0001',
+            phase=Phase.SERIALIZE,
+            count=1,
+            total_ns=5,
+            p50_ns=5.0,
+            p90_ns=5.0,
+            p99_ns=5.0,
+        ),
+    ]
+
+    aggregator.clear()
+    assert aggregator.report() == []
+
+
+def test_fallback_counts() -> None:
+    reset_fallback_counts()
+
+    record_fallback('STR0001', 'hour_type')
+    record_fallback('STR0001', 'hour_type')
+    record_fallback('STR0008', 'purpose')
+
+    assert fallback_counts() == {('STR0001', 'hour_type'): 2, ('STR0008', 'purpose'): 1}
+    reset_fallback_counts()
+    assert fallback_counts() == {}
@@ -0,0 +1,95 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pydantic import ValidationError
+
+from sfn_messages.core import to_xml
+from sfn_messages.core.errors import MessageNotImplementedError
+from sfn_messages.core.lazy import LazyMessage, LazyMessageHeader
+from sfn_messages.core.types import SystemDomain
+from sfn_messages.str.str0001 import STR0001
+from tests.str.test_str0001 import make_valid_str0001_params
+
+pytestmark = pytest.mark.usefixtures('xml_backend')
+
+XML = to_xml('STR0001', make_valid_str0001_params())
+
+
+def test_from_xml_should_validate_header_without_body() -> None:
+    sut = LazyMessage.from_xml(XML)
+
+    assert sut.header == LazyMessageHeader(
+        message_code='STR0001',
+        from_ispb='31680151',
+        to_ispb='00038166',
+        system_domain=SystemDomain.SPB01,
+        operation_number='31680151250908000000001',
+    )
+    assert sut.message_class is STR0001
+    assert sut.from_ispb == '31680151'
+    assert sut.system_domain is SystemDomain.SPB01
+    assert sut.sequence_number is None
+    assert not sut.is_materialized
+
+
+def test_body_access_should_materialize_once() -> None:
+    sut = LazyMessage.from_xml(XML)
+
+    assert sut.institution_control_number == '31680151202509090425'
+    assert sut.is_materialized
+    message = sut.materialize()
+    assert message == STR0001.model_validate(make_valid_str0001_params())
+    assert sut.materialize() is message
+
+
+def test_from_xml_bytes_should_materialize_from_raw_bytes() -> None:
+    data = STR0001.model_validate(make_valid_str0001_params()).to_xml_bytes()
+
+    sut = LazyMessage.from_xml_bytes(data)
+
+    assert sut.raw is data
+    assert sut.operation_number == '31680151250908000000001'
+    assert sut.reference_date.isoformat() == '2026-01-28'
+
+
+def test_materialize_should_be_shared_across_threads() -> None:
+    sut = LazyMessage.from_xml(XML)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        messages = list(executor.map(lambda _: sut.materialize(), range(8)))
+
+    assert all(message is messages[0] for message in messages)
+
+
+def test_invalid_body_should_raise_only_on_access() -> None:
+    xml = XML.replace('<DtRef>2026', '<DtRef>X026')
+
+    sut = LazyMessage.from_xml(xml)
+
+    assert sut.to_ispb == '00038166'
+    with pytest.raises(ValidationError):
+        sut.materialize()
+
+
+def test_invalid_header_should_raise_eagerly() -> None:
+    xml = XML.replace('<IdentdEmissor>31680151', '<IdentdEmissor>X')
+
+    with pytest.raises(ValidationError):
+        LazyMessage.from_xml(xml)
+
+
+def test_unknown_message_code_should_raise_eagerly() -> None:
+    xml = XML.replace('<CodMsg>STR0001', '<CodMsg>XXX9999')
+
+    with pytest.raises(MessageNotImplementedError):
+        LazyMessage.from_xml(xml)
+
+
+def test_private_attributes_should_not_materialize() -> None:
+    sut = LazyMessage.from_xml(XML)
+
+    with pytest.raises(AttributeError):
+        sut.__missing__  # noqa: B018
+
+    assert not sut.is_materialized
+    assert repr(sut) == "LazyMessage('STR0001', materialized=False)"
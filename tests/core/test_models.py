@@ -1,9 +1,16 @@
-from typing import Annotated, Self
+import codecs
+from collections.abc import Buffer
+from datetime import date, datetime, time
+from decimal import Decimal
+from io import BytesIO, StringIO
+from pathlib import Path
+from typing import Annotated, Literal, Self
 from xml.etree import ElementTree as ET
 
 import pytest
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, ValidationError
 
+from sfn_messages.core import instrumentation
 from sfn_messages.core.errors import (
     BaseTagNameNotFoundInClassError,
     DiffBaseTagNameInFieldError,
@@ -12,9 +19,27 @@ from sfn_messages.core.errors import (
     LocalNameNotSetInFieldError,
     LocalNameSetInFieldError,
 )
-from sfn_messages.core.models import BaseMessage, BaseSubMessage, XmlPath, XmlSerializerMixin
-from sfn_messages.core.types import ContinuationIndicator, SystemDomain
-from tests.conftest import normalize_xml
+from sfn_messages.core.models import BaseMessage, BaseSubMessage, XmlFieldKind, XmlPath, XmlSerializerMixin
+from sfn_messages.core.types import CnpjOrCpf, ContinuationIndicator, Ispb, SystemDomain
+from tests.conftest import drain, normalize_xml
+
+pytestmark = pytest.mark.usefixtures('xml_backend')
+
+XML_WITH_ACCENTS = """<?xml version="1.0"?>
+<DOC>
+    <BCMSG>
+        <IdentdEmissor>12345ABC</IdentdEmissor>
+        <IdentdDestinatario>67890XYZ</IdentdDestinatario>
+        <DomSist>MES01</DomSist>
+        <NUOp>12345678123456789000123</NUOp>
+    </BCMSG>
+    <SISMSG>
+        <Test>
+            <field1>Ação</field1>
+        </Test>
+    </SISMSG>
+</DOC>
+"""
 
 
 class TestXmlPath:
@@ -33,6 +58,203 @@ class TestXmlPath:
         assert returned == expected
 
 
+class TestXmlCodecPlan:
+    def test_get_xml_codec_plan_should_compile_fields(self) -> None:
+        class SubSut(BaseSubMessage):
+            f1: Annotated[str, XmlPath('sub/field/text()')]
+
+        class Sut(BaseSubMessage):
+            XML_NAMESPACE = 'urn:test'
+
+            field1: Annotated[str, XmlPath('base/header/field1/text()')]
+            field2: Annotated[str, XmlPath('base/header/field1/@attribute')]
+            field3: Annotated[SubSut | None, XmlPath('base/msg')] = None
+            field4: Annotated[list[SubSut], XmlPath('base')]
+            field5: Annotated[str, XmlPath('base/field5/invalid()')]
+
+        plan = Sut.get_xml_codec_plan()
+
+        assert plan.namespace == 'urn:test'
+        assert [field.name for field in plan.fields] == ['field1', 'field2', 'field3', 'field4', 'field5']
+        assert [field.kind for field in plan.fields] == [
+            XmlFieldKind.TEXT,
+            XmlFieldKind.ATTRIBUTE,
+            XmlFieldKind.SUBMESSAGE,
+            XmlFieldKind.LIST,
+            XmlFieldKind.INVALID,
+        ]
+        field1 = plan.fields_by_name['field1']
+        assert field1.root_name == 'base'
+        assert field1.path_names == ('header', 'field1')
+        assert field1.qnames == ('{urn:test}header', '{urn:test}field1')
+        assert plan.fields_by_name['field2'].attribute_name == 'attribute'
+
+    def test_get_xml_codec_plan_should_build_path_trie(self) -> None:
+        class Sut(BaseSubMessage):
+            field1: Annotated[str, XmlPath('base/header/field1/text()')]
+            field2: Annotated[str, XmlPath('base/header/field1/@attribute')]
+            field3: Annotated[str, XmlPath('base/msg/field3/text()')]
+            field4: Annotated[str, XmlPath('base/@attribute')]
+
+        plan = Sut.get_xml_codec_plan()
+
+        assert plan.root_names == ('base',)
+        assert [field.name for field in plan.trie.fields] == ['field4']
+        assert list(plan.trie.children) == ['header', 'msg']
+        header = plan.trie.children['header']
+        assert [field.name for field in header.children['field1'].fields] == ['field1', 'field2']
+        assert [field.name for field in plan.trie.children['msg'].children['field3'].fields] == ['field3']
+
+    def test_get_xml_codec_plan_should_be_built_once(self) -> None:
+        class Sut(BaseSubMessage):
+            field1: Annotated[str, XmlPath('base/field1/text()')]
+
+        assert Sut.get_xml_codec_plan() is Sut.get_xml_codec_plan()
+
+    def test_get_xml_codec_plan_should_resolve_parsers(self) -> None:
+        class Sut(BaseSubMessage):
+            field1: Annotated[str, XmlPath('base/field1/text()')]
+            field2: Annotated[SystemDomain | None, XmlPath('base/field2/text()')] = None
+            field3: Annotated[ContinuationIndicator, XmlPath('base/field3/text()')]
+
+        plan = Sut.get_xml_codec_plan()
+
+        assert plan.fields_by_name['field1'].parse('value') == 'value'
+        assert plan.fields_by_name['field2'].parse('MES01') is SystemDomain.MES01
+        assert plan.fields_by_name['field3'].parse('S') is ContinuationIndicator.YES
+
+    def test_get_xml_codec_plan_should_discriminate_union_branches(self) -> None:
+        class SubSut(BaseSubMessage):
+            f1: Annotated[str, XmlPath('sub/field/text()')]
+
+        class Sut(BaseSubMessage):
+            field1: Annotated[SystemDomain | ContinuationIndicator, XmlPath('base/field1/text()')]
+            field2: Annotated[SubSut | None, XmlPath('base/sub')] = None
+
+        plan = Sut.get_xml_codec_plan()
+        sub = ET.fromstring('<wrapper><sub><field>value</field></sub></wrapper>')
+        instrumentation.reset_fallback_counts()
+
+        assert plan.fields_by_name['field1'].parse('MES01') is SystemDomain.MES01
+        assert plan.fields_by_name['field1'].parse('N') is ContinuationIndicator.NO
+        assert plan.fields_by_name['field1'].parse_trusted('S') is ContinuationIndicator.YES
+        assert plan.fields_by_name['field2'].parse(sub) == SubSut(f1='value')
+        assert instrumentation.fallback_counts() == {}
+
+    def test_get_xml_codec_plan_should_count_fallbacks(self) -> None:
+        class Sut(BaseSubMessage):
+            field1: Annotated[SystemDomain | None, XmlPath('base/field1/text()')] = None
+
+        parse = Sut.get_xml_codec_plan().fields_by_name['field1'].parse
+        instrumentation.reset_fallback_counts()
+
+        assert parse('UNKNOWN') == 'UNKNOWN'
+        assert instrumentation.fallback_counts() == {}
+
+        with instrumentation.instrumented(instrumentation.PhaseAggregator()):
+            assert parse('UNKNOWN') == 'UNKNOWN'
+            assert parse('UNKNOWN') == 'UNKNOWN'
+
+        assert instrumentation.fallback_counts() == {('Sut', 'field1'): 2}
+
+    @pytest.mark.parametrize('value', ['52423987013', '81415129000162'])
+    def test_get_xml_codec_plan_should_not_fall_back_on_cnpj_or_cpf(self, value: str) -> None:
+        class Sut(BaseSubMessage):
+            field1: Annotated[CnpjOrCpf | None, XmlPath('base/field1/text()')] = None
+
+        parse = Sut.get_xml_codec_plan().fields_by_name['field1'].parse
+        instrumentation.reset_fallback_counts()
+
+        with instrumentation.instrumented(instrumentation.PhaseAggregator()):
+            assert parse(value) == value
+            assert Sut(field1=value).field1 == value
+
+        assert instrumentation.fallback_counts() == {}
+
+
+class TestXmlTemplate:
+    @pytest.mark.parametrize('indent', [True, False])
+    @pytest.mark.parametrize('sequence_number', [None, 2])
+    def test_render_should_match_to_xml(self, *, indent: bool, sequence_number: int | None) -> None:
+        class SubSut(BaseSubMessage):
+            f1: Annotated[str, XmlPath('sub/field/text()')]
+            f2: Annotated[str | None, XmlPath('sub/field/@f2')] = None
+
+        class Sut(BaseMessage):
+            XML_NAMESPACE = 'urn:test'
+
+            field1: Annotated[str, XmlPath('DOC/SISMSG/Test/field1/text()')]
+            field2: Annotated[str | None, XmlPath('DOC/SISMSG/Test/@field2')] = None
+            field3: Annotated[SubSut | None, XmlPath('DOC/SISMSG/Test/field3')] = None
+            field4: Annotated[list[SubSut], XmlPath('DOC/SISMSG/Test/Group')] = Field(default_factory=list)
+            field5: Annotated[str | None, XmlPath('DOC/SISMSG/Test/field5/text()')] = None
+
+        template = Sut.compile_template()
+        sut = Sut(
+            from_ispb='12345abc',
+            to_ispb='67890xyz',
+            system_domain=SystemDomain.MES01,
+            operation_number='12345678123456789000123',
+            sequence_number=sequence_number,
+            field1='a & <b>',
+            field2='"c"',
+            field3=SubSut(f1='v1', f2='v2'),
+            field4=[SubSut(f1='v3'), SubSut(f1='', f2='v4')],
+            field5='',
+        )
+        empty = sut.model_copy(update={'field2': None, 'field3': None, 'field4': [], 'field5': None})
+
+        assert template.is_static
+        assert template.render(sut, indent=indent) == sut.to_xml(indent=indent)
+        assert template.render(empty, indent=indent) == empty.to_xml(indent=indent)
+        assert template.render_bytes(sut, bom=True) == sut.to_xml_bytes(bom=True)
+
+    def test_compile_template_should_be_built_once(self) -> None:
+        class Sut(BaseMessage):
+            field1: Annotated[str, XmlPath('DOC/SISMSG/Test/field1/text()')]
+
+        assert Sut.compile_template() is Sut.compile_template()
+
+    def test_render_should_fall_back_for_presence_dependent_layout(self) -> None:
+        class Sut(BaseMessage):
+            field1: Annotated[str | None, XmlPath('DOC/SISMSG/Test/field1/text()')] = None
+            field2: Annotated[str, XmlPath('DOC/SISMSG/Test/field2/text()')]
+            field3: Annotated[str | None, XmlPath('DOC/SISMSG/Test/field1/@CodErro')] = None
+
+        sut = Sut(
+            from_ispb='12345abc',
+            to_ispb='67890xyz',
+            system_domain=SystemDomain.MES01,
+            operation_number='12345678123456789000123',
+            field2='value2',
+            field3='EGEN0001',
+        )
+
+        template = Sut.compile_template()
+
+        assert not template.is_static
+        assert template.render(sut) == sut.to_xml()
+
+    def test_render_should_fall_back_when_fragment_shadows_sibling(self) -> None:
+        class SubSut(BaseSubMessage):
+            f1: Annotated[str, XmlPath('sub/field/text()')]
+
+        class Sut(BaseMessage):
+            field1: Annotated[SubSut, XmlPath('DOC/SISMSG/Test')]
+            field2: Annotated[str, XmlPath('DOC/SISMSG/Test/sub/text()')]
+
+        sut = Sut(
+            from_ispb='12345abc',
+            to_ispb='67890xyz',
+            system_domain=SystemDomain.MES01,
+            operation_number='12345678123456789000123',
+            field1=SubSut(f1='v1'),
+            field2='value2',
+        )
+
+        assert Sut.compile_template().render(sut) == sut.to_xml()
+
+
 class TestXmlSerializerMixin:
     def test_to_xml_value(self) -> None:
         expected = """
@@ -169,6 +391,35 @@ class TestXmlSerializerMixin:
 
         assert returned == Sut(field1='value1', field2='value2', field3='value3', field4='value4', field5='value5')
 
+    def test_from_xml_value_should_use_first_matching_sibling(self) -> None:
+        xml = """
+        <base>
+            <header>
+                <field1 code="E1">value1</field1>
+            </header>
+            <header>
+                <field1 code="E2">other</field1>
+                <field2>value2</field2>
+            </header>
+            <ignored>
+                <field1>ignored</field1>
+            </ignored>
+        </base>
+        """
+
+        class Sut(XmlSerializerMixin):
+            @classmethod
+            def get_base_tag_name(cls) -> str:
+                return 'base'
+
+            field1: Annotated[str, XmlPath('base/header/field1/text()')]
+            field1_code: Annotated[str, XmlPath('base/header/field1/@code')]
+            field2: Annotated[str | None, XmlPath('base/header/field2/text()')] = None
+
+        returned = Sut.from_xml_value(ET.fromstring(xml))
+
+        assert returned == Sut(field1='value1', field1_code='E1')
+
     def test_from_xml_value_shold_raise_error_for_string(self) -> None:
         class Sut(XmlSerializerMixin):
             @classmethod
@@ -518,3 +769,256 @@ class TestBaseMessage:
         returned = sut.to_xml()
 
         assert normalize_xml(returned) == normalize_xml(expected)
+
+    def test_to_xml_without_indent(self) -> None:
+        class Sut(BaseMessage):
+            XML_NAMESPACE = 'urn:test'
+
+            field1: Annotated[str, XmlPath('DOC/SISMSG/Test/field1/text()')]
+            field2: Annotated[str, XmlPath('DOC/SISMSG/Test/@field2')]
+
+        sut = Sut(
+            from_ispb='12345abc',
+            to_ispb='67890xyz',
+            system_domain=SystemDomain.MES01,
+            operation_number='12345678123456789000123',
+            field1='a & b',
+            field2='"c"',
+        )
+        returned = sut.to_xml(indent=False)
+
+        assert returned == (
+            '<?xml version="1.0"?>\n'
+            '<DOC xmlns="urn:test"><BCMSG><IdentdEmissor>12345ABC</IdentdEmissor>'
+            '<IdentdDestinatario>67890XYZ</IdentdDestinatario><DomSist>MES01</DomSist>'
+            '<NUOp>12345678123456789000123</NUOp></BCMSG>'
+            '<SISMSG><Test field2="&quot;c&quot;"><field1>a &amp; b</field1></Test></SISMSG></DOC>'
+        )
+
+    def test_write_xml(self) -> None:
+        class Sut(BaseMessage):
+            field1: Annotated[str, XmlPath('DOC/SISMSG/Test/field1/text()')]
+
+        sut = Sut(
+            from_ispb='12345abc',
+            to_ispb='67890xyz',
+            system_domain=SystemDomain.MES01,
+            operation_number='12345678123456789000123',
+            field1='value1',
+        )
+        text_sink = StringIO()
+        binary_sink = BytesIO()
+        sut.write_xml(text_sink)
+        sut.write_xml(binary_sink, encoding='utf-16-be', bom=True)
+
+        assert text_sink.getvalue() == sut.to_xml()
+        assert binary_sink.getvalue() == sut.to_xml_bytes(encoding='utf-16-be', bom=True)
+
+    @pytest.mark.parametrize(
+        ('encoding', 'bom', 'expected_prefix'),
+        [
+            ('utf-16-be', False, '<?xml'.encode('utf-16-be')),
+            ('utf-16-be', True, codecs.BOM_UTF16_BE + '<?xml'.encode('utf-16-be')),
+            ('utf-8', False, b'<?xml'),
+        ],
+    )
+    def test_to_xml_bytes(self, encoding: str, *, bom: bool, expected_prefix: bytes) -> None:
+        class Sut(BaseMessage):
+            field1: Annotated[str, XmlPath('DOC/SISMSG/Test/field1/text()')]
+
+        sut = Sut(
+            from_ispb='12345abc',
+            to_ispb='67890xyz',
+            system_domain=SystemDomain.MES01,
+            operation_number='12345678123456789000123',
+            field1='Ação',
+        )
+        returned = sut.to_xml_bytes(encoding=encoding, bom=bom)
+
+        assert returned.startswith(expected_prefix)
+        assert returned.endswith(sut.to_xml().encode(encoding))
+
+    @pytest.mark.parametrize(
+        ('data', 'encoding'),
+        [
+            (XML_WITH_ACCENTS.encode('utf-16-be'), None),
+            (codecs.BOM_UTF16_BE + XML_WITH_ACCENTS.encode('utf-16-be'), None),
+            (codecs.BOM_UTF16_LE + XML_WITH_ACCENTS.encode('utf-16-le'), 'utf-16-be'),
+            (memoryview(XML_WITH_ACCENTS.encode('utf-16-be')), 'utf-16-be'),
+            (bytearray(XML_WITH_ACCENTS.encode()), 'utf-8'),
+            (XML_WITH_ACCENTS.encode('latin-1'), 'latin-1'),
+        ],
+    )
+    def test_from_xml_bytes(self, data: Buffer, encoding: str | None) -> None:
+        class Sut(BaseMessage):
+            field1: Annotated[str, XmlPath('DOC/SISMSG/Test/field1/text()')]
+
+        returned = Sut.from_xml_bytes(data, encoding=encoding)
+
+        assert returned == Sut(
+            from_ispb='12345abc',
+            to_ispb='67890xyz',
+            system_domain=SystemDomain.MES01,
+            operation_number='12345678123456789000123',
+            field1='Ação',
+        )
+
+    @pytest.mark.parametrize('source_type', ['bytes', 'text', 'path'])
+    def test_iter_xml(self, tmp_path: Path, source_type: str) -> None:
+        xml = b"""
+        <DOC>
+            <BCMSG>
+                <IdentdEmissor>12345ABC</IdentdEmissor>
+                <IdentdDestinatario>67890XYZ</IdentdDestinatario>
+                <DomSist>MES01</DomSist>
+                <NUOp>12345678123456789000123</NUOp>
+            </BCMSG>
+            <SISMSG>
+                <Test>
+                    <field1>value1</field1>
+                    <others><f1>v1</f1></others>
+                    <others><f1>v2</f1></others>
+                    <field2>value2</field2>
+                </Test>
+            </SISMSG>
+        </DOC>
+        """
+
+        class SubSut(BaseSubMessage):
+            f1: Annotated[str, XmlPath('others/f1/text()')]
+
+        class Sut(BaseMessage):
+            field1: Annotated[str, XmlPath('DOC/SISMSG/Test/field1/text()')]
+            others: Annotated[list[SubSut], XmlPath('DOC/SISMSG/Test')]
+            field2: Annotated[str, XmlPath('DOC/SISMSG/Test/field2/text()')]
+
+        path = tmp_path / 'message.xml'
+        path.write_bytes(xml)
+        sources: dict[str, str | Path | BytesIO] = {'bytes': BytesIO(xml), 'text': xml.decode(), 'path': path}
+
+        items, header = drain(Sut.iter_xml(sources[source_type]))
+
+        assert items == [SubSut(f1='v1'), SubSut(f1='v2')]
+        assert header == Sut(
+            from_ispb='12345abc',
+            to_ispb='67890xyz',
+            system_domain=SystemDomain.MES01,
+            operation_number='12345678123456789000123',
+            field1='value1',
+            others=[],
+            field2='value2',
+        )
+
+    def test_from_xml_trusted(self) -> None:
+        class SubSut(BaseSubMessage):
+            f1: Annotated[str, XmlPath('sub/f1/text()')]
+            f2: Annotated[date, XmlPath('sub/f2/text()')]
+
+        class Sut(BaseMessage):
+            amount: Annotated[Decimal, XmlPath('DOC/SISMSG/Test/amount/text()')]
+            moment: Annotated[datetime | None, XmlPath('DOC/SISMSG/Test/moment/text()')] = None
+            hour: Annotated[time | None, XmlPath('DOC/SISMSG/Test/hour/text()')] = None
+            count: Annotated[int, XmlPath('DOC/SISMSG/Test/count/text()')]
+            kind: Annotated[Literal['T1'], XmlPath('DOC/SISMSG/Test/kind/text()')]
+            sub: Annotated[SubSut, XmlPath('DOC/SISMSG/Test/single')]
+            others: Annotated[list[SubSut], XmlPath('DOC/SISMSG/Test/many')]
+
+        xml = """
+        <DOC>
+            <BCMSG>
+                <IdentdEmissor>12345ABC</IdentdEmissor>
+                <IdentdDestinatario>67890XYZ</IdentdDestinatario>
+                <DomSist>MES01</DomSist>
+                <NUOp>12345678123456789000123</NUOp>
+                <Grupo_Seq>
+                    <NumSeq>2</NumSeq>
+                    <IndrCont>S</IndrCont>
+                </Grupo_Seq>
+            </BCMSG>
+            <SISMSG>
+                <Test>
+                    <amount>10.50</amount>
+                    <moment>2025-01-02T03:04:05</moment>
+                    <hour>10:30:00</hour>
+                    <count>3</count>
+                    <kind>T1</kind>
+                    <single><sub><f1>v1</f1><f2>2025-01-02</f2></sub></single>
+                    <many>
+                        <sub><f1>v2</f1><f2>2025-01-03</f2></sub>
+                        <sub><f1>v3</f1><f2>2025-01-04</f2></sub>
+                    </many>
+                </Test>
+            </SISMSG>
+        </DOC>
+        """
+
+        returned = Sut.from_xml(xml, trusted=True)
+
+        assert returned == Sut.from_xml(xml)
+        assert returned.continuation_indicator is ContinuationIndicator.YES
+        assert returned.amount == Decimal('10.50')
+        assert returned.others[1] == SubSut(f1='v3', f2=date(2025, 1, 4))
+
+    def test_from_xml_trusted_should_skip_validation(self) -> None:
+        class Sut(BaseMessage):
+            field1: Annotated[Ispb, XmlPath('DOC/SISMSG/Test/field1/text()')]
+
+        xml = """
+        <DOC>
+            <BCMSG>
+                <IdentdEmissor>12345ABC</IdentdEmissor>
+                <IdentdDestinatario>67890XYZ</IdentdDestinatario>
+                <DomSist>MES01</DomSist>
+                <NUOp>12345678123456789000123</NUOp>
+            </BCMSG>
+            <SISMSG>
+                <Test>
+                    <field1>invalid ispb</field1>
+                </Test>
+            </SISMSG>
+        </DOC>
+        """
+
+        with pytest.raises(ValidationError):
+            Sut.from_xml(xml)
+
+        returned = Sut.from_xml(xml, trusted=True)
+
+        assert returned.field1 == 'invalid ispb'
+        assert returned.system_domain is SystemDomain.MES01
+
+    def test_model_validate_trusted(self) -> None:
+        class SubSut(BaseSubMessage):
+            f1: Annotated[str, XmlPath('sub/f1/text()')]
+            f2: Annotated[Decimal, XmlPath('sub/f2/text()')]
+
+        class Sut(BaseMessage):
+            day: Annotated[date, XmlPath('DOC/SISMSG/Test/day/text()')]
+            sub: Annotated[SubSut | None, XmlPath('DOC/SISMSG/Test/single')] = None
+            others: Annotated[list[SubSut], XmlPath('DOC/SISMSG/Test/many')]
+
+        data = {
+            'from_ispb': '12345ABC',
+            'to_ispb': '67890XYZ',
+            'system_domain': 'mes01',
+            'operation_number': '12345678123456789000123',
+            'sequence_number': '2',
+            'day': '2025-01-02',
+            'sub': {'f1': 'v1', 'f2': 10.5},
+            'others': [SubSut(f1='v2', f2=Decimal('1.00')), {'f1': 'v3', 'f2': '2.00'}],
+        }
+
+        returned = Sut.model_validate(data, trusted=True)
+
+        assert returned == Sut.model_validate(data)
+        assert returned.to_xml() == Sut.model_validate(data).to_xml()
+        assert Sut.model_validate(returned, trusted=True) is returned
+
+    def test_iter_xml_should_raise_error_for_diff_base(self) -> None:
+        class Sut(BaseMessage):
+            field1: Annotated[str, XmlPath('DOC/SISMSG/Test/field1/text()')]
+
+        with pytest.raises(InvalidBaseTagNameError) as exc_info:
+            next(Sut.iter_xml(BytesIO(b'<OTHER><field1>value1</field1></OTHER>')))
+
+        assert exc_info.value.expected == 'DOC'
@@ -0,0 +1,221 @@
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+from pydantic import TypeAdapter
+
+from sfn_messages.core.errors import (
+    InvalidControlNumberPrefixError,
+    InvalidIspbError,
+    InvalidSystemError,
+    SequenceExhaustedError,
+)
+from sfn_messages.core.numbering import (
+    ControlNumberState,
+    CounterFile,
+    InstitutionControlNumberAllocator,
+    LeasedSequence,
+    OperationNumberGenerator,
+)
+from sfn_messages.core.types import InstitutionControlNumber, OperationNumber
+
+NOW = datetime(2025, 9, 8, 23, 59, 59, tzinfo=UTC).timestamp()
+THREAD_TAKES = 16
+PROCESS_TAKES = 4
+TAKE_SIZE = 250
+
+_forked_generator: OperationNumberGenerator | None = None
+_forked_allocator: InstitutionControlNumberAllocator | None = None
+
+
+class Clock:
+    def __init__(self, now: float = NOW) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_generator(path: Path, clock: Clock | None = None, *, block_size: int = 4) -> OperationNumberGenerator:
+    return OperationNumberGenerator('3168015a', path, block_size=block_size, tz=UTC, clock=clock or Clock())
+
+
+def take_forked_operation_numbers(count: int) -> list[str]:
+    assert _forked_generator is not None
+    return _forked_generator.take(count)
+
+
+def take_forked_control_numbers(count: int) -> list[str]:
+    assert _forked_allocator is not None
+    return _forked_allocator.take('STR', count)
+
+
+def test_counter_file_reserve(tmp_path: Path) -> None:
+    counter = CounterFile(tmp_path / 'counter')
+
+    assert counter.reserve('250908', 10, limit=15) == ('250908', 1, 11)
+    assert counter.reserve('250908', 10, limit=15) == ('250908', 11, 16)
+    assert counter.reserve('250909', 10, limit=15) == ('250909', 1, 11)
+    assert counter.reserve('250908', 10, limit=15) == ('250909', 11, 16)
+    assert (tmp_path / 'counter').read_text() == '250909 16\n'
+    with pytest.raises(SequenceExhaustedError):
+        counter.reserve('250909', 10, limit=15)
+
+
+def test_next_should_format_operation_number(tmp_path: Path) -> None:
+    generator = make_generator(tmp_path / 'counter')
+
+    returned = [next(generator) for _ in range(6)]
+
+    assert returned == [f'3168015A250908{sequence:09d}' for sequence in range(1, 7)]
+    assert all(TypeAdapter(OperationNumber).validate_python(number) == number for number in returned)
+
+
+def test_take_should_span_blocks(tmp_path: Path) -> None:
+    generator = make_generator(tmp_path / 'counter')
+    next(generator)
+
+    returned = generator.take(10)
+
+    assert returned == [f'3168015A250908{sequence:09d}' for sequence in range(2, 12)]
+
+
+def test_restart_should_not_reuse_reserved_numbers(tmp_path: Path) -> None:
+    first = make_generator(tmp_path / 'counter')
+    first.take(2)
+
+    second = make_generator(tmp_path / 'counter')
+
+    assert next(second) == '3168015A250908000000005'
+
+
+def test_next_should_roll_over_at_midnight(tmp_path: Path) -> None:
+    clock = Clock()
+    generator = make_generator(tmp_path / 'counter', clock)
+    next(generator)
+
+    clock.now += 1
+    returned = next(generator)
+    clock.now -= 1
+
+    assert returned == '3168015A250909000000001'
+    assert next(generator) == '3168015A250909000000002'
+
+
+def test_leased_sequence_without_lease_should_not_instantiate(tmp_path: Path) -> None:
+    with pytest.raises(TypeError):
+        LeasedSequence(tmp_path / 'counter', block_size=1, clock=Clock())  # type: ignore[abstract]
+
+
+def test_invalid_ispb_should_raise_error(tmp_path: Path) -> None:
+    with pytest.raises(InvalidIspbError):
+        OperationNumberGenerator('1234', tmp_path / 'counter')
+
+
+def test_generators_should_not_overlap_across_threads(tmp_path: Path) -> None:
+    generators = [make_generator(tmp_path / 'counter', block_size=100) for _ in range(4)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda index: generators[index % 4].take(TAKE_SIZE), range(THREAD_TAKES)))
+
+    numbers = [number for result in results for number in result]
+    assert len(set(numbers)) == len(numbers) == THREAD_TAKES * TAKE_SIZE
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='fork is not available')
+def test_forked_generators_should_not_overlap(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    generator = make_generator(tmp_path / 'counter', block_size=100)
+    monkeypatch.setattr(sys.modules[__name__], '_forked_generator', generator)
+    parent = generator.take(TAKE_SIZE)
+
+    with ProcessPoolExecutor(max_workers=PROCESS_TAKES, mp_context=multiprocessing.get_context('fork')) as executor:
+        results = list(executor.map(take_forked_operation_numbers, [TAKE_SIZE] * PROCESS_TAKES))
+
+    numbers = parent + generator.take(TAKE_SIZE) + [number for result in results for number in result]
+    assert len(set(numbers)) == len(numbers) == (PROCESS_TAKES + 2) * TAKE_SIZE
+
+
+def test_allocate_should_prefix_per_system(tmp_path: Path) -> None:
+    allocator = InstitutionControlNumberAllocator(tmp_path / 'numbers', prefixes={'ldl': 'L31680151'}, lease_size=2)
+
+    returned = [allocator.allocate('STR'), allocator.allocate('str'), allocator.allocate('LDL')]
+    returned += allocator.take('STR', 2)
+
+    assert returned == [
+        'STR00000000000000001',
+        'STR00000000000000002',
+        'L3168015100000000001',
+        'STR00000000000000003',
+        'STR00000000000000004',
+    ]
+    assert all(TypeAdapter(InstitutionControlNumber).validate_python(number) == number for number in returned)
+    assert allocator.sequence(' str ') is allocator.sequence('STR')
+    assert (tmp_path / 'numbers' / 'STR.counter').read_text() == 'STR 5\n'
+
+
+def test_allocate_should_exhaust_sequence(tmp_path: Path) -> None:
+    allocator = InstitutionControlNumberAllocator(tmp_path, prefixes={'STR': 'S31680151'}, length=13)
+
+    assert allocator.take('STR', 9999)[-1] == 'S316801519999'
+    with pytest.raises(SequenceExhaustedError):
+        allocator.allocate('STR')
+    assert allocator.state() == [
+        ControlNumberState(system='STR', prefix='S31680151', next_sequence=10000, next_number=None, remaining=0)
+    ]
+
+
+def test_restarted_allocator_should_not_reuse_leased_numbers(tmp_path: Path) -> None:
+    InstitutionControlNumberAllocator(tmp_path, lease_size=10).allocate('SME')
+
+    assert InstitutionControlNumberAllocator(tmp_path, lease_size=10).allocate('SME') == 'SME00000000000000011'
+
+
+def test_state_should_report_leased_counters(tmp_path: Path) -> None:
+    allocator = InstitutionControlNumberAllocator(tmp_path, prefixes={'LPI': 'LPI316801512509'}, lease_size=10)
+    allocator.allocate('LTR')
+    allocator.take('LPI', 10)
+    (tmp_path / 'notes.counter').write_text('x 1\n')
+
+    assert InstitutionControlNumberAllocator(tmp_path / 'missing').state() == []
+    assert allocator.state() == [
+        ControlNumberState(
+            system='LPI',
+            prefix='LPI316801512509',
+            next_sequence=11,
+            next_number='LPI31680151250900011',
+            remaining=99989,
+        ),
+        ControlNumberState(
+            system='LTR', prefix='LTR', next_sequence=11, next_number='LTR00000000000000011', remaining=10**17 - 11
+        ),
+    ]
+
+
+@pytest.mark.parametrize('system', ['ST', 'STR0', 'S1R'])
+def test_invalid_system_should_raise_error(tmp_path: Path, system: str) -> None:
+    with pytest.raises(InvalidSystemError):
+        InstitutionControlNumberAllocator(tmp_path).allocate(system)
+
+
+@pytest.mark.parametrize('prefix', ['STR-', 'STR3168015120250909'])
+def test_invalid_prefix_should_raise_error(tmp_path: Path, prefix: str) -> None:
+    allocator = InstitutionControlNumberAllocator(tmp_path, prefixes={'STR': prefix})
+
+    with pytest.raises(InvalidControlNumberPrefixError):
+        allocator.allocate('STR')
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='fork is not available')
+def test_forked_allocators_should_not_overlap(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    allocator = InstitutionControlNumberAllocator(tmp_path, lease_size=100)
+    monkeypatch.setattr(sys.modules[__name__], '_forked_allocator', allocator)
+    parent = allocator.take('STR', TAKE_SIZE)
+
+    with ProcessPoolExecutor(max_workers=PROCESS_TAKES, mp_context=multiprocessing.get_context('fork')) as executor:
+        results = list(executor.map(take_forked_control_numbers, [TAKE_SIZE] * PROCESS_TAKES))
+
+    numbers = parent + allocator.take('STR', TAKE_SIZE) + [number for result in results for number in result]
+    assert len(set(numbers)) == len(numbers) == (PROCESS_TAKES + 2) * TAKE_SIZE
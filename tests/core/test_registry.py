@@ -0,0 +1,71 @@
+import pytest
+
+from sfn_messages.core import load_message_class, registered_codes
+from sfn_messages.core.errors import MessageNotImplementedError
+from sfn_messages.core.registry import MessageRegistry
+from sfn_messages.gen.gen0001 import GEN0001E
+from sfn_messages.str.str0008 import STR0008, STR0008R1, STR0008R2
+
+
+class CountingRegistry(MessageRegistry):
+    def __init__(self, *, negative_cache_size: int = 8) -> None:
+        super().__init__(negative_cache_size=negative_cache_size)
+        self.loads: list[str] = []
+
+    def load_family(self, family: str, /) -> None:
+        self.loads.append(family)
+        super().load_family(family)
+
+
+@pytest.mark.parametrize(
+    ('message_code', 'expected'),
+    [('STR0008', STR0008), ('STR0008R1', STR0008R1), ('STR0008R2', STR0008R2), ('GEN0001E', GEN0001E)],
+)
+def test_get(message_code: str, expected: type) -> None:
+    registry = MessageRegistry()
+
+    assert registry.get(message_code) is expected
+
+
+def test_get_should_load_each_family_once() -> None:
+    registry = CountingRegistry()
+
+    registry.get('STR0008')
+    registry.get('STR0008R1')
+    registry.get('GEN0001E')
+
+    assert registry.loads == ['str', 'gen']
+
+
+@pytest.mark.parametrize('message_code', ['STR9999', 'XYZ0001'])
+def test_get_should_cache_unknown_codes(message_code: str) -> None:
+    registry = CountingRegistry()
+
+    for _ in range(3):
+        with pytest.raises(MessageNotImplementedError) as exc_info:
+            registry.get(message_code)
+        assert exc_info.value.message_code == message_code
+
+    assert registry.loads == [message_code[:3].lower()]
+
+
+def test_get_should_raise_error_for_invalid_code() -> None:
+    with pytest.raises(ValueError, match=r'^$'):
+        MessageRegistry().get('invalid')
+
+
+def test_warm_up_should_load_all_families() -> None:
+    registry = CountingRegistry()
+
+    registry.warm_up()
+    registry.get('STR0008')
+
+    assert sorted(registry.loads) == ['gen', 'ldl', 'lpi', 'ltr', 'slb', 'sme', 'str']
+
+
+def test_registered_codes() -> None:
+    returned = registered_codes()
+
+    assert {'STR0008', 'STR0008R1', 'STR0008R2', 'STR0008E', 'GEN0001E', 'LDL0001'} <= set(returned)
+    assert returned == sorted(returned)
+    assert all(load_message_class(message_code).__name__ == message_code for message_code in returned)
@@ -0,0 +1,155 @@
+import codecs
+from xml.etree import ElementTree as ET
+
+import pytest
+from defusedxml import DTDForbidden
+
+from sfn_messages.core.errors import InvalidBaseTagNameError, MessageCodeNotFoundError
+from sfn_messages.core.sniffer import MessageHeader, _ExpatSniffer, sniff_fields, sniff_header
+from sfn_messages.core.types import ContinuationIndicator
+
+HEADER = """<?xml version="1.0"?>
+<DOC xmlns="http://www.bcb.gov.br/SPB/STR0014.xsd">
+  <BCMSG>
+    <IdentdEmissor>31680151</IdentdEmissor>
+    <IdentdDestinatario>00038166</IdentdDestinatario>
+    <DomSist>SPB01</DomSist>
+    <NUOp>31680151250908000000001</NUOp>
+    <Grupo_Seq>
+      <NumSeq>2</NumSeq>
+      <IndrCont>S</IndrCont>
+    </Grupo_Seq>
+  </BCMSG>
+  <SISMSG>
+    <STR0014R1>
+      <CodMsg>STR0014R1</CodMsg>"""
+
+XML = (
+    HEADER
+    + """
+      <NumCtrlIF>31680151202509090425</NumCtrlIF>
+    </STR0014R1>
+  </SISMSG>
+</DOC>
+"""
+)
+
+EXPECTED = MessageHeader(
+    message_code='STR0014R1',
+    namespace='http://www.bcb.gov.br/SPB/STR0014.xsd',
+    from_ispb='31680151',
+    to_ispb='00038166',
+    system_domain='SPB01',
+    operation_number='31680151250908000000001',
+    sequence_number=2,
+    continuation_indicator=ContinuationIndicator.YES,
+)
+
+
+@pytest.mark.parametrize(
+    'data',
+    [
+        XML,
+        XML.encode(),
+        XML.encode('utf-16-be'),
+        codecs.BOM_UTF16_BE + XML.encode('utf-16-be'),
+        memoryview(XML.encode('utf-16-le')),
+    ],
+)
+@pytest.mark.parametrize('chunk_size', [1, 7, 512])
+def test_sniff_header(data: str | bytes | memoryview, chunk_size: int) -> None:
+    assert sniff_header(data, chunk_size=chunk_size) == EXPECTED
+
+
+def test_sniff_header_should_use_declared_encoding() -> None:
+    assert sniff_header(XML.encode('utf-16-be'), encoding='utf-16-be') == EXPECTED
+
+
+def test_sniff_header_should_not_parse_message_body() -> None:
+    data = HEADER + '<broken></SISMSG>'
+
+    assert sniff_header(data) == EXPECTED
+
+
+def test_sniff_header_without_namespace_and_sequence() -> None:
+    data = '<DOC><BCMSG><NUOp>1</NUOp></BCMSG><SISMSG><GEN0001><CodMsg>GEN0001</CodMsg></GEN0001></SISMSG></DOC>'
+
+    assert sniff_header(data) == MessageHeader(message_code='GEN0001', namespace=None, operation_number='1')
+
+
+@pytest.mark.parametrize(
+    'data',
+    [
+        '<DOC><BCMSG /><SISMSG><GEN0001 /></SISMSG></DOC>',
+        '<DOC><CodMsg>GEN0001</CodMsg></DOC>',
+        HEADER.replace('<BCMSG>', '<BCMSG>' + ' ' * 200),
+    ],
+)
+def test_sniff_header_should_raise_error_without_message_code(data: str) -> None:
+    with pytest.raises(MessageCodeNotFoundError):
+        sniff_header(data, max_size=200)
+
+
+def test_sniff_header_should_raise_error_for_invalid_xml() -> None:
+    with pytest.raises(ET.ParseError):
+        sniff_header('<DOC><BCMSG></DOC>')
+
+
+@pytest.mark.parametrize('data', ['<!DOCTYPE DOC><DOC />', '<!DOCTYPE DOC [<!ENTITY e "x">]><DOC>&e;</DOC>'])
+def test_sniff_header_should_forbid_dtd(data: str) -> None:
+    with pytest.raises(DTDForbidden):
+        sniff_header(data)
+
+
+TEXT_PATHS = {
+    ('DOC', 'BCMSG', 'NUOp'): 'operation_number',
+    ('DOC', 'SISMSG', 'STR0014R1', 'NumCtrlIF'): 'institution_control_number',
+}
+
+
+@pytest.mark.parametrize('data', [XML, XML.encode(), codecs.BOM_UTF16_BE + XML.encode('utf-16-be')])
+def test_sniff_fields(data: str | bytes) -> None:
+    assert sniff_fields(data, 'DOC', TEXT_PATHS, {}) == {
+        'operation_number': '31680151250908000000001',
+        'institution_control_number': '31680151202509090425',
+    }
+
+
+def test_sniff_fields_should_stop_after_last_field() -> None:
+    data = HEADER + '<broken></SISMSG>'
+
+    assert sniff_fields(data, 'DOC', {('DOC', 'BCMSG', 'NUOp'): 'operation_number'}, {}) == {
+        'operation_number': '31680151250908000000001'
+    }
+
+
+def test_sniff_fields_should_read_attributes_and_first_occurrence() -> None:
+    data = '<DOC><Grupo Tp="A"><Vlr>1<Obs>x</Obs>2</Vlr></Grupo><Grupo Tp="B"><Vlr>3</Vlr></Grupo><Empty/></DOC>'
+
+    returned = sniff_fields(
+        data,
+        'DOC',
+        {('DOC', 'Grupo', 'Vlr'): 'amount', ('DOC', 'Empty'): 'empty'},
+        {('DOC', 'Grupo'): {'Tp': 'kind', 'Missing': 'missing'}},
+    )
+
+    assert returned == {'kind': 'A', 'amount': '1', 'empty': None}
+
+
+def test_sniff_fields_should_raise_error_for_invalid_root() -> None:
+    with pytest.raises(InvalidBaseTagNameError):
+        sniff_fields(XML, 'MSG', TEXT_PATHS, {})
+
+
+def test_sniff_fields_should_forbid_dtd() -> None:
+    with pytest.raises(DTDForbidden):
+        sniff_fields('<!DOCTYPE DOC><DOC />', 'DOC', TEXT_PATHS, {})
+
+
+def test_sniffer_without_handlers_should_not_instantiate() -> None:
+    class Sniffer(_ExpatSniffer):
+        def _start(self, tag: str, attrib: dict[str, str]) -> None:
+            pass
+
+    with pytest.raises(TypeError):
+        Sniffer()  # type: ignore[abstract]
@@ -11,6 +11,7 @@ from sfn_messages.core.types import (
     AssetType,
     Branch,
     Cnpj,
+    CnpjOrCpf,
     Cpf,
     CreditContractNumber,
     CreditDebitType,
@@ -72,6 +73,10 @@ class CpfModel(BaseModel):
     cpf: Cpf
 
 
+class CnpjOrCpfModel(BaseModel):
+    document: CnpjOrCpf
+
+
 class DescriptionModel(BaseModel):
     description: Description
 
@@ -1019,6 +1024,26 @@ def test_cpf_rejects_invalid_values(cpf: str) -> None:
     assert 'Value error, Invalid CPF format' in str(exc.value)
 
 
+@pytest.mark.parametrize('document', ['81415129000162', '12ABC34501DE35', '52423987013', '  52423987013  '])
+def test_cnpj_or_cpf_accepts_valid_values(document: str) -> None:
+    model = CnpjOrCpfModel(document=document)
+    assert model.document == document.strip()
+
+
+@pytest.mark.parametrize(
+    ('document', 'tag'),
+    [
+        ('81415129000161', 'cnpj'),
+        ('52423987014', 'cpf'),
+        ('8141512900016', 'cnpj'),
+    ],
+)
+def test_cnpj_or_cpf_validates_a_single_branch(document: str, tag: str) -> None:
+    with pytest.raises(ValidationError) as exc:
+        CnpjOrCpfModel(document=document)
+    assert [error['loc'] for error in exc.value.errors()] == [('document', tag)]
+
+
 @pytest.mark.parametrize(
     'transaction_id',
     [
@@ -4099,3 +4124,13 @@ def test_reconciliation_type_accepts_case_insensitive_values(
     input_value: str, expected_enum: ReconciliationType
 ) -> None:
     assert ReconciliationType(input_value) is expected_enum
+
+
+def test_enum_from_xml_value_rejects_unknown_mapped_value() -> None:
+    with pytest.raises(KeyError):
+        AccountType.from_xml_value('XX')
+
+
+@pytest.mark.parametrize('input_value', ['current', 'Current', 'CURRENT'])
+def test_enum_accepts_member_name_in_any_case(input_value: str) -> None:
+    assert AccountType(input_value) is AccountType.CURRENT
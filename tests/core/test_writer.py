@@ -0,0 +1,162 @@
+import codecs
+from io import BytesIO, StringIO
+from tempfile import SpooledTemporaryFile
+from xml.etree import ElementTree as ET
+
+import pytest
+
+from sfn_messages.core.writer import FLUSH_PARTS, XmlNode, XmlWriter, escape_attribute, escape_text
+
+NAMESPACE = 'urn:test'
+OTHER_NAMESPACE = 'urn:other'
+
+
+def make_tree() -> XmlNode:
+    root = XmlNode(f'{{{NAMESPACE}}}DOC')
+    header = XmlNode(f'{{{NAMESPACE}}}BCMSG')
+    header.attrib['CodErro'] = 'E"1'
+    sender = XmlNode(f'{{{NAMESPACE}}}IdentdEmissor')
+    sender.text = 'A & <B>'
+    header.append(sender)
+    header.append(XmlNode(f'{{{NAMESPACE}}}Empty'))
+    root.append(header)
+
+    body = XmlNode(f'{{{NAMESPACE}}}SISMSG')
+    group = XmlNode('Grupo')
+    value = XmlNode('Valor')
+    value.text = '10.00'
+    group.append(value)
+    body.append(group)
+    other = ET.Element(f'{{{OTHER_NAMESPACE}}}Other', {'a': 'line\nbreak'})
+    ET.SubElement(other, f'{{{OTHER_NAMESPACE}}}Child').text = 'child'
+    body.append(other)
+    root.append(body)
+    return root
+
+
+def element_tree_reference(*, indent: bool) -> str:
+    element = make_tree().to_element()
+    ET.register_namespace('', NAMESPACE)
+    if indent:
+        ET.indent(element)
+    return '<?xml version="1.0"?>\n' + ET.tostring(element, encoding='unicode')
+
+
+@pytest.mark.parametrize('indent', [True, False])
+def test_xml_writer_dumps_matches_element_tree(*, indent: bool) -> None:
+    writer = XmlWriter(default_namespace=NAMESPACE, indent=indent)
+
+    returned = writer.dumps(make_tree())
+
+    assert returned == element_tree_reference(indent=indent)
+
+
+def test_xml_writer_dumps_prefixes_foreign_namespaces() -> None:
+    writer = XmlWriter(default_namespace=NAMESPACE, indent=False)
+
+    returned = writer.dumps(make_tree())
+
+    assert returned.startswith(f'<?xml version="1.0"?>\n<DOC xmlns="{NAMESPACE}" xmlns:ns1="{OTHER_NAMESPACE}">')
+    assert '<ns1:Other a="line&#10;break"><ns1:Child>child</ns1:Child></ns1:Other>' in returned
+
+
+def test_xml_writer_dumps_fragment() -> None:
+    writer = XmlWriter(default_namespace=NAMESPACE)
+    body = make_tree().children[1]
+
+    returned = writer.dumps_fragment(body, level=1)
+
+    assert returned == (
+        '<SISMSG>\n'
+        '    <Grupo>\n'
+        '      <Valor>10.00</Valor>\n'
+        '    </Grupo>\n'
+        '    <ns1:Other a="line&#10;break">\n'
+        '      <ns1:Child>child</ns1:Child>\n'
+        '    </ns1:Other>\n'
+        '  </SISMSG>'
+    )
+    assert writer.namespaces == {NAMESPACE: '', OTHER_NAMESPACE: 'ns1'}
+
+
+def test_xml_writer_dump_to_text_sink() -> None:
+    sink = StringIO()
+
+    XmlWriter(default_namespace=NAMESPACE).dump(make_tree(), sink)
+
+    assert sink.getvalue() == element_tree_reference(indent=True)
+
+
+@pytest.mark.parametrize(
+    ('encoding', 'bom', 'expected_prefix'),
+    [
+        ('utf-8', False, b''),
+        ('utf-16-be', False, b''),
+        ('utf-16-be', True, codecs.BOM_UTF16_BE),
+    ],
+)
+def test_xml_writer_dump_to_binary_sink(encoding: str, *, bom: bool, expected_prefix: bytes) -> None:
+    sink = BytesIO()
+
+    XmlWriter(default_namespace=NAMESPACE).dump(make_tree(), sink, encoding=encoding, bom=bom)
+
+    assert sink.getvalue() == expected_prefix + element_tree_reference(indent=True).encode(encoding)
+
+
+def test_xml_writer_dump_to_spooled_file() -> None:
+    with SpooledTemporaryFile() as sink:
+        XmlWriter(default_namespace=NAMESPACE).dump(make_tree(), sink, encoding='utf-16-be')
+        sink.seek(0)
+
+        assert sink.read() == element_tree_reference(indent=True).encode('utf-16-be')
+
+
+def test_xml_writer_dump_should_write_incrementally() -> None:
+    root = make_tree()
+    body = root.find(f'{{{NAMESPACE}}}SISMSG')
+    assert isinstance(body, XmlNode)
+    for index in range(FLUSH_PARTS):
+        item = XmlNode(f'{{{OTHER_NAMESPACE}}}Item')
+        item.text = str(index)
+        body.append(item)
+    writes: list[int] = []
+
+    class Sink(StringIO):
+        def writelines(self, lines: object) -> None:
+            assert isinstance(lines, list)
+            writes.append(len(lines))
+            super().writelines(lines)
+
+    sink = Sink()
+    writer = XmlWriter(default_namespace=NAMESPACE)
+    writer.dump(root, sink)
+
+    assert sink.getvalue() == XmlWriter(default_namespace=NAMESPACE).dumps(root)
+    assert len(writes) > 1
+    assert max(writes) <= FLUSH_PARTS + 1
+    assert writer.namespaces == {NAMESPACE: '', OTHER_NAMESPACE: 'ns1'}
+
+
+def test_xml_node_find() -> None:
+    root = XmlNode('root')
+    first = XmlNode('child')
+    root.append(first)
+    root.append(XmlNode('child'))
+
+    assert root.find('child') is first
+    assert root.find('other') is None
+
+
+@pytest.mark.parametrize(
+    ('value', 'expected_text', 'expected_attribute'),
+    [
+        ('plain', 'plain', 'plain'),
+        ('a & b', 'a &amp; b', 'a &amp; b'),
+        ('<tag>', '&lt;tag&gt;', '&lt;tag&gt;'),
+        ('"quoted"', '"quoted"', '&quot;quoted&quot;'),
+        ('a\r\n\tb', 'a\r\n\tb', 'a&#13;&#10;&#09;b'),
+    ],
+)
+def test_escape(value: str, expected_text: str, expected_attribute: str) -> None:
+    assert escape_text(value) == expected_text
+    assert escape_attribute(value) == expected_attribute
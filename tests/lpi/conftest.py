@@ -0,0 +1,6 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def use_xml_backend(xml_backend: str) -> str:
+    return xml_backend
@@ -23,6 +23,10 @@ def make_valid_str0001_params() -> dict[str, Any]:
     }
 
 
+def make_numbered_str0001_params(index: int) -> dict[str, Any]:
+    return {**make_valid_str0001_params(), 'operation_number': f'31680151250908{index:09d}'}
+
+
 def make_valid_str0001r1_params() -> dict[str, Any]:
     return {
         'from_ispb': '31680151',
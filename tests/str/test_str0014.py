@@ -1,5 +1,6 @@
 from datetime import date, datetime
 from decimal import Decimal
+from io import BytesIO
 from typing import Any
 
 import pytest
@@ -7,7 +8,7 @@ from pydantic import ValidationError
 
 from sfn_messages.core.types import CreditDebitType, ReturnType
 from sfn_messages.str.str0014 import STR0014, STR0014E, STR0014R1, LaunchGroup
-from tests.conftest import extract_missing_fields, normalize_xml
+from tests.conftest import drain, extract_missing_fields, normalize_xml
 
 LAUNCH_GROUP_SIZE: int = 3
 
@@ -413,6 +414,57 @@ def test_str0014_from_xml() -> None:
     assert str0014.settlement_date == date(2026, 2, 2)
 
 
+def test_str0014r1_iter_xml() -> None:
+    xml = """<?xml version="1.0"?>
+    <DOC xmlns="http://www.bcb.gov.br/SPB/STR0014.xsd">
+        <BCMSG>
+            <IdentdEmissor>31680151</IdentdEmissor>
+            <IdentdDestinatario>00038166</IdentdDestinatario>
+            <DomSist>SPB01</DomSist>
+            <NUOp>31680151250908000000001</NUOp>
+        </BCMSG>
+        <SISMSG>
+            <STR0014R1>
+                <CodMsg>STR0014R1</CodMsg>
+                <NumCtrlIF_LDL>123</NumCtrlIF_LDL>
+                <ISPBIF_LDL>31680151</ISPBIF_LDL>
+                <SldInial>98765.43</SldInial>
+                <Grupo_STR0014R1_Lanc>
+                    <CodMsgOr>STR0004</CodMsgOr>
+                    <DtHrSit>2026-02-02T09:02:44</DtHrSit>
+                    <TpDeb_Cred>C</TpDeb_Cred>
+                    <VlrLanc>123.5</VlrLanc>
+                </Grupo_STR0014R1_Lanc>
+                <Grupo_STR0014R1_Lanc>
+                    <CodMsgOr>STR0008</CodMsgOr>
+                    <DtHrSit>2026-02-02T11:02:39</DtHrSit>
+                    <TpDeb_Cred>D</TpDeb_Cred>
+                    <VlrLanc>9765.5</VlrLanc>
+                </Grupo_STR0014R1_Lanc>
+                <SldFinl>89679.02</SldFinl>
+                <DtHrBC>2026-02-02T16:58:00</DtHrBC>
+                <DtMovto>2026-02-02</DtMovto>
+            </STR0014R1>
+        </SISMSG>
+    </DOC>
+    """
+
+    launch_group, header = drain(STR0014R1.iter_xml(BytesIO(xml.encode())))
+
+    assert launch_group == STR0014R1.from_xml(xml).launch_group
+    assert launch_group[0] == LaunchGroup(
+        original_message_code='STR0004',
+        settlement_timestamp=datetime(2026, 2, 2, 9, 2, 44),
+        credit_debit_type=CreditDebitType.CREDIT,
+        amount=Decimal('123.5'),
+    )
+    assert isinstance(header, STR0014R1)
+    assert header.launch_group == []
+    assert header.initial_amount == Decimal('98765.43')
+    assert header.final_amount == Decimal('89679.02')
+    assert header.settlement_date == date(2026, 2, 2)
+
+
 def test_str0014r1_from_xml() -> None:
     xml = """<?xml version="1.0"?>
     <DOC xmlns="http://www.bcb.gov.br/SPB/STR0014.xsd">
@@ -4,9 +4,9 @@ from typing import ClassVar
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
 from pydantic import BaseModel, ValidationError
-from validate_docbr import CNPJ, CPF
 
 from sfn_messages.core.types import AccountType, PersonType
+from sfn_messages.str import validations
 from sfn_messages.str.validations import PartyValidations
 
 
@@ -47,27 +47,31 @@ class NoPartyMessage(PartyValidations, BaseModel):
     description: str | None = None
 
 
-def test_normalize_parties_none_returns_empty() -> None:
-    assert PartyValidations.normalize_parties(None) == []
+class PartialPartyMessage(PartyValidations, BaseModel):
+    document_parties: ClassVar[list[str]] = ['creditor']
+    account_parties: ClassVar[list[str]] = ['creditor']
+
+    creditor_document: str | None = None
 
 
-def test_normalize_parties_string_returns_singleton_list() -> None:
-    assert PartyValidations.normalize_parties('debtor') == ['debtor']
+def test_party_validation_plan_is_computed_once_per_class() -> None:
+    plan = DummyMessage.get_party_validation_plan()
 
+    assert DummyMessage.get_party_validation_plan() is plan
+    assert [rule.party for rule in plan.documents] == ['debtor', 'creditor']
+    assert [rule.party for rule in plan.accounts] == ['debtor', 'creditor']
+    assert NoPartyMessage.get_party_validation_plan().documents == ()
 
-def test_normalize_parties_iterable_returns_list_of_strings() -> None:
-    result = PartyValidations.normalize_parties(['debtor', 'creditor'])
-    assert result == ['debtor', 'creditor']
 
+def test_party_validation_plan_tolerates_missing_party_fields() -> None:
+    msg = PartialPartyMessage(creditor_document='52998224725')
 
-def test_normalize_parties_unsupported_type_raises_typeerror() -> None:
-    with pytest.raises(TypeError, match='Parties must be a string or iterable of strings'):
-        PartyValidations.normalize_parties(123)
+    assert msg.creditor_document == '52998224725'
 
 
 def test_valid_business_and_individual_documents(monkeypatch: MonkeyPatch) -> None:
-    monkeypatch.setattr(CNPJ, 'validate', lambda _self, _v: True, raising=False)
-    monkeypatch.setattr(CPF, 'validate', lambda _self, _v: True, raising=False)
+    monkeypatch.setattr(validations, 'is_valid_cnpj', lambda _v: True)
+    monkeypatch.setattr(validations, 'is_valid_cpf', lambda _v: True)
 
     msg = DummyMessage(
         debtor_type=PersonType.BUSINESS,
@@ -85,8 +89,8 @@ def test_valid_business_and_individual_documents(monkeypatch: MonkeyPatch) -> No
 
 
 def test_invalid_cnpj_for_business_raises(monkeypatch: MonkeyPatch) -> None:
-    monkeypatch.setattr(CNPJ, 'validate', lambda _self, _v: False, raising=False)
-    monkeypatch.setattr(CPF, 'validate', lambda _self, _v: True, raising=False)
+    monkeypatch.setattr(validations, 'is_valid_cnpj', lambda _v: False)
+    monkeypatch.setattr(validations, 'is_valid_cpf', lambda _v: True)
 
     with pytest.raises(ValidationError) as exc:
         DummyMessage(
@@ -100,8 +104,8 @@ def test_invalid_cnpj_for_business_raises(monkeypatch: MonkeyPatch) -> None:
 
 
 def test_invalid_cpf_for_individual_raises(monkeypatch: MonkeyPatch) -> None:
-    monkeypatch.setattr(CNPJ, 'validate', lambda _self, _v: True, raising=False)
-    monkeypatch.setattr(CPF, 'validate', lambda _self, _v: False, raising=False)
+    monkeypatch.setattr(validations, 'is_valid_cnpj', lambda _v: True)
+    monkeypatch.setattr(validations, 'is_valid_cpf', lambda _v: False)
 
     with pytest.raises(ValidationError) as exc:
         DummyMessage(
@@ -178,6 +182,17 @@ def test_description_not_required_when_purpose_not_others() -> None:
     assert msg.description is None
 
 
+def test_document_without_type_validates_by_length() -> None:
+    msg = DummyMessage(debtor_document='52998224725', creditor_document='11222333000181')
+    assert msg.debtor_document == '52998224725'
+
+    with pytest.raises(ValidationError) as exc:
+        DummyMessage(debtor_document='52998224726', creditor_document='11222333000182')
+    msg_error = str(exc.value)
+    assert 'Invalid CNPJ or CPF for debtor_document' in msg_error
+    assert 'Invalid CNPJ or CPF for creditor_document' in msg_error
+
+
 def test_no_parties_no_validations_run() -> None:
     msg = NoPartyMessage()
     assert msg.purpose is None
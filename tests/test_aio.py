@@ -0,0 +1,141 @@
+import asyncio
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from sfn_messages.aio import (
+    ESTIMATED_FIELD_SIZE,
+    AsyncConverter,
+    estimate_xml_size,
+    from_xml_async,
+    from_xml_bytes_async,
+    from_xml_many_async,
+    get_default_converter,
+    set_default_converter,
+    to_xml_async,
+    to_xml_many_async,
+)
+from sfn_messages.core import from_xml, to_xml, to_xml_bytes
+from sfn_messages.core.batch import BatchError
+from sfn_messages.core.errors import MessageNotImplementedError
+from tests.str.test_str0001 import make_numbered_str0001_params, make_valid_str0001_params
+
+MAX_CONSUMED_AFTER_FIRST = 3
+
+
+@pytest.mark.parametrize('inline_threshold', [0, 1024 * 1024])
+def test_converter(inline_threshold: int) -> None:
+    params = make_valid_str0001_params()
+    xml = to_xml('STR0001', params)
+
+    async def run() -> None:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            converter = AsyncConverter(executor=executor, inline_threshold=inline_threshold)
+            assert await converter.to_xml('STR0001', params) == xml
+            assert await converter.from_xml(xml) == from_xml(xml)
+            assert await converter.from_xml_bytes(to_xml_bytes('STR0001', params)) == from_xml(xml)
+
+    asyncio.run(run())
+
+
+def test_module_functions() -> None:
+    params = make_valid_str0001_params()
+    xml = to_xml('STR0001', params)
+
+    async def run() -> None:
+        assert await to_xml_async('STR0001', params, trusted=True) == xml
+        assert await from_xml_async(xml) == from_xml(xml)
+        assert await from_xml_bytes_async(xml.encode('utf-16-be'), encoding='utf-16-be') == from_xml(xml)
+        with pytest.raises(MessageNotImplementedError):
+            await to_xml_async('STR9999', params)
+
+    asyncio.run(run())
+
+
+def test_set_default_converter() -> None:
+    converter = AsyncConverter(inline_threshold=0)
+
+    previous = set_default_converter(converter)
+    try:
+        assert get_default_converter() is converter
+    finally:
+        set_default_converter(previous)
+
+    assert get_default_converter() is previous
+
+
+def test_converter_should_reject_invalid_max_concurrency() -> None:
+    with pytest.raises(ValueError, match=r'^$'):
+        AsyncConverter(max_concurrency=0)
+
+
+def test_many_async() -> None:
+    xmls = [to_xml('STR0001', make_numbered_str0001_params(index)) for index in range(5)]
+    xmls.insert(1, '<DOC />')
+
+    async def source() -> AsyncIterator[str]:
+        for xml in xmls:
+            yield xml
+
+    async def run() -> None:
+        returned = [result async for result in from_xml_many_async(source())]
+        assert [result.index for result in returned] == list(range(6))
+        assert returned[1].error == BatchError(
+            type='sfn_messages.core.errors.MessageCodeNotFoundError',
+            message='Message code not found in XML',
+        )
+        assert [result.value for result in returned if result.ok] == [
+            from_xml(xml) for xml in xmls if xml != '<DOC />'
+        ]
+
+        items = [('STR0001', make_numbered_str0001_params(index)) for index in range(3)]
+        returned_xml = [result async for result in to_xml_many_async(items)]
+        assert [result.value for result in returned_xml] == [to_xml(code, msg) for code, msg in items]
+
+    asyncio.run(run())
+
+
+def test_many_async_should_apply_backpressure() -> None:
+    xml = to_xml('STR0001', make_valid_str0001_params())
+    consumed: list[int] = []
+
+    async def source() -> AsyncIterator[str]:
+        for index in range(20):
+            consumed.append(index)
+            yield xml
+
+    async def run() -> None:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            converter = AsyncConverter(executor=executor, max_concurrency=2, inline_threshold=0)
+            results = converter.from_xml_many(source())
+            first = await anext(results)
+            consumed_after_first = len(consumed)
+            rest = [result async for result in results]
+
+        assert first.ok
+        assert len(rest) == len(consumed) - 1
+        assert consumed_after_first <= MAX_CONSUMED_AFTER_FIRST
+
+    asyncio.run(run())
+
+
+def test_converter_with_process_pool() -> None:
+    params = make_valid_str0001_params()
+    xml = to_xml('STR0001', params)
+
+    async def run() -> None:
+        async with AsyncConverter.with_process_pool(max_workers=1, message_codes=['STR0001']) as converter:
+            converter.inline_threshold = 0
+            assert await converter.to_xml('STR0001', params) == xml
+            assert await converter.from_xml(xml) == from_xml(xml)
+            with pytest.raises(MessageNotImplementedError):
+                await converter.to_xml('STR9999', params)
+
+    asyncio.run(run())
+
+
+def test_estimate_xml_size() -> None:
+    msg = {'a': 'abc', 'b': [{'c': 1}, {'c': None}], 'd': ('e',)}
+
+    assert estimate_xml_size(msg) == ESTIMATED_FIELD_SIZE * 4 + 4
@@ -0,0 +1,104 @@
+from collections.abc import Callable
+from importlib import import_module
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from benchmarks.cases import CASE_MESSAGES, load_params, make_case, make_cases, repeat_groups
+from benchmarks.runner import OPERATIONS, BenchmarkResult, compare, dump_results, load_results, measure, run
+from benchmarks.threads import run_threads
+
+MIN_ITERATIONS = 3
+THREADS = 2
+
+
+def make_result(case: str, ops_per_sec: float) -> BenchmarkResult:
+    return BenchmarkResult(
+        case=case,
+        family='STR',
+        size='small',
+        operation='parse',
+        iterations=10,
+        ops_per_sec=ops_per_sec,
+        mean_us=1.0,
+        p50_us=1.0,
+        p90_us=1.0,
+        p99_us=1.0,
+    )
+
+
+def test_make_cases_should_cover_every_family() -> None:
+    cases = make_cases()
+
+    assert {case.family for case in cases} == {'STR', 'LDL', 'LTR', 'LPI', 'SLB', 'SME', 'GEN'}
+    assert {case.size for case in cases} == {'small', 'large', 'repeating'}
+    assert len(cases) > len(CASE_MESSAGES)
+
+
+@pytest.mark.parametrize('message_code', [message_code for message_code, _ in CASE_MESSAGES])
+def test_payloads_should_match_test_factories(message_code: str) -> None:
+    base_code = message_code[:7].lower()
+    module = import_module(f'tests.{base_code[:3]}.test_{base_code}')
+    factory: Callable[[], dict[str, Any]] = getattr(module, f'make_valid_{message_code.lower()}_params')
+    case = make_case(message_code, 'small', load_params(message_code))
+
+    assert case.message_class.model_validate(case.params) == case.message_class.model_validate(factory())
+
+
+def test_repeat_groups() -> None:
+    params = {'name': 'a', 'group': [{'value': 1}, {'value': 2}], 'empty': []}
+
+    returned = repeat_groups(params, 5)
+
+    assert returned == {'name': 'a', 'group': [{'value': 1}, {'value': 2}] * 2 + [{'value': 1}], 'empty': []}
+
+
+def test_measure() -> None:
+    calls: list[None] = []
+
+    timings = measure(lambda: calls.append(None), min_time=0, min_iterations=MIN_ITERATIONS, warmup_iterations=2)
+
+    assert len(timings) == MIN_ITERATIONS
+    assert len(calls) == MIN_ITERATIONS + 2
+
+
+def test_run(tmp_path: Path) -> None:
+    case = make_case('GEN0001', 'small', load_params('GEN0001'))
+
+    results = run([case], list(OPERATIONS), min_time=0, min_iterations=MIN_ITERATIONS, warmup_iterations=0)
+
+    assert [result.operation for result in results] == list(OPERATIONS)
+    assert all(result.iterations == MIN_ITERATIONS and result.ops_per_sec > 0 for result in results)
+
+    path = tmp_path / 'results' / 'latest.json'
+    dump_results(results, path)
+    assert load_results(path) == results
+
+
+@pytest.mark.parametrize(
+    ('ops_per_sec', 'expected'),
+    [
+        (100.0, []),
+        (95.0, []),
+        (80.0, ['STR0001']),
+    ],
+)
+def test_compare(ops_per_sec: float, expected: list[str]) -> None:
+    results = [make_result('STR0001', ops_per_sec), make_result('STR0008', 100.0)]
+    baseline = [make_result('STR0001', 100.0)]
+
+    returned = compare(results, baseline, threshold=0.1)
+
+    assert [regression.case for regression in returned] == expected
+
+
+def test_run_threads() -> None:
+    case = make_case('GEN0001', 'small', load_params('GEN0001'))
+    message = case.message_class.model_validate(case.params)
+
+    returned = run_threads([message], THREADS, messages_per_thread=MIN_ITERATIONS)
+
+    assert returned.threads == THREADS
+    assert returned.messages == MIN_ITERATIONS * THREADS
+    assert returned.ops_per_sec > 0
@@ -0,0 +1,204 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from sfn_messages.cli import iter_xml_documents, main, resolve_input_paths
+from sfn_messages.core import from_xml, to_xml
+from sfn_messages.core.numbering import InstitutionControlNumberAllocator
+from tests.str.test_str0001 import make_numbered_str0001_params
+
+USAGE_ERROR_CODE = 2
+
+
+def run_cli(monkeypatch: pytest.MonkeyPatch, *args: str) -> None:
+    monkeypatch.setattr('sys.argv', ['sfnmessages', *args])
+    main()
+
+
+@pytest.mark.parametrize(
+    ('lines', 'expected'),
+    [
+        (['<?xml version="1.0"?>\n<DOC>\n', '<A>1</A>\n', '</DOC>\n<DOC><A>2</A></DOC>'], 2),
+        (['<DOC><A>1</A></DOC><DOC><A>2</A></DOC><DOC/>'], 3),
+        (['<DOC xmlns="http://www.bcb.gov.br/SPB/STR0001.xsd"><A>1</A></', 'DOC >'], 1),
+        (['\n', '  \n'], 0),
+    ],
+)
+def test_iter_xml_documents(lines: list[str], expected: int) -> None:
+    returned = list(iter_xml_documents(lines))
+
+    assert len(returned) == expected
+    assert all(document.startswith('<') and document.endswith('>') for document in returned)
+
+
+def test_iter_xml_documents_should_yield_trailing_content() -> None:
+    assert list(iter_xml_documents(['<DOC></DOC>', '<DOC>'])) == ['<DOC></DOC>', '<DOC>']
+
+
+def test_iter_xml_documents_should_split_long_lines_and_tags() -> None:
+    document = '<?xml version="1.0"?>\n<DOC><A>1</A></DOC>'
+    text = document * 1000
+
+    assert list(iter_xml_documents([text])) == [document] * 1000
+    assert list(iter_xml_documents(list(text))) == [document] * 1000
+
+
+def test_resolve_input_paths(tmp_path: Path) -> None:
+    (tmp_path / 'b.xml').write_text('')
+    (tmp_path / 'a.xml').write_text('')
+    (tmp_path / 'c.json').write_text('')
+    (tmp_path / 'sub').mkdir()
+
+    assert resolve_input_paths(0) is None
+    assert resolve_input_paths(str(tmp_path / 'a.xml')) is None
+    assert resolve_input_paths(str(tmp_path)) == [tmp_path / 'a.xml', tmp_path / 'b.xml', tmp_path / 'c.json']
+    assert resolve_input_paths(str(tmp_path / '*.xml')) == [tmp_path / 'a.xml', tmp_path / 'b.xml']
+
+
+@pytest.mark.parametrize('jobs', ['1', '2'])
+def test_toxml_and_tojson_streams(
+    monkeypatch: pytest.MonkeyPatch,
+    capfd: pytest.CaptureFixture[str],
+    tmp_path: Path,
+    jobs: str,
+) -> None:
+    messages = [make_numbered_str0001_params(index) for index in range(3)]
+    ndjson = tmp_path / 'input.ndjson'
+    ndjson.write_text('\n'.join(json.dumps(message) for message in messages) + '\n\n')
+
+    run_cli(monkeypatch, 'toxml', '--ndjson', '-i', str(ndjson), '-j', jobs, '--chunk-size', '2')
+    xml_stream = capfd.readouterr().out
+    documents = list(iter_xml_documents([xml_stream]))
+
+    assert documents == [to_xml('STR0001', message) for message in messages]
+
+    xml_input = tmp_path / 'input.xml'
+    xml_input.write_text(xml_stream)
+
+    run_cli(monkeypatch, 'tojson', '--stream', '-i', str(xml_input), '-j', jobs, '--chunk-size', '2')
+    lines = capfd.readouterr().out.splitlines()
+
+    assert lines == [from_xml(document).model_dump_json() for document in documents]
+
+
+def test_toxml_to_output_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    ndjson = tmp_path / 'input.ndjson'
+    ndjson.write_text(json.dumps(make_numbered_str0001_params(1)))
+    output_dir = tmp_path / 'xml'
+
+    run_cli(monkeypatch, 'toxml', '--ndjson', '-i', str(ndjson), '--output-dir', str(output_dir))
+
+    assert [path.name for path in output_dir.iterdir()] == ['000000.xml']
+    assert (output_dir / '000000.xml').read_text() == to_xml('STR0001', make_numbered_str0001_params(1)) + '\n'
+
+
+def test_tojson_from_directory(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    input_dir = tmp_path / 'xml'
+    input_dir.mkdir()
+    for index in range(2):
+        (input_dir / f'message-{index}.xml').write_text(to_xml('STR0001', make_numbered_str0001_params(index)))
+    output_dir = tmp_path / 'json'
+
+    run_cli(monkeypatch, 'tojson', '-i', str(input_dir), '--output-dir', str(output_dir), '--indent', '2')
+
+    assert sorted(path.name for path in output_dir.iterdir()) == ['message-0.json', 'message-1.json']
+    returned = json.loads((output_dir / 'message-1.json').read_text())
+    assert returned['operation_number'] == make_numbered_str0001_params(1)['operation_number']
+
+
+def test_tojson_from_recursive_glob_should_keep_relative_paths(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    for index, folder in enumerate(['a', 'b']):
+        (tmp_path / 'xml' / folder).mkdir(parents=True)
+        (tmp_path / 'xml' / folder / 'x.xml').write_text(to_xml('STR0001', make_numbered_str0001_params(index)))
+    output_dir = tmp_path / 'json'
+
+    run_cli(monkeypatch, 'tojson', '-i', str(tmp_path / 'xml' / '**' / '*.xml'), '--output-dir', str(output_dir))
+
+    assert sorted(path.relative_to(output_dir).as_posix() for path in output_dir.rglob('*.json')) == [
+        'a/x.json',
+        'b/x.json',
+    ]
+    returned = json.loads((output_dir / 'b' / 'x.json').read_text())
+    assert returned['operation_number'] == make_numbered_str0001_params(1)['operation_number']
+
+
+def test_batch_should_reject_empty_input_glob(
+    monkeypatch: pytest.MonkeyPatch,
+    capfd: pytest.CaptureFixture[str],
+    tmp_path: Path,
+) -> None:
+    with pytest.raises(SystemExit) as exc_info:
+        run_cli(monkeypatch, 'tojson', '-i', str(tmp_path / '*.xml'))
+
+    assert exc_info.value.code == USAGE_ERROR_CODE
+    assert 'no input files found' in capfd.readouterr().err
+
+
+def test_tojson_stream_should_reject_indent_without_output_dir(
+    monkeypatch: pytest.MonkeyPatch,
+    capfd: pytest.CaptureFixture[str],
+    tmp_path: Path,
+) -> None:
+    stream = tmp_path / 'input.xml'
+    stream.write_text(to_xml('STR0001', make_numbered_str0001_params(1)))
+
+    with pytest.raises(SystemExit) as exc_info:
+        run_cli(monkeypatch, 'tojson', '--stream', '--indent', '2', '-i', str(stream))
+
+    assert exc_info.value.code == USAGE_ERROR_CODE
+    assert '--indent requires --output-dir' in capfd.readouterr().err
+
+
+def test_tojson_from_directory_should_list_input_once(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    input_dir = tmp_path / 'input'
+    input_dir.mkdir()
+    (input_dir / 'message.xml').write_text(to_xml('STR0001', make_numbered_str0001_params(1)))
+    calls: list[str] = []
+
+    def resolve(value: str | int, /) -> list[Path] | None:
+        calls.append(str(value))
+        return resolve_input_paths(value)
+
+    monkeypatch.setattr('sfn_messages.cli.resolve_input_paths', resolve)
+    run_cli(monkeypatch, 'tojson', '-i', str(input_dir), '-o', str(tmp_path / 'output.ndjson'))
+
+    assert calls == [str(input_dir)]
+
+
+def test_batch_should_report_failures(
+    monkeypatch: pytest.MonkeyPatch,
+    capfd: pytest.CaptureFixture[str],
+    tmp_path: Path,
+) -> None:
+    ndjson = tmp_path / 'input.ndjson'
+    ndjson.write_text('{"message_code": "STR9999"}\n' + json.dumps(make_numbered_str0001_params(1)) + '\n')
+
+    with pytest.raises(SystemExit) as exc_info:
+        run_cli(monkeypatch, 'toxml', '--ndjson', '-i', str(ndjson))
+
+    captured = capfd.readouterr()
+    assert exc_info.value.code == 1
+    assert (
+        captured.err
+        == '000000: sfn_messages.core.errors.MessageNotImplementedError: Message STR9999 not implemented\n'
+    )
+    assert captured.out == to_xml('STR0001', make_numbered_str0001_params(1)) + '\n'
+
+
+def test_controlnumbers_should_show_state(
+    monkeypatch: pytest.MonkeyPatch,
+    capfd: pytest.CaptureFixture[str],
+    tmp_path: Path,
+) -> None:
+    allocator = InstitutionControlNumberAllocator(tmp_path, prefixes={'STR': 'STR31680151'}, lease_size=10)
+    allocator.allocate('STR')
+    allocator.allocate('LDL')
+
+    run_cli(monkeypatch, 'controlnumbers', str(tmp_path), '-p', 'STR=STR31680151')
+
+    lines = capfd.readouterr().out.splitlines()
+    assert lines[1].split() == ['LDL', 'LDL', '11', '99999999999999989', 'LDL00000000000000011']
+    assert lines[2].split() == ['STR', 'STR31680151', '11', '999999989', 'STR31680151000000011']